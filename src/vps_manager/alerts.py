@@ -6,6 +6,7 @@ Provides alert management and notification delivery
 import json
 import smtplib
 import subprocess
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, List, Tuple, Optional
@@ -281,6 +282,8 @@ class AlertManager:
     def __init__(self, manager):
         self.manager = manager
         self.alerts: List[Alert] = []
+        # Checks may run on a worker thread while the UI acknowledges or clears alerts
+        self._lock = threading.RLock()
         self.notification_channels: List[NotificationChannel] = []
         self.alerts_file = MANAGER_DIR / "alerts.json"
         self.config_file = MANAGER_DIR / "alert_config.json"
@@ -301,11 +304,12 @@ class AlertManager:
     
     def save_alerts(self):
         """Save alerts to file"""
-        try:
-            with open(self.alerts_file, 'w') as f:
-                json.dump([a.to_dict() for a in self.alerts], f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save alerts: {e}")
+        with self._lock:
+            try:
+                with open(self.alerts_file, 'w') as f:
+                    json.dump([a.to_dict() for a in self.alerts], f, indent=2)
+            except Exception as e:
+                logger.error(f"Failed to save alerts: {e}")
     
     def load_notification_config(self):
         """Load notification configuration"""
@@ -360,8 +364,9 @@ class AlertManager:
                     message: str, details: Dict = None) -> Alert:
         """Create and send a new alert"""
         alert = Alert(alert_type, level, title, message, details)
-        self.alerts.append(alert)
-        self.save_alerts()
+        with self._lock:
+            self.alerts.append(alert)
+            self.save_alerts()
         
         # Send notifications
         for channel in self.notification_channels:
@@ -377,8 +382,9 @@ class AlertManager:
     
     def acknowledge_alert(self, alert: Alert):
         """Mark alert as acknowledged"""
-        alert.acknowledged = True
-        self.save_alerts()
+        with self._lock:
+            alert.acknowledged = True
+            self.save_alerts()
     
     def get_unacknowledged_alerts(self) -> List[Alert]:
         """Get all unacknowledged alerts"""
@@ -392,8 +398,9 @@ class AlertManager:
         """Remove alerts older than specified days"""
         from datetime import timedelta
         cutoff = datetime.now() - timedelta(days=days)
-        self.alerts = [a for a in self.alerts if a.created_at > cutoff]
-        self.save_alerts()
+        with self._lock:
+            self.alerts = [a for a in self.alerts if a.created_at > cutoff]
+            self.save_alerts()
         logger.info(f"Cleared alerts older than {days} days")
     
     def check_ssl_expiration(self):
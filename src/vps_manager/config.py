@@ -4,6 +4,7 @@ Handles all configuration storage and first-run setup
 """
 
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
@@ -123,12 +124,19 @@ class AppConfig:
         if self.version_control is None:
             self.version_control = VersionControlConfig()
 
+@dataclass
+class BatchResult:
+    """Outcome of a ConfigManager.batch() block, filled in as the outermost block exits"""
+    saved: Optional[bool] = None  # None if nothing was saved
+
 class ConfigManager:
     """Manages application configuration"""
     
     def __init__(self):
         self.config_file = CONFIG_FILE
         self.config: AppConfig = self.load()
+        self._batch_depth = 0
+        self._save_pending = False
     
     def load(self) -> AppConfig:
         """Load configuration from file"""
@@ -173,8 +181,29 @@ class ConfigManager:
             print(f"Error loading config: {e}")
             return AppConfig()
     
+    @contextmanager
+    def batch(self):
+        """Defer save() calls made inside the block to a single write at the end
+        
+        save() returns True inside the block without writing anything, so report
+        success from the yielded BatchResult once the block has exited.
+        """
+        result = BatchResult()
+        self._batch_depth += 1
+        try:
+            yield result
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._save_pending:
+                self._save_pending = False
+                result.saved = self.save()
+    
     def save(self) -> bool:
         """Save configuration to file"""
+        if self._batch_depth:
+            self._save_pending = True
+            return True
+        
         try:
             # Ensure directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
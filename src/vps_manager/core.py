@@ -7,7 +7,7 @@ import socket
 import datetime
 import urllib.request
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .utils import (
     MANAGER_DIR, NGINX_SITES_DIR, NGINX_ENABLED_DIR, 
@@ -30,6 +30,9 @@ CONFIG_VERSION = VERSION  # Use the same version for config
 UPDATE_URL = "https://github.com/k6w/vps-manager" # Package-based updates via pip/git
 VERSION_URL = "https://raw.githubusercontent.com/k6w/vps-manager/main/VERSION"
 
+def _no_progress(stage: str):
+    """Default progress callback for multi-stage operations"""
+
 class Domain:
     """Domain configuration class"""
     
@@ -499,23 +502,27 @@ class VPSManager:
             logger.error(f"Failed to edit domain {old_name}: {e}")
             return False, str(e)
     
-    def delete_domain(self, name: str) -> Tuple[bool, str]:
-        """Delete a domain"""
+    def delete_domain(self, name: str, progress: Callable[[str], None] = _no_progress) -> Tuple[bool, str]:
+        """Delete a domain, reporting each stage to progress if given"""
         try:
             domain = self.get_domain(name)
             if not domain:
                 return False, "Domain not found"
             
+            progress("Backing up configuration...")
             self.backup_domain_config(name)
             
+            progress("Disabling site...")
             success, message = self.disable_site(name)
             if not success:
                 logger.warning(f"Failed to disable site {name}: {message}")
             
+            progress("Removing NGINX configuration...")
             success, message = self.remove_nginx_config(name)
             if not success:
                 logger.warning(f"Failed to remove NGINX config for {name}: {message}")
             
+            progress("Reloading NGINX...")
             success, message = self.test_and_reload_nginx()
             if not success:
                 logger.error(f"NGINX configuration test failed after removing {name}: {message}")
@@ -3,15 +3,48 @@ Docker Integration Module
 Provides Docker container discovery and automatic NGINX configuration
 """
 
+import http.client
 import json
 import re
-from typing import Dict, List, Tuple, Optional
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Callable, Dict, List, Tuple, Optional
 from pathlib import Path
+from urllib.parse import quote
 
 from .utils import get_logger
 
 logger = get_logger(__name__)
 
+DOCKER_SOCKET = "/var/run/docker.sock"
+DOCKER_API_TIMEOUT = 30  # seconds; covers the daemon's default 10s stop grace period
+SCAN_WORKERS = 8  # concurrent per-container lookups in scan_and_suggest_configs
+
+# Raised while connecting: nothing reached the daemon, and the socket won't work this session
+_SOCKET_UNAVAILABLE = (FileNotFoundError, PermissionError, ConnectionRefusedError)
+# A kept-alive connection the daemon already closed; RemoteDisconnected is a ConnectionResetError
+_STALE_CONNECTION = (BrokenPipeError, ConnectionResetError)
+
+
+class DockerAPIError(Exception):
+    """A request that may already have reached the daemon failed, so it must not be repeated"""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP/1.1 connection to the Docker daemon over its UNIX socket"""
+    
+    def __init__(self, socket_path: str, timeout: Optional[float] = DOCKER_API_TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
 
 class DockerContainer:
     """Represents a Docker container"""
@@ -35,6 +68,11 @@ class DockerContainer:
             "labels": self.labels
         }
     
+    @cached_property
+    def list_row(self) -> str:
+        """Name, image, status and port padded into a container-table row; formatted on first use"""
+        return f"{self.name[:19]:<20}{self.image[:24]:<25}{self.status[:14]:<15}{self.get_external_port() or '-'}"
+    
     def get_internal_port(self) -> Optional[int]:
         """Get the internal port from port mappings"""
         for internal, external in self.ports.items():
@@ -64,6 +102,106 @@ class DockerManager:
     
     def __init__(self, manager):
         self.manager = manager
+        self._api = None  # Kept-alive connection to DOCKER_SOCKET, see _request
+        self._api_usable = True  # False once the socket is unavailable; use the CLI from then on
+        self._api_lock = threading.Lock()
+        self._events_thread = None
+    
+    def _request(self, method: str, path: str) -> Optional[Tuple[int, object]]:
+        """
+        Call the Engine API over the daemon socket, reusing one connection
+        
+        Only GETs are retried or handed back to the CLI once sent; any other method
+        raises DockerAPIError instead, since the daemon may already have acted on it.
+        
+        Returns:
+            (HTTP status, decoded JSON body or None), or None if the socket can't be
+            used and the caller should run the docker CLI instead
+        """
+        if not self._api_usable:
+            return None
+        
+        with self._api_lock:
+            if method != "GET" and self._api is not None:
+                # Never send an action down a connection the daemon may have dropped while idle
+                self._api.close()
+                self._api = None
+            
+            for attempt in range(2):
+                if self._api is None:
+                    self._api = _UnixHTTPConnection(DOCKER_SOCKET)
+                try:
+                    self._api.request(method, path)
+                    response = self._api.getresponse()
+                    body = response.read()
+                    break
+                except (OSError, http.client.HTTPException) as e:
+                    self._api.close()
+                    self._api = None
+                    if isinstance(e, _SOCKET_UNAVAILABLE):
+                        logger.info(f"Docker socket unavailable, using the CLI: {e}")
+                        self._api_usable = False
+                        return None
+                    if method != "GET":
+                        raise DockerAPIError(f"Docker API request failed: {e}") from e
+                    # The daemon drops idle keep-alive connections; retry once on a fresh one
+                    if not attempt and isinstance(e, _STALE_CONNECTION):
+                        continue
+                    logger.info(f"Docker API {method} {path} failed, using the CLI: {e}")
+                    return None
+        
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        return response.status, data
+    
+    def _container_action(self, container_name: str, action: str) -> Optional[Tuple[bool, str]]:
+        """POST start/stop/restart through the API; None to fall back to the CLI"""
+        try:
+            result = self._request("POST", f"/containers/{quote(container_name, safe='')}/{action}")
+        except DockerAPIError as e:
+            return False, str(e)
+        if result is None:
+            return None
+        
+        status, data = result
+        if status in (204, 304):  # 304: already in the requested state, which the CLI also accepts
+            return True, ""
+        return False, (data or {}).get("message", f"HTTP {status}")
+    
+    def watch_events(self, callback: Callable[[Dict], None]) -> bool:
+        """
+        Call callback with each container event from the daemon, on a background thread
+        
+        Returns:
+            False if the daemon socket is not usable
+        """
+        if self._events_thread is not None:
+            return True
+        if not self._api_usable or not Path(DOCKER_SOCKET).exists():
+            return False
+        
+        def follow():
+            # A separate connection: the stream never completes, so it can't share _api
+            conn = _UnixHTTPConnection(DOCKER_SOCKET, timeout=None)
+            try:
+                conn.request("GET", "/events?filters=" + quote(json.dumps({"type": ["container"]})))
+                response = conn.getresponse()
+                for line in response:
+                    try:
+                        callback(json.loads(line))
+                    except ValueError:
+                        continue
+            except (OSError, http.client.HTTPException) as e:
+                logger.info(f"Docker event stream closed: {e}")
+            finally:
+                conn.close()
+                self._events_thread = None
+        
+        self._events_thread = threading.Thread(target=follow, daemon=True)
+        self._events_thread.start()
+        return True
     
     def is_installed(self) -> Tuple[bool, str]:
         """Check if Docker is installed"""
@@ -78,6 +216,11 @@ class DockerManager:
     
     def get_version(self) -> Tuple[bool, str]:
         """Get Docker version"""
+        result = self._request("GET", "/version")
+        if result is not None and result[0] == 200 and result[1]:
+            info = result[1]
+            return True, f"Docker version {info.get('Version', '?')}, build {info.get('GitCommit', '?')}"
+        
         success, output = self.manager.run_command("docker --version")
         if success:
             return True, output.strip()
@@ -85,6 +228,14 @@ class DockerManager:
     
     def list_containers(self, all_containers: bool = False) -> Tuple[bool, List[DockerContainer]]:
         """List Docker containers"""
+        result = self._request("GET", f"/containers/json?all={int(all_containers)}")
+        if result is not None:
+            status, data = result
+            if status != 200 or not isinstance(data, list):
+                logger.error(f"Failed to list containers: HTTP {status}")
+                return False, []
+            return True, [self._container_from_api(item) for item in data]
+        
         flag = "-a" if all_containers else ""
         success, output = self.manager.run_command(
             f"docker ps {flag} --format '{{{{json .}}}}'"
@@ -137,6 +288,26 @@ class DockerManager:
         
         return True, containers
     
+    @staticmethod
+    def _container_from_api(item: Dict) -> DockerContainer:
+        """Build a container from an Engine API listing entry, matching what the CLI parse gives"""
+        # Same shape as "0.0.0.0:8080->80/tcp" from docker ps: internal -> host side
+        ports = {}
+        for port in item.get('Ports') or []:
+            if port.get('PublicPort'):
+                ports[f"{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"] = \
+                    f"{port.get('IP', '0.0.0.0')}:{port['PublicPort']}"
+        
+        names = item.get('Names') or ['']
+        return DockerContainer(
+            container_id=item.get('Id', '')[:12],
+            name=names[0].lstrip('/'),
+            image=item.get('Image', ''),
+            status=item.get('Status', ''),
+            ports=ports,
+            labels=item.get('Labels') or {}
+        )
+    
     def get_container_by_name(self, name: str) -> Optional[DockerContainer]:
         """Get container by name"""
         success, containers = self.list_containers(all_containers=True)
@@ -148,6 +319,14 @@ class DockerManager:
     
     def get_container_ip(self, container_name: str) -> Optional[str]:
         """Get container IP address"""
+        result = self._request("GET", f"/containers/{quote(container_name, safe='')}/json")
+        if result is not None:
+            status, data = result
+            if status != 200 or not data:
+                return None
+            networks = (data.get('NetworkSettings') or {}).get('Networks') or {}
+            return "".join(n.get('IPAddress') or '' for n in networks.values()) or None
+        
         success, output = self.manager.run_command(
             f"docker inspect -f '{{{{range.NetworkSettings.Networks}}}}{{{{.IPAddress}}}}{{{{end}}}}' {container_name}"
         )
@@ -174,6 +353,11 @@ class DockerManager:
     
     def inspect_container(self, container_name: str) -> Tuple[bool, Dict]:
         """Get detailed container information"""
+        result = self._request("GET", f"/containers/{quote(container_name, safe='')}/json")
+        if result is not None:
+            status, data = result
+            return (True, data) if status == 200 and isinstance(data, dict) else (False, {})
+        
         success, output = self.manager.run_command(f"docker inspect {container_name}")
         
         if success:
@@ -247,40 +431,43 @@ class DockerManager:
     
     def scan_and_suggest_configs(self) -> List[Dict]:
         """Scan containers and suggest NGINX configurations"""
-        suggestions = []
-        
         web_containers = self.get_containers_with_web_ports()
+        if not web_containers:
+            return []
         
-        for container in web_containers:
-            # Check if container has domain label
-            domain_label = container.labels.get('vps.domain') or container.labels.get('traefik.frontend.rule')
-            
-            if domain_label:
-                # Parse domain from Traefik rule if needed
-                if domain_label.startswith('Host:'):
-                    domain_label = domain_label.replace('Host:', '').strip()
-            
-            port = container.get_external_port() or container.get_internal_port()
-            container_ip = self.get_container_ip(container.name) or "127.0.0.1"
-            
-            suggestion = {
-                "container_name": container.name,
-                "container_id": container.container_id[:12],
-                "image": container.image,
-                "suggested_domain": domain_label or f"{container.name}.example.com",
-                "port": port,
-                "ip": container_ip,
-                "status": container.status,
-                "already_configured": domain_label and self.manager.domain_exists(domain_label)
-            }
-            
-            suggestions.append(suggestion)
+        # Each suggestion waits on its own IP lookup, so run them concurrently;
+        # map() keeps the suggestions in container order
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(web_containers))) as executor:
+            return list(executor.map(self._suggest_config, web_containers))
+    
+    def _suggest_config(self, container: DockerContainer) -> Dict:
+        """Build the configuration suggestion for one container"""
+        # Check if container has domain label
+        domain_label = container.labels.get('vps.domain') or container.labels.get('traefik.frontend.rule')
+        
+        if domain_label:
+            # Parse domain from Traefik rule if needed
+            if domain_label.startswith('Host:'):
+                domain_label = domain_label.replace('Host:', '').strip()
+        
+        port = container.get_external_port() or container.get_internal_port()
+        container_ip = self.get_container_ip(container.name) or "127.0.0.1"
         
-        return suggestions
+        return {
+            "container_name": container.name,
+            "container_id": container.container_id[:12],
+            "image": container.image,
+            "suggested_domain": domain_label or f"{container.name}.example.com",
+            "port": port,
+            "ip": container_ip,
+            "status": container.status,
+            "already_configured": domain_label and self.manager.domain_exists(domain_label)
+        }
     
     def start_container(self, container_name: str) -> Tuple[bool, str]:
         """Start a Docker container"""
-        success, output = self.manager.run_command(f"docker start {container_name}")
+        result = self._container_action(container_name, "start")
+        success, output = result if result is not None else self.manager.run_command(f"docker start {container_name}")
         
         if success:
             logger.info(f"Started container {container_name}")
@@ -290,7 +477,8 @@ class DockerManager:
     
     def stop_container(self, container_name: str) -> Tuple[bool, str]:
         """Stop a Docker container"""
-        success, output = self.manager.run_command(f"docker stop {container_name}")
+        result = self._container_action(container_name, "stop")
+        success, output = result if result is not None else self.manager.run_command(f"docker stop {container_name}")
         
         if success:
             logger.info(f"Stopped container {container_name}")
@@ -300,7 +488,8 @@ class DockerManager:
     
     def restart_container(self, container_name: str) -> Tuple[bool, str]:
         """Restart a Docker container"""
-        success, output = self.manager.run_command(f"docker restart {container_name}")
+        result = self._container_action(container_name, "restart")
+        success, output = result if result is not None else self.manager.run_command(f"docker restart {container_name}")
         
         if success:
             logger.info(f"Restarted container {container_name}")
@@ -6,18 +6,68 @@ Provides security scanning, vulnerability checking, and hardening recommendation
 import re
 import json
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from .utils import get_logger
 
+try:
+    from cryptography import x509
+except ImportError:
+    x509 = None
+
 logger = get_logger(__name__)
 
+# Read-only probes used by the scans; scan_all() runs them in a single shell
+# invocation and splits the output on PROBE_MARKER lines
+PROBE_MARKER = "==vps-probe=="
+PROBE_COMMANDS = {
+    "apt": "apt list --upgradable 2>/dev/null | grep -v 'Listing'",
+    "ss": "ss -tuln | grep LISTEN",
+    "dpkg_pwquality": "dpkg -l | grep libpam-pwquality",
+    "ufw": "ufw status",
+    "nginx_v": "nginx -v 2>&1",
+}
+
+# Ports that are never reported as unexpected: web server and common
+# system services (DNS, NTP, etc.)
+WEB_SERVER_PORTS = {22, 80, 443}
+SYSTEM_PORTS = {53, 123, 323}
+
+# Security headers expected in every NGINX site config
+REQUIRED_HEADERS = {
+    "X-Frame-Options": "Protect against clickjacking",
+    "X-Content-Type-Options": "Prevent MIME-sniffing",
+    "X-XSS-Protection": "Enable XSS protection",
+    "Strict-Transport-Security": "Enforce HTTPS",
+    "Content-Security-Policy": "Prevent XSS and data injection"
+}
+
+# One alternation finds every header in a single pass over the config. Header
+# names are ASCII, so configs are matched as bytes without decoding.
+_HEADER_PATTERN = re.compile(b"|".join(re.escape(h.encode()) for h in REQUIRED_HEADERS))
+
+# Least commonly configured first, so the all-present check fails early.
+# Each lookup stops at the first occurrence instead of reading the whole file.
+_HEADER_CHECK_ORDER = tuple(h.encode() for h in (
+    "Content-Security-Policy",
+    "Strict-Transport-Security",
+    "X-XSS-Protection",
+    "X-Content-Type-Options",
+    "X-Frame-Options"
+))
+
 
 class SecurityIssue:
     """Represents a security issue found during scanning"""
     
+    __slots__ = ('title', 'description', 'severity', 'recommendation',
+                 'category', 'found_at', 'weight')
+    
     SEVERITY_CRITICAL = "CRITICAL"
     SEVERITY_HIGH = "HIGH"
     SEVERITY_MEDIUM = "MEDIUM"
@@ -25,13 +75,15 @@ class SecurityIssue:
     SEVERITY_INFO = "INFO"
     
     def __init__(self, title: str, description: str, severity: str, 
-                 recommendation: str, category: str = "general"):
+                 recommendation: str, category: str = "general",
+                 found_at: Optional[str] = None):
         self.title = title
         self.description = description
         self.severity = severity
         self.recommendation = recommendation
         self.category = category
-        self.found_at = datetime.now().isoformat()
+        self.found_at = found_at or datetime.now().isoformat()
+        self.weight = SEVERITY_WEIGHTS.get(severity, 1)
     
     def to_dict(self) -> Dict:
         return {
@@ -44,30 +96,151 @@ class SecurityIssue:
         }
 
 
+# Security score penalty per issue
+SEVERITY_WEIGHTS = {
+    SecurityIssue.SEVERITY_CRITICAL: 20,
+    SecurityIssue.SEVERITY_HIGH: 10,
+    SecurityIssue.SEVERITY_MEDIUM: 5,
+    SecurityIssue.SEVERITY_LOW: 2,
+    SecurityIssue.SEVERITY_INFO: 1
+}
+
+# Most severe first, used when listing issues by severity
+SEVERITY_ORDER = (
+    SecurityIssue.SEVERITY_CRITICAL,
+    SecurityIssue.SEVERITY_HIGH,
+    SecurityIssue.SEVERITY_MEDIUM,
+    SecurityIssue.SEVERITY_LOW,
+    SecurityIssue.SEVERITY_INFO
+)
+
+REPORT_RULE = "=" * 60
+REPORT_SEPARATOR = "-" * 60
+
+
 class SecurityScanner:
     """Security scanner for VPS configuration"""
     
     def __init__(self, manager):
         self.manager = manager
         self.issues: List[SecurityIssue] = []
+        self._probes: Optional[Dict[str, Tuple[bool, str]]] = None
+        self._local = threading.local()
+        # cert path -> (mtime, expiration date)
+        self._cert_cache: Dict[str, Tuple[float, datetime]] = {}
+        self._expected_ports: Optional[set] = None
+        self._scan_time: Optional[str] = None
+        # (snapshot of issues, grouping) from the last _grouped_issues(); never handed out
+        self._grouped_cache: Optional[Tuple[tuple, Dict[str, List[SecurityIssue]]]] = None
     
     def scan_all(self) -> List[SecurityIssue]:
         """Run all security scans"""
         self.issues = []
+        # All issues from one scan share its start time
+        self._scan_time = datetime.now().isoformat()
+        self._probes = self._collect_probes()
+        self._expected_ports = self._build_expected_ports()
         
-        # Run individual scans
-        self.scan_ssl_certificates()
-        self.scan_nginx_security_headers()
-        self.scan_ssh_configuration()
-        self.scan_system_updates()
-        self.scan_open_ports()
-        self.scan_password_authentication()
-        self.scan_firewall_status()
-        self.scan_nginx_version()
+        scans = [
+            self.scan_ssl_certificates,
+            self.scan_nginx_security_headers,
+            self.scan_ssh_configuration,
+            self.scan_system_updates,
+            self.scan_open_ports,
+            self.scan_password_authentication,
+            self.scan_firewall_status,
+            self.scan_nginx_version,
+        ]
+        
+        # Scans are independent and I/O-bound, so run them concurrently.
+        # Results are merged in scan order to keep the report stable.
+        try:
+            with ThreadPoolExecutor(max_workers=len(scans)) as executor:
+                futures = [executor.submit(self._run_scan, scan) for scan in scans]
+                for future in futures:
+                    self.issues.extend(future.result())
+        finally:
+            self._probes = None
+            self._expected_ports = None
+            self._scan_time = None
         
         logger.info(f"Security scan completed. Found {len(self.issues)} issues.")
         return self.issues
     
+    def _run_scan(self, scan) -> List[SecurityIssue]:
+        """Run a single scan, collecting its issues in a thread-local list"""
+        self._local.issues = []
+        try:
+            scan()
+            return self._local.issues
+        finally:
+            del self._local.issues
+    
+    def _add_issue(self, title: str, description: str, severity: str,
+                   recommendation: str, category: str = "general"):
+        """Record an issue for the running scan"""
+        issue = SecurityIssue(title, description, severity, recommendation,
+                              category, found_at=self._scan_time)
+        getattr(self._local, 'issues', self.issues).append(issue)
+    
+    def _collect_probes(self) -> Dict[str, Tuple[bool, str]]:
+        """Run all read-only probes in one shell invocation"""
+        script = "; ".join(
+            f"echo '{PROBE_MARKER} {name}'; {{ {command}; }} 2>/dev/null; echo \"{PROBE_MARKER} rc $?\""
+            for name, command in PROBE_COMMANDS.items()
+        )
+        success, output = self.manager.run_command(script)
+        if not success:
+            logger.warning(f"Batched probe run failed, falling back to single commands: {output}")
+            return {}
+        
+        probes = {}
+        name, lines = None, []
+        for line in output.splitlines():
+            if line.startswith(PROBE_MARKER):
+                tag = line[len(PROBE_MARKER):].split()
+                if tag and tag[0] == "rc":
+                    if name is not None:
+                        probes[name] = (tag[1:] == ["0"], "\n".join(lines))
+                    name = None
+                elif tag:
+                    name, lines = tag[0], []
+            elif name is not None:
+                lines.append(line)
+        
+        return probes
+    
+    def _probe(self, name: str) -> Tuple[bool, str]:
+        """Get a probe result, from the batched run when available"""
+        if self._probes and name in self._probes:
+            return self._probes[name]
+        return self.manager.run_command(PROBE_COMMANDS[name])
+    
+    def _get_cert_expiry(self, cert_path: Path) -> Optional[datetime]:
+        """Get certificate expiration date, cached until the file changes"""
+        mtime = cert_path.stat().st_mtime
+        cached = self._cert_cache.get(str(cert_path))
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        if x509 is not None:
+            # Parse in-process, dates are naive UTC like the openssl output
+            cert = x509.load_pem_x509_certificate(cert_path.read_bytes())
+            exp_date = getattr(cert, "not_valid_after_utc", None)
+            exp_date = exp_date.replace(tzinfo=None) if exp_date else cert.not_valid_after
+        else:
+            success, output = self.manager.run_command(
+                f"openssl x509 -enddate -noout -in {cert_path}"
+            )
+            if not success or "notAfter=" not in output:
+                return None
+            
+            date_str = output.split("notAfter=")[1].strip()
+            exp_date = datetime.strptime(date_str, "%b %d %H:%M:%S %Y %Z")
+        
+        self._cert_cache[str(cert_path)] = (mtime, exp_date)
+        return exp_date
+    
     def scan_ssl_certificates(self):
         """Check SSL certificate expiration"""
         for domain in self.manager.domains:
@@ -75,81 +248,67 @@ class SecurityScanner:
                 cert_path = Path(f"/etc/letsencrypt/live/{domain.name}/cert.pem")
                 if cert_path.exists():
                     # Check certificate expiration
-                    success, output = self.manager.run_command(
-                        f"openssl x509 -enddate -noout -in {cert_path}"
-                    )
-                    
-                    if success and "notAfter=" in output:
-                        # Parse expiration date
-                        date_str = output.split("notAfter=")[1].strip()
-                        try:
-                            exp_date = datetime.strptime(date_str, "%b %d %H:%M:%S %Y %Z")
-                            days_until_exp = (exp_date - datetime.now()).days
-                            
-                            if days_until_exp < 0:
-                                self.issues.append(SecurityIssue(
-                                    title=f"Expired SSL Certificate: {domain.name}",
-                                    description=f"SSL certificate has expired {abs(days_until_exp)} days ago",
-                                    severity=SecurityIssue.SEVERITY_CRITICAL,
-                                    recommendation="Renew the SSL certificate immediately using certbot",
-                                    category="ssl"
-                                ))
-                            elif days_until_exp < 7:
-                                self.issues.append(SecurityIssue(
-                                    title=f"SSL Certificate Expiring Soon: {domain.name}",
-                                    description=f"SSL certificate expires in {days_until_exp} days",
-                                    severity=SecurityIssue.SEVERITY_HIGH,
-                                    recommendation="Renew the SSL certificate soon",
-                                    category="ssl"
-                                ))
-                            elif days_until_exp < 30:
-                                self.issues.append(SecurityIssue(
-                                    title=f"SSL Certificate Expiring: {domain.name}",
-                                    description=f"SSL certificate expires in {days_until_exp} days",
-                                    severity=SecurityIssue.SEVERITY_MEDIUM,
-                                    recommendation="Plan to renew the SSL certificate",
-                                    category="ssl"
-                                ))
-                        except Exception as e:
-                            logger.error(f"Failed to parse certificate date for {domain.name}: {e}")
+                    try:
+                        exp_date = self._get_cert_expiry(cert_path)
+                        if exp_date is None:
+                            continue
+                        days_until_exp = (exp_date - datetime.now()).days
+                        
+                        if days_until_exp < 0:
+                            self._add_issue(
+                                title=f"Expired SSL Certificate: {domain.name}",
+                                description=f"SSL certificate has expired {abs(days_until_exp)} days ago",
+                                severity=SecurityIssue.SEVERITY_CRITICAL,
+                                recommendation="Renew the SSL certificate immediately using certbot",
+                                category="ssl"
+                            )
+                        elif days_until_exp < 7:
+                            self._add_issue(
+                                title=f"SSL Certificate Expiring Soon: {domain.name}",
+                                description=f"SSL certificate expires in {days_until_exp} days",
+                                severity=SecurityIssue.SEVERITY_HIGH,
+                                recommendation="Renew the SSL certificate soon",
+                                category="ssl"
+                            )
+                        elif days_until_exp < 30:
+                            self._add_issue(
+                                title=f"SSL Certificate Expiring: {domain.name}",
+                                description=f"SSL certificate expires in {days_until_exp} days",
+                                severity=SecurityIssue.SEVERITY_MEDIUM,
+                                recommendation="Plan to renew the SSL certificate",
+                                category="ssl"
+                            )
+                    except Exception as e:
+                        logger.error(f"Failed to parse certificate date for {domain.name}: {e}")
                 else:
-                    self.issues.append(SecurityIssue(
+                    self._add_issue(
                         title=f"Missing SSL Certificate: {domain.name}",
                         description=f"Domain is configured for SSL but certificate not found",
                         severity=SecurityIssue.SEVERITY_HIGH,
                         recommendation="Generate SSL certificate using certbot",
                         category="ssl"
-                    ))
+                    )
     
     def scan_nginx_security_headers(self):
         """Check for security headers in NGINX configs"""
-        required_headers = {
-            "X-Frame-Options": "Protect against clickjacking",
-            "X-Content-Type-Options": "Prevent MIME-sniffing",
-            "X-XSS-Protection": "Enable XSS protection",
-            "Strict-Transport-Security": "Enforce HTTPS",
-            "Content-Security-Policy": "Prevent XSS and data injection"
-        }
-        
         for domain in self.manager.domains:
             config_file = Path(f"/etc/nginx/sites-available/{domain.name}")
             if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config_content = f.read()
+                config_bytes = config_file.read_bytes()
+                if all(h in config_bytes for h in _HEADER_CHECK_ORDER):
+                    continue
                 
-                missing_headers = []
-                for header, purpose in required_headers.items():
-                    if header not in config_content:
-                        missing_headers.append(f"{header} ({purpose})")
+                found_headers = {h.decode() for h in _HEADER_PATTERN.findall(config_bytes)}
+                missing_headers = [h for h in REQUIRED_HEADERS if h not in found_headers]
                 
                 if missing_headers:
-                    self.issues.append(SecurityIssue(
+                    self._add_issue(
                         title=f"Missing Security Headers: {domain.name}",
-                        description=f"Missing headers: {', '.join([h.split(' ')[0] for h in missing_headers])}",
+                        description=f"Missing headers: {', '.join(missing_headers)}",
                         severity=SecurityIssue.SEVERITY_MEDIUM,
                         recommendation=f"Add security headers to NGINX configuration",
                         category="nginx"
-                    ))
+                    )
     
     def scan_ssh_configuration(self):
         """Check SSH configuration for security issues"""
@@ -163,147 +322,137 @@ class SecurityScanner:
             
             # Check for root login
             if re.search(r'^\s*PermitRootLogin\s+yes', config, re.MULTILINE | re.IGNORECASE):
-                self.issues.append(SecurityIssue(
+                self._add_issue(
                     title="SSH Root Login Enabled",
                     description="SSH allows root login which is a security risk",
                     severity=SecurityIssue.SEVERITY_HIGH,
                     recommendation="Set 'PermitRootLogin no' in /etc/ssh/sshd_config",
                     category="ssh"
-                ))
+                )
             
             # Check for password authentication
             if re.search(r'^\s*PasswordAuthentication\s+yes', config, re.MULTILINE | re.IGNORECASE):
-                self.issues.append(SecurityIssue(
+                self._add_issue(
                     title="SSH Password Authentication Enabled",
                     description="Password authentication is less secure than key-based auth",
                     severity=SecurityIssue.SEVERITY_MEDIUM,
                     recommendation="Use SSH keys and set 'PasswordAuthentication no'",
                     category="ssh"
-                ))
+                )
             
             # Check for empty passwords
             if re.search(r'^\s*PermitEmptyPasswords\s+yes', config, re.MULTILINE | re.IGNORECASE):
-                self.issues.append(SecurityIssue(
+                self._add_issue(
                     title="SSH Empty Passwords Allowed",
                     description="Empty passwords are allowed for SSH login",
                     severity=SecurityIssue.SEVERITY_CRITICAL,
                     recommendation="Set 'PermitEmptyPasswords no' in /etc/ssh/sshd_config",
                     category="ssh"
-                ))
+                )
         
         except Exception as e:
             logger.error(f"Failed to scan SSH config: {e}")
     
     def scan_system_updates(self):
         """Check for available system updates"""
-        success, output = self.manager.run_command("apt list --upgradable 2>/dev/null | grep -v 'Listing'")
+        success, output = self._probe("apt")
         
         if success and output.strip():
-            lines = output.strip().split('\n')
-            update_count = len([l for l in lines if l.strip()])
+            lines = [l for l in output.splitlines() if l.strip()]
+            update_count = len(lines)
             
             if update_count > 0:
-                # Check for security updates
-                success_sec, output_sec = self.manager.run_command(
-                    "apt list --upgradable 2>/dev/null | grep -i security | wc -l"
-                )
-                
-                security_updates = 0
-                if success_sec and output_sec.strip().isdigit():
-                    security_updates = int(output_sec.strip())
+                # Security updates come from the -security pockets
+                security_updates = sum(1 for l in lines if 'security' in l.lower())
                 
                 if security_updates > 0:
-                    self.issues.append(SecurityIssue(
+                    self._add_issue(
                         title="Security Updates Available",
                         description=f"{security_updates} security updates available",
                         severity=SecurityIssue.SEVERITY_HIGH,
                         recommendation="Run: sudo apt update && sudo apt upgrade",
                         category="system"
-                    ))
+                    )
                 
                 if update_count > security_updates:
-                    self.issues.append(SecurityIssue(
+                    self._add_issue(
                         title="System Updates Available",
                         description=f"{update_count - security_updates} updates available",
                         severity=SecurityIssue.SEVERITY_LOW,
                         recommendation="Run: sudo apt update && sudo apt upgrade",
                         category="system"
-                    ))
+                    )
     
     def scan_open_ports(self):
         """Check for unexpected open ports"""
-        success, output = self.manager.run_command("ss -tuln | grep LISTEN")
+        success, output = self._probe("ss")
         
         if success:
-            lines = output.split('\n')
-            open_ports = []
-            
-            for line in lines:
-                match = re.search(r':(\d+)\s', line)
-                if match:
-                    port = int(match.group(1))
-                    open_ports.append(port)
-            
-            # Expected ports for web server
-            expected_ports = {22, 80, 443}
-            
-            # Add backend ports from domains
-            for domain in self.manager.domains:
-                expected_ports.add(domain.port)
+            open_ports = set()
             
-            unexpected = set(open_ports) - expected_ports
+            for line in output.splitlines():
+                # Local address is the fifth column, e.g. "0.0.0.0:80" or "[::]:443"
+                fields = line.split()
+                if len(fields) < 5:
+                    continue
+                port_str = fields[4].rpartition(':')[2]
+                if port_str.isdigit():
+                    open_ports.add(int(port_str))
             
-            # Filter out common system ports
-            common_system_ports = {53, 123, 323}  # DNS, NTP, etc.
-            unexpected = unexpected - common_system_ports
+            expected_ports = self._expected_ports or self._build_expected_ports()
+            unexpected = open_ports - expected_ports
             
             if unexpected:
-                self.issues.append(SecurityIssue(
+                self._add_issue(
                     title="Unexpected Open Ports",
                     description=f"Ports {', '.join(map(str, sorted(unexpected)))} are open",
                     severity=SecurityIssue.SEVERITY_MEDIUM,
                     recommendation="Review open ports and close unused ones with firewall",
                     category="network"
-                ))
+                )
+    
+    def _build_expected_ports(self) -> set:
+        """Get ports that are expected to be open, including domain backends"""
+        return WEB_SERVER_PORTS | SYSTEM_PORTS | {domain.port for domain in self.manager.domains}
     
     def scan_password_authentication(self):
         """Check for weak password policies"""
         # Check if libpam-pwquality is installed
-        success, output = self.manager.run_command("dpkg -l | grep libpam-pwquality")
+        success, output = self._probe("dpkg_pwquality")
         
         if not success or not output.strip():
-            self.issues.append(SecurityIssue(
+            self._add_issue(
                 title="Weak Password Policy",
                 description="Password quality checking is not enforced",
                 severity=SecurityIssue.SEVERITY_LOW,
                 recommendation="Install libpam-pwquality: sudo apt install libpam-pwquality",
                 category="system"
-            ))
+            )
     
     def scan_firewall_status(self):
         """Check if firewall is enabled"""
-        success, output = self.manager.run_command("ufw status")
+        success, output = self._probe("ufw")
         
         if not success:
-            self.issues.append(SecurityIssue(
+            self._add_issue(
                 title="Firewall Not Installed",
                 description="UFW firewall is not installed",
                 severity=SecurityIssue.SEVERITY_HIGH,
                 recommendation="Install UFW: sudo apt install ufw",
                 category="firewall"
-            ))
+            )
         elif "Status: inactive" in output:
-            self.issues.append(SecurityIssue(
+            self._add_issue(
                 title="Firewall Disabled",
                 description="UFW firewall is installed but not enabled",
                 severity=SecurityIssue.SEVERITY_HIGH,
                 recommendation="Enable firewall from the Firewall Management menu",
                 category="firewall"
-            ))
+            )
     
     def scan_nginx_version(self):
         """Check NGINX version for known vulnerabilities"""
-        success, output = self.manager.run_command("nginx -v 2>&1")
+        success, output = self._probe("nginx_v")
         
         if success:
             match = re.search(r'nginx/([\d.]+)', output)
@@ -315,75 +464,69 @@ class SecurityScanner:
                 try:
                     version_num = float(major_minor)
                     if version_num < 1.18:
-                        self.issues.append(SecurityIssue(
+                        self._add_issue(
                             title="Outdated NGINX Version",
                             description=f"NGINX version {version} may have known vulnerabilities",
                             severity=SecurityIssue.SEVERITY_MEDIUM,
                             recommendation="Update NGINX: sudo apt update && sudo apt upgrade nginx",
                             category="nginx"
-                        ))
+                        )
                 except ValueError:
                     pass
     
-    def get_issues_by_severity(self) -> Dict[str, List[SecurityIssue]]:
-        """Group issues by severity"""
-        grouped = {
-            SecurityIssue.SEVERITY_CRITICAL: [],
-            SecurityIssue.SEVERITY_HIGH: [],
-            SecurityIssue.SEVERITY_MEDIUM: [],
-            SecurityIssue.SEVERITY_LOW: [],
-            SecurityIssue.SEVERITY_INFO: []
-        }
+    def _grouped_issues(self) -> Dict[str, List[SecurityIssue]]:
+        """Shared severity grouping, rebuilt only when the issues change; read-only for callers"""
+        # Comparing issue identities also catches lists edited in place
+        snapshot = tuple(self.issues)
+        cached = self._grouped_cache
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
         
-        for issue in self.issues:
+        grouped = {severity: [] for severity in SEVERITY_ORDER}
+        for issue in snapshot:
             grouped[issue.severity].append(issue)
         
+        self._grouped_cache = (snapshot, grouped)
         return grouped
     
+    def get_issues_by_severity(self) -> Dict[str, List[SecurityIssue]]:
+        """Group issues by severity"""
+        return {severity: list(issues) for severity, issues in self._grouped_issues().items()}
+    
     def get_security_score(self) -> int:
         """Calculate security score (0-100)"""
         if not self.issues:
             return 100
         
-        # Weight by severity
-        weights = {
-            SecurityIssue.SEVERITY_CRITICAL: 20,
-            SecurityIssue.SEVERITY_HIGH: 10,
-            SecurityIssue.SEVERITY_MEDIUM: 5,
-            SecurityIssue.SEVERITY_LOW: 2,
-            SecurityIssue.SEVERITY_INFO: 1
-        }
-        
-        total_penalty = sum(weights.get(issue.severity, 1) for issue in self.issues)
-        score = max(0, 100 - total_penalty)
-        
-        return score
+        # Each issue carries its severity weight
+        total_penalty = sum(map(attrgetter('weight'), self.issues))
+        return max(0, 100 - total_penalty)
     
     def generate_report(self) -> str:
         """Generate a text security report"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("SECURITY SCAN REPORT")
-        lines.append("=" * 60)
-        lines.append(f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Security Score: {self.get_security_score()}/100")
-        lines.append(f"Total Issues: {len(self.issues)}")
-        lines.append("")
+        lines = [
+            REPORT_RULE,
+            "SECURITY SCAN REPORT",
+            REPORT_RULE,
+            f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Security Score: {self.get_security_score()}/100",
+            f"Total Issues: {len(self.issues)}",
+            ""
+        ]
         
-        grouped = self.get_issues_by_severity()
+        grouped = self._grouped_issues()
         
-        for severity in [SecurityIssue.SEVERITY_CRITICAL, SecurityIssue.SEVERITY_HIGH, 
-                        SecurityIssue.SEVERITY_MEDIUM, SecurityIssue.SEVERITY_LOW,
-                        SecurityIssue.SEVERITY_INFO]:
+        for severity in SEVERITY_ORDER:
             issues = grouped[severity]
-            if issues:
-                lines.append(f"\n{severity} ({len(issues)})")
-                lines.append("-" * 60)
-                for i, issue in enumerate(issues, 1):
-                    lines.append(f"{i}. {issue.title}")
-                    lines.append(f"   {issue.description}")
-                    lines.append(f"   -> {issue.recommendation}")
-                    lines.append("")
+            if not issues:
+                continue
+            lines.append(f"\n{severity} ({len(issues)})")
+            lines.append(REPORT_SEPARATOR)
+            # One preformatted block per issue, trailing newline leaves a blank line
+            lines.extend(
+                f"{i}. {issue.title}\n   {issue.description}\n   -> {issue.recommendation}\n"
+                for i, issue in enumerate(issues, 1)
+            )
         
         return "\n".join(lines)
 
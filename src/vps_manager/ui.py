@@ -1,15 +1,272 @@
+import collections
 import curses
+import itertools
+import os
+import queue
+import re
+import subprocess
+import textwrap
+import threading
 import time
 import datetime
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+from .alerts import Alert, AlertType, AlertLevel
 from .core import VPSManager, VERSION
-from .utils import MANAGER_DIR, NGINX_SITES_DIR, NGINX_ENABLED_DIR, LOG_FILE
+from .security import SecurityIssue, SecurityHardening
+from .utils import MANAGER_DIR, NGINX_SITES_DIR, NGINX_ENABLED_DIR, LOG_FILE, disk_memo, get_logger
+
+logger = get_logger(__name__)
+
+SEP60 = "=" * 60
+INPUT_DEBOUNCE = 0.05  # seconds
+FRAME_INTERVAL = 0.016  # seconds; minimum spacing between viewer repaints
+LOG_BUFFER_LINES = 1000
+LOG_STARTUP_WAIT = 2.0  # seconds to wait for a log's first lines
+COMMIT_PAGE_SIZE = 20  # commits loaded at a time by the history viewer
+FIREWALL_CACHE_TTL = 2.0  # seconds a ufw status/rules query is reused
+CONTAINERS_CACHE_TTL = 3.0  # seconds a docker ps listing is reused
+DOCKER_VERSION_TTL = 60.0
+SUGGESTIONS_CACHE_TTL = 30.0  # seconds a container scan is reused
+VCS_STATUS_TTL = 2.0
+
+YES_KEYS = frozenset((ord('y'), ord('Y')))
+NO_KEYS = frozenset((ord('n'), ord('N')))
+EXIT_KEYS = frozenset((27, 3, 24))  # ESC, Ctrl+C, Ctrl+X
+VERTICAL_KEYS = frozenset((curses.KEY_UP, curses.KEY_DOWN))
+HORIZONTAL_KEYS = frozenset((curses.KEY_LEFT, curses.KEY_RIGHT))
+
+_LIST_SEP = re.compile(r'\s*,\s*')  # Separator in comma-separated inputs
+
+# apt packages that provide each dependency command
+DEPENDENCY_PACKAGES = {
+    'nginx': ['nginx'],
+    'certbot': ['certbot', 'python3-certbot-nginx'],
+    'ufw': ['ufw'],
+    'docker': ['docker.io'],
+}
+
+# Feature setup screens: feature -> (title, info lines, configure method name)
+FEATURE_SETUP = {
+    "firewall": ("Firewall Management", (
+        "Firewall management is currently disabled.",
+        "",
+        "To use this feature, you need to:",
+        "  1. Enable UFW firewall on your system",
+        "  2. Configure default policies (deny incoming, allow outgoing)",
+        "  3. Set up basic rules for SSH, HTTP, and HTTPS",
+        "",
+        "Would you like to configure it now?"
+    ), "_configure_firewall_setup"),
+    "security": ("Security Scanner", (
+        "Security scanner is currently disabled.",
+        "",
+        "To use this feature, you need to:",
+        "  1. Enable security scanning",
+        "  2. Choose scan frequency (manual or automatic)",
+        "",
+        "Would you like to configure it now?"
+    ), "_configure_security_setup"),
+    "alerts": ("Alerts & Monitoring", (
+        "Alerts & Monitoring is currently disabled.",
+        "",
+        "To use this feature, you need to:",
+        "  1. Enable monitoring system",
+        "  2. Configure at least one notification channel:",
+        "     - Email (SMTP configuration)",
+        "     - Slack (webhook URL)",
+        "     - Discord (webhook URL)",
+        "     - Custom webhook",
+        "",
+        "Would you like to configure it now?"
+    ), "_configure_alerts"),
+    "docker": ("Docker Integration", (
+        "Docker integration is currently disabled.",
+        "",
+        "To use this feature, you need to:",
+        "  1. Install Docker on your system",
+        "  2. Enable Docker integration",
+        "  3. Optionally enable auto-discovery of containers",
+        "",
+        "Would you like to configure it now?"
+    ), "_configure_docker_setup"),
+    "version_control": ("Version Control", (
+        "Version Control system is currently disabled.",
+        "",
+        "This feature provides Git-like functionality for",
+        "managing your VPS configurations:",
+        "  - Commit configuration changes",
+        "  - View history and diffs",
+        "  - Restore previous states",
+        "  - Branch management",
+        "  - Tag important versions",
+        "",
+        "Would you like to enable it now?"
+    ), "_enable_version_control"),
+}
+
+ALERT_CHANNEL_SETUP_INFO = (
+    "Alerts & Monitoring is enabled but no notification",
+    "channels are configured.",
+    "",
+    "You need to configure at least one channel:",
+    "",
+    "EMAIL:",
+    "  - SMTP server (e.g., smtp.gmail.com)",
+    "  - SMTP port (usually 587 or 465)",
+    "  - Username and password",
+    "  - From and To email addresses",
+    "",
+    "SLACK:",
+    "  - Webhook URL from Slack app",
+    "  - Channel name (optional)",
+    "",
+    "DISCORD:",
+    "  - Webhook URL from Discord server settings",
+    "",
+    "CUSTOM WEBHOOK:",
+    "  - Any HTTP endpoint URL",
+    "  - Optional headers",
+    "",
+    "Would you like to configure a notification channel now?"
+)
+
+# Alert channel config attribute -> label on the settings screen
+ALERT_CHANNELS = (
+    ("email", "Email"),
+    ("slack", "Slack"),
+    ("discord", "Discord"),
+    ("webhook", "Webhook"),
+)
+
+# Settings screen rows after alerts: (label, config section, optional flag, flag label)
+FEATURE_SUMMARY = (
+    ("Firewall Management", "firewall", None, None),
+    ("Security Scanner", "security", "auto_scan_on_startup", "Auto-scan"),
+    ("Docker Integration", "docker", "auto_discover", "Auto-discover"),
+    ("Version Control", "version_control", "auto_commit", "Auto-commit"),
+)
+
+# Feature submenus; an entry's index selects its branch in the menu loop
+FIREWALL_MENU = (
+    "View Firewall Status",
+    "Enable Firewall",
+    "Disable Firewall",
+    "Allow Port",
+    "Deny Port",
+    "Limit Port (Rate Limit)",
+    "Delete Rule",
+    "Allow from IP",
+    "Deny from IP",
+    "Quick Setup (Web Server)",
+    "List All Rules",
+    "Back to Main Menu",
+)
+SECURITY_MENU = (
+    "Run Security Scan",
+    "View Last Scan Results",
+    "Apply Security Headers (Domain)",
+    "View Security Score",
+    "Export Security Report",
+    "Back to Main Menu",
+)
+ALERTS_MENU = (
+    "View Active Alerts",
+    "Run All Checks Now",
+    "Acknowledge Alert",
+    "Clear Old Alerts",
+    "Configure Notifications",
+    "Test Notification",
+    "Back to Main Menu",
+)
+
+DOCKER_MENU = (
+    "List Running Containers",
+    "Auto-Configure Container",
+    "Scan & Suggest Configs",
+    "Container Details",
+    "Container Logs",
+    "Start Container",
+    "Stop Container",
+    "Restart Container",
+    "Back to Main Menu",
+)
+
+VCS_MENU = (
+    "[*] Status & Overview",
+    "[+] Commit Changes",
+    "[=] View History (Log)",
+    "[?] Show Commit Details",
+    "[<] Checkout/Restore",
+    "[~] Manage Branches",
+    "[@] Tag Commit",
+    "[%] Compare (Diff)",
+    "[#] Repository Stats",
+    "Back to Main Menu",
+)
+# Severities listed on the scan summary and score screens, worst first
+SCORE_SEVERITIES = (
+    SecurityIssue.SEVERITY_CRITICAL,
+    SecurityIssue.SEVERITY_HIGH,
+    SecurityIssue.SEVERITY_MEDIUM,
+    SecurityIssue.SEVERITY_LOW,
+)
+SUBMENU_FOOTER = "Use Up/Down to navigate, Enter to select, ESC to go back"
+CONTAINER_HEADER = f"{'Name':<20}{'Image':<25}{'Status':<15}Ports"
+
+
+@lru_cache(maxsize=128)
+def _hr(width: int) -> str:
+    """Underline rule for a title of the given width"""
+    return "=" * width
+
+
+def _path_executables() -> set:
+    """Names of all executables on $PATH, from one pass over its directories"""
+    found = set()
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    if entry.name not in found and entry.is_file() and os.access(entry.path, os.X_OK):
+                        found.add(entry.name)
+        except OSError:
+            continue
+    return found
+
+
+def _iter_lines(text: str):
+    """Yield the lines of text one at a time without splitting the whole string"""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _dir_names(directory) -> set:
+    """Entry names in a directory, or an empty set if it can't be read"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 
 class TerminalUI:
     """Terminal-based user interface using curses"""
     
+    _DOMAIN_ROW_FMT = "{name:<25}{port:<8}{ssl:<8}{cfg:<12}{status}"
+    _DOMAIN_HEADER = _DOMAIN_ROW_FMT.format(
+        name="Domain Name", port="Port", ssl="SSL", cfg="Config", status="Status")
+    
     def __init__(self, manager: VPSManager):
         self.manager = manager
         self.current_selection = 0
@@ -29,65 +286,180 @@ class TerminalUI:
             "Settings",
             "Exit"
         ]
+        # Diffs between two commits never change, so they are kept on disk across sessions;
+        # working-state diffs (commit2 None) bypass the cache
+        self._cached_diff = disk_memo("diff")(self._diff_commits)
+        # (handler, feature that must be configured first) per menu item
+        self._menu_handlers = (
+            (self._list_domains, None),
+            (self._add_domain, None),
+            (self._edit_domain, None),
+            (self._delete_domain, None),
+            (self._nginx_status, None),
+            (self._version_control_menu, "version_control"),
+            (self._firewall_management, "firewall"),
+            (self._security_scanner, "security"),
+            (self._alerts_monitoring, "alerts"),
+            (self._docker_integration, "docker"),
+            (self._view_logs, None),
+            (self._settings_menu, None),
+            (None, None),  # Exit is handled by the main loop
+        )
+        self._menu_selected = [f"> {item}" for item in self.menu_items]
+        self._menu_normal = [f"  {item}" for item in self.menu_items]
+        self._header_title = f"VPS NGINX Domain Manager v{VERSION}".center(56)
+        self._dirty = True  # Full main-menu repaint needed
+        self._pad_cache = {}  # (title, info_lines) -> pre-rendered dialog pad
+        self._last_selection = 0
+        self._fw_status_cache = None  # (monotonic time, get_status() result)
+        self._fw_rules_cache = None  # (monotonic time, list_rules() result)
+        self._rules_view = None  # (listing signature, painted rules window)
+        self._scan_counts = None  # (issues list, per-severity counts)
+        self._bg_msgs = queue.Queue()  # (title, message, is_error) from worker threads
+        self._wrap_cache = {}  # (id(issue), COLS) -> wrapped description lines
+        self._config_dirty = False  # Legacy config edited but not yet saved
+        self._query_cache = {}  # key -> (monotonic time, value) for _cached
+        self._cache_generations = collections.Counter()  # key -> _invalidate_cached calls so far
+        self._notice = None  # Success note for the next menu repaint, see _notify
+        self._checks_future = None  # In-flight alerts.run_all_checks, see _alerts_run_checks
     
     def _wait_for_input(self, stdscr):
-        """Wait for user input with a small delay and buffer flush"""
-        time.sleep(0.5)
-        # Flush input buffer
+        """Wait for user input, ignoring keys typed ahead of the dialog"""
+        self._flush_input()
+        shown_at = time.monotonic()
+        # A key landing right after the dialog appears is usually the tail
+        # of a double Enter from the previous screen, not a dismissal
+        while True:
+            stdscr.getch()
+            if time.monotonic() - shown_at >= INPUT_DEBOUNCE:
+                break
+    
+    def _flush_input(self):
+        """Discard any keys typed ahead of the current screen"""
+        curses.flushinp()
+    
+    def _drain_repeats(self, stdscr, key: int) -> int:
+        """Count key plus any identical auto-repeats already queued behind it"""
+        count = 1
         stdscr.nodelay(True)
-        while stdscr.getch() != -1:
-            pass
-        stdscr.nodelay(False)
-        stdscr.getch()
+        try:
+            while True:
+                next_key = stdscr.getch()
+                if next_key != key:
+                    if next_key != -1:
+                        curses.ungetch(next_key)  # Handle it on the next pass
+                    return count
+                count += 1
+        finally:
+            stdscr.nodelay(False)
+    
+    def _drain_keys(self, stdscr, keys, drawn_at: float) -> list:
+        """Collect queued presses from keys, first waiting out the frame interval since drawn_at
+        
+        The first queued key outside keys is pushed back for the next pass.
+        """
+        wait = FRAME_INTERVAL - (time.monotonic() - drawn_at)
+        if wait > 0:
+            curses.napms(int(wait * 1000))
+        pending = []
+        stdscr.nodelay(True)
+        try:
+            while True:
+                key = stdscr.getch()
+                if key not in keys:
+                    if key != -1:
+                        curses.ungetch(key)
+                    return pending
+                pending.append(key)
+        finally:
+            stdscr.nodelay(False)
+    
+    def _paint_frame(self, stdscr, frame: dict, prev: dict):
+        """Write the rows of frame (y -> (x, text, attr, ...)) that differ from prev, blanking rows it dropped
+        
+        Extra (text, attr) pairs after the first continue the row where the previous text ended.
+        """
+        for y, row in frame.items():
+            if prev.get(y) != row:
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+                stdscr.addstr(y, row[0], row[1], row[2])
+                for i in range(3, len(row), 2):
+                    stdscr.addstr(row[i], row[i + 1])
+        for y in prev.keys() - frame.keys():
+            stdscr.move(y, 0)
+            stdscr.clrtoeol()
+    
+    @contextmanager
+    def _overlay(self, stdscr, win=None):
+        """Full-screen window drawn over stdscr instead of clearing it; pass win to show a kept one again"""
+        if win is None:
+            win = curses.newwin(curses.LINES, curses.COLS, 0, 0)
+            win.keypad(True)
+        else:
+            win.touchwin()  # Its cells must all be re-sent over whatever stdscr drew since
+        try:
+            yield win
+        finally:
+            # stdscr still holds the screen underneath; the next refresh restores
+            # it from that buffer as a diff, not a full repaint
+            stdscr.touchwin()
+    
+    def _notify(self, text: str):
+        """Report a successful action on the status row of the menu underneath instead of in a dialog"""
+        self._notice = text
+    
+    def _draw_notice(self, stdscr):
+        """Draw the pending _notify text above the footer; it is shown once"""
+        if self._notice:
+            stdscr.addstr(curses.LINES - 3, 2, self._notice.splitlines()[0][:curses.COLS - 4], curses.A_DIM)
+            self._notice = None
+    
+    def _kv(self, stdscr, y: int, x: int, label: str, value: str,
+            value_attr: int = curses.A_NORMAL, label_attr: int = curses.A_BOLD):
+        """Draw a label with its value written straight after it, wherever the label ends"""
+        stdscr.addstr(y, x, label, label_attr)
+        stdscr.addstr(value, value_attr)
+    
+    def _cached(self, key, ttl: float, fn):
+        """Return fn(), reusing the value stored under key until it is ttl seconds old"""
+        now = time.monotonic()
+        cached = self._query_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        generation = self._cache_generations[key]
+        value = fn()
+        # Invalidated while fn() ran (e.g. by the docker event thread): the value may already be stale
+        if self._cache_generations[key] == generation:
+            self._query_cache[key] = (now, value)
+        return value
+    
+    def _invalidate_cached(self, *keys):
+        """Drop _cached values so the next lookup queries again; safe from worker threads"""
+        for key in keys:
+            self._cache_generations[key] += 1
+            self._query_cache.pop(key, None)
+    
+    def _flush(self, stdscr):
+        """Push the composed screen to the terminal in a single update"""
+        stdscr.noutrefresh()
+        curses.doupdate()
     
     def _check_feature_configured(self, stdscr, feature: str) -> bool:
         """Check if a feature is properly configured, show config UI if not"""
         config = self.manager.config_manager.config
         
-        # Check if feature is enabled
-        if feature == "firewall":
-            if not config.firewall.enabled:
-                return self._show_feature_setup(stdscr, "Firewall Management", [
-                    "Firewall management is currently disabled.",
-                    "",
-                    "To use this feature, you need to:",
-                    "  1. Enable UFW firewall on your system",
-                    "  2. Configure default policies (deny incoming, allow outgoing)",
-                    "  3. Set up basic rules for SSH, HTTP, and HTTPS",
-                    "",
-                    "Would you like to configure it now?"
-                ], self._configure_firewall_setup)
-            return True
-            
-        elif feature == "security":
-            if not config.security.enabled:
-                return self._show_feature_setup(stdscr, "Security Scanner", [
-                    "Security scanner is currently disabled.",
-                    "",
-                    "To use this feature, you need to:",
-                    "  1. Enable security scanning",
-                    "  2. Choose scan frequency (manual or automatic)",
-                    "",
-                    "Would you like to configure it now?"
-                ], self._configure_security_setup)
+        setup = FEATURE_SETUP.get(feature)
+        if setup is None:
             return True
-            
-        elif feature == "alerts":
-            if not config.alerts.enabled:
-                return self._show_feature_setup(stdscr, "Alerts & Monitoring", [
-                    "Alerts & Monitoring is currently disabled.",
-                    "",
-                    "To use this feature, you need to:",
-                    "  1. Enable monitoring system",
-                    "  2. Configure at least one notification channel:",
-                    "     - Email (SMTP configuration)",
-                    "     - Slack (webhook URL)",
-                    "     - Discord (webhook URL)",
-                    "     - Custom webhook",
-                    "",
-                    "Would you like to configure it now?"
-                ], self._configure_alerts)
-            
+        
+        # Check if feature is enabled
+        title, info_lines, config_attr = setup
+        if not getattr(config, feature).enabled:
+            return self._show_feature_setup(stdscr, title, info_lines, getattr(self, config_attr))
+        
+        if feature == "alerts":
             # Check if at least one notification channel is configured
             has_channel = (config.alerts.email.enabled or 
                           config.alerts.slack.enabled or 
@@ -95,90 +467,56 @@ class TerminalUI:
                           config.alerts.webhook.enabled)
             
             if not has_channel:
-                return self._show_feature_setup(stdscr, "Alerts Configuration Required", [
-                    "Alerts & Monitoring is enabled but no notification",
-                    "channels are configured.",
-                    "",
-                    "You need to configure at least one channel:",
-                    "",
-                    "EMAIL:",
-                    "  - SMTP server (e.g., smtp.gmail.com)",
-                    "  - SMTP port (usually 587 or 465)",
-                    "  - Username and password",
-                    "  - From and To email addresses",
-                    "",
-                    "SLACK:",
-                    "  - Webhook URL from Slack app",
-                    "  - Channel name (optional)",
-                    "",
-                    "DISCORD:",
-                    "  - Webhook URL from Discord server settings",
-                    "",
-                    "CUSTOM WEBHOOK:",
-                    "  - Any HTTP endpoint URL",
-                    "  - Optional headers",
-                    "",
-                    "Would you like to configure a notification channel now?"
-                ], self._configure_alerts)
-            return True
-            
-        elif feature == "docker":
-            if not config.docker.enabled:
-                return self._show_feature_setup(stdscr, "Docker Integration", [
-                    "Docker integration is currently disabled.",
-                    "",
-                    "To use this feature, you need to:",
-                    "  1. Install Docker on your system",
-                    "  2. Enable Docker integration",
-                    "  3. Optionally enable auto-discovery of containers",
-                    "",
-                    "Would you like to configure it now?"
-                ], self._configure_docker_setup)
-            return True
-            
-        elif feature == "version_control":
-            if not config.version_control.enabled:
-                return self._show_feature_setup(stdscr, "Version Control", [
-                    "Version Control system is currently disabled.",
-                    "",
-                    "This feature provides Git-like functionality for",
-                    "managing your VPS configurations:",
-                    "  - Commit configuration changes",
-                    "  - View history and diffs",
-                    "  - Restore previous states",
-                    "  - Branch management",
-                    "  - Tag important versions",
-                    "",
-                    "Would you like to enable it now?"
-                ], lambda stdscr: self._enable_version_control(stdscr))
-            return True
+                return self._show_feature_setup(stdscr, "Alerts Configuration Required",
+                                                ALERT_CHANNEL_SETUP_INFO, self._configure_alerts)
         
         return True
     
     def _show_feature_setup(self, stdscr, title: str, info_lines: list, config_func) -> bool:
         """Show feature setup information and offer to configure"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, title, curses.A_BOLD)
-        stdscr.addstr(2, 2, "=" * len(title))
+        pad = self._dialog_pad(title, info_lines)
+        pad_rows, pad_cols = pad.getmaxyx()
         
-        y = 4
-        for line in info_lines:
-            if y < curses.LINES - 4:
-                stdscr.addstr(y, 2, line)
-                y += 1
-        
-        stdscr.addstr(curses.LINES - 2, 2, "Press Y to configure, N to cancel, or ESC to go back")
-        stdscr.refresh()
+        def draw():
+            height, width = curses.LINES, curses.COLS
+            # Blit the pre-rendered text; info lines stop above the footer area
+            stdscr.clear()
+            pad.overwrite(stdscr, 0, 0, 1, 2,
+                          min(pad_rows, height - 5), min(pad_cols + 1, width - 1))
+            stdscr.addstr(height - 2, 2, "Press Y to configure, N to cancel, or ESC to go back")
         
         while True:
-            key = stdscr.getch()
-            if key == ord('y') or key == ord('Y'):
+            key = self._read_key(stdscr, draw)
+            if key in YES_KEYS:
                 config_func(stdscr)
                 # Return True to allow access after configuration
                 return True
-            elif key == ord('n') or key == ord('N') or key == 27:
+            elif key in NO_KEYS or key in EXIT_KEYS:
                 return False
     
+    def _read_key(self, stdscr, draw) -> int:
+        """Draw a prompt screen and return the next key, redrawing on terminal resize"""
+        while True:
+            draw()
+            self._flush(stdscr)
+            key = stdscr.getch()
+            if key != curses.KEY_RESIZE:
+                return key
+            curses.update_lines_cols()
+    
+    def _dialog_pad(self, title: str, info_lines):
+        """Render a static dialog body into an off-screen pad, once per dialog"""
+        key = (title, tuple(info_lines))
+        pad = self._pad_cache.get(key)
+        if pad is None:
+            pad = curses.newpad(len(info_lines) + 3, max(len(title), *map(len, info_lines)) + 1)
+            pad.addstr(0, 0, title, curses.A_BOLD)
+            pad.addstr(1, 0, _hr(len(title)))
+            for i, line in enumerate(info_lines):
+                pad.addstr(3 + i, 0, line)
+            self._pad_cache[key] = pad
+        return pad
+    
     def _enable_version_control(self, stdscr):
         """Enable version control system"""
         self.manager.config_manager.config.version_control.enabled = True
@@ -188,10 +526,10 @@ class TerminalUI:
         stdscr.addstr(2, 2, "=" * 19)
         stdscr.addstr(4, 2, "Would you like to automatically commit configuration")
         stdscr.addstr(5, 2, "changes after each domain operation? (y/n)")
-        stdscr.refresh()
+        self._flush(stdscr)
         
         key = stdscr.getch()
-        if key == ord('y') or key == ord('Y'):
+        if key in YES_KEYS:
             self.manager.config_manager.config.version_control.auto_commit = True
         
         self.manager.config_manager.save()
@@ -199,85 +537,26 @@ class TerminalUI:
     
     def run(self):
         """Start the terminal UI"""
+        curses.wrapper(self._entry)
+    
+    def _entry(self, stdscr):
+        """Onboarding (if needed) and the main loop in one curses session"""
         # Check if this is the first run and show onboarding
         if self.manager.is_first_run():
-            curses.wrapper(self._onboarding_flow)
+            self._onboarding_flow(stdscr)
         elif self.manager.needs_selective_onboarding():
-             curses.wrapper(lambda stdscr: self._selective_onboarding_flow(stdscr, self.manager.get_missing_config_options()))
+            self._selective_onboarding_flow(stdscr, self.manager.get_missing_config_options())
         
         # Check for updates if auto-update is enabled
         if self.manager.config.get('auto_update', True):
             self._check_for_updates_on_startup()
         
-        curses.wrapper(self._main_loop)
+        self._main_loop(stdscr)
     
     # ==================== SETUP WIZARD / ONBOARDING ====================
     
-    def _onboarding_flow(self, stdscr):
-        """First-run setup wizard"""
-        curses.curs_set(0)
-        stdscr.keypad(True)
-        
-        # Welcome screen
-        stdscr.clear()
-        stdscr.addstr(1, 2, "=" * 60)
-        stdscr.addstr(2, 2, "VPS NGINX Domain Manager - First Run Setup".center(60))
-        stdscr.addstr(3, 2, "=" * 60)
-        stdscr.addstr(5, 2, "Welcome! Let's configure your VPS Manager.")
-        stdscr.addstr(7, 2, "This wizard will help you set up:")
-        stdscr.addstr(8, 4, "- Dependency checking (NGINX, Certbot, UFW, Docker)")
-        stdscr.addstr(9, 4, "- Alert notifications (Email, Slack, Discord, Webhooks)")
-        stdscr.addstr(10, 4, "- Firewall management")
-        stdscr.addstr(11, 4, "- Security scanning")
-        stdscr.addstr(12, 4, "- Docker integration")
-        stdscr.addstr(14, 2, "You can reconfigure these later in Settings.")
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        stdscr.refresh()
-        self._wait_for_input(stdscr)
-        
-        # Dependency checking
-        self._check_dependencies(stdscr)
-        
-        # Feature configuration
-        self._configure_features(stdscr)
-        
-        # Complete setup
-        self.manager.mark_first_run_complete()
-        
-        stdscr.clear()
-        stdscr.addstr(1, 2, "=" * 60)
-        stdscr.addstr(2, 2, "Setup Complete!".center(60))
-        stdscr.addstr(3, 2, "=" * 60)
-        stdscr.addstr(5, 2, "[OK] Your VPS Manager is now configured.")
-        stdscr.addstr(7, 2, "You can now manage domains, configure SSL, and more.")
-        stdscr.addstr(9, 2, "Tip: Use the Settings menu to adjust configuration later.")
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue to main menu...")
-        stdscr.refresh()
-        self._wait_for_input(stdscr)
-    
-    def _selective_onboarding_flow(self, stdscr, missing_options):
-        """Selective onboarding for missing configuration"""
-        curses.curs_set(0)
-        stdscr.keypad(True)
-        
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Configuration Update Needed")
-        stdscr.addstr(2, 2, "=" * 27)
-        stdscr.addstr(4, 2, "Some features need configuration:")
-        for i, opt in enumerate(missing_options):
-            stdscr.addstr(5 + i, 4, f"- {opt}")
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to configure...")
-        stdscr.refresh()
-        self._wait_for_input(stdscr)
-        
-        if "alerts" in missing_options:
-            self._configure_alerts(stdscr)
-    
     def _check_dependencies(self, stdscr):
         """Check and offer to install dependencies"""
-        import shutil
-        import subprocess
-        
         stdscr.clear()
         stdscr.addstr(1, 2, "Checking Dependencies...")
         stdscr.addstr(2, 2, "=" * 24)
@@ -290,12 +569,12 @@ class TerminalUI:
             'docker': 'Docker Container Platform'
         }
         
+        available = _path_executables()
         missing = []
         for cmd, name in deps.items():
             stdscr.addstr(y, 2, f"Checking {name}...")
-            stdscr.refresh()
             
-            if shutil.which(cmd):
+            if cmd in available:
                 stdscr.addstr(y, 40, "[OK] Found", curses.A_BOLD)
             else:
                 stdscr.addstr(y, 40, "[!] Not Found", curses.A_BOLD)
@@ -307,71 +586,132 @@ class TerminalUI:
             stdscr.addstr(y, 2, "Missing dependencies detected.")
             y += 1
             stdscr.addstr(y, 2, "Would you like to install them? (y/n)")
-            stdscr.refresh()
+            self._flush(stdscr)
             
             key = stdscr.getch()
-            if key == ord('y') or key == ord('Y'):
+            if key in YES_KEYS:
                 y += 2
+                for i, (cmd, name) in enumerate(missing):
+                    stdscr.addstr(y + i, 2, f"Installing {name}...")
+                self._flush(stdscr)
+                
+                # One apt-get run resolves and downloads everything together. sudo -n never
+                # prompts: curses owns the terminal, so a password prompt could not be answered
+                packages = [pkg for cmd, _ in missing for pkg in DEPENDENCY_PACKAGES[cmd]]
+                apt = ['apt-get', 'install', '-y', *packages]
+                status_y = y + len(missing) + 1
+                ok, last_line = self._run_with_progress(
+                    stdscr, apt if os.geteuid() == 0 else ['sudo', '-n', *apt], status_y)
+                if not ok and "password is required" in last_line:
+                    stdscr.move(status_y, 2)
+                    stdscr.clrtoeol()
+                    stdscr.addstr(status_y, 2, "[X] Installing needs root: run vps-manager under sudo")
+                
+                available = _path_executables()
                 for cmd, name in missing:
-                    stdscr.addstr(y, 2, f"Installing {name}...")
-                    stdscr.refresh()
-                    
-                    try:
-                        if cmd == 'nginx':
-                            subprocess.run(['sudo', 'apt-get', 'install', '-y', 'nginx'], check=True)
-                        elif cmd == 'certbot':
-                            subprocess.run(['sudo', 'apt-get', 'install', '-y', 'certbot', 'python3-certbot-nginx'], check=True)
-                        elif cmd == 'ufw':
-                            subprocess.run(['sudo', 'apt-get', 'install', '-y', 'ufw'], check=True)
-                        elif cmd == 'docker':
-                            subprocess.run(['sudo', 'apt-get', 'install', '-y', 'docker.io'], check=True)
-                        
+                    if cmd in available:
                         stdscr.addstr(y, 40, "[OK] Installed")
-                    except Exception as e:
+                    else:
                         stdscr.addstr(y, 40, "[X] Failed")
                     y += 1
                 
-                stdscr.refresh()
+                self._flush(stdscr)
                 time.sleep(1)
         else:
             y += 1
             stdscr.addstr(y, 2, "[OK] All dependencies found!")
         
         stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        stdscr.refresh()
+        self._flush(stdscr)
         self._wait_for_input(stdscr)
     
-    def _configure_features(self, stdscr):
-        """Configure features during setup"""
-        features = [
-            ("Alerts & Monitoring", self._configure_alerts),
-            ("Firewall Management", self._configure_firewall_setup),
-            ("Security Scanner", self._configure_security_setup),
-            ("Docker Integration", self._configure_docker_setup),
-        ]
+    def _run_with_progress(self, stdscr, cmd: List[str], y: int) -> Tuple[bool, str]:
+        """Run a command on a worker thread, echoing its latest output line at row y
         
-        for name, config_func in features:
-            stdscr.clear()
-            stdscr.addstr(1, 2, f"Configure {name}?")
-            stdscr.addstr(2, 2, "=" * (11 + len(name)))
-            stdscr.addstr(4, 2, f"Would you like to enable {name}? (y/n)")
-            stdscr.addstr(5, 2, "(You can change this later in Settings)")
-            stdscr.refresh()
-            
-            key = stdscr.getch()
-            if key == ord('y') or key == ord('Y'):
-                config_func(stdscr)
-            else:
-                # Disable feature
-                if name == "Alerts & Monitoring":
-                    self.manager.config_manager.config.alerts.enabled = False
-                elif name == "Firewall Management":
-                    self.manager.config_manager.config.firewall.enabled = False
-                elif name == "Security Scanner":
-                    self.manager.config_manager.config.security.enabled = False
-                elif name == "Docker Integration":
-                    self.manager.config_manager.config.docker.enabled = False
-                self.manager.config_manager.save()
+        The command can't be aborted: it runs in its own session so terminal signals
+        don't reach it, since killing apt-get mid-dpkg leaves packages half-configured.
+        Returns (exit status was 0, last output line).
+        """
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    stdin=subprocess.DEVNULL, text=True, bufsize=1,
+                                    start_new_session=True)
+        except OSError as e:
+            stdscr.addstr(y, 2, f"[X] {e}"[:curses.COLS - 4])
+            return False, str(e)
+        
+        lines = queue.Queue()
+        
+        def pump():
+            for line in proc.stdout:
+                lines.put(line.rstrip())
+            proc.stdout.close()
+        
+        reader = threading.Thread(target=pump, daemon=True)
+        reader.start()
+        
+        # Input isn't read while the command runs, so nothing typed meanwhile is swallowed
+        last_line = ""
+        while reader.is_alive() or not lines.empty():
+            try:
+                reader.join(timeout=0.05)
+            except KeyboardInterrupt:
+                continue
+            latest = None
+            try:
+                while True:
+                    latest = lines.get_nowait()
+            except queue.Empty:
+                pass
+            if latest is not None:
+                last_line = latest
+                stdscr.move(y, 2)
+                stdscr.clrtoeol()
+                stdscr.addstr(y, 2, latest[:curses.COLS - 4])
+                self._flush(stdscr)
+        
+        return proc.wait() == 0, last_line
+    
+    @staticmethod
+    def _start_worker(fn) -> Future:
+        """Run fn on a daemon thread, so an abandoned call can't hold up exit"""
+        future = Future()
+        
+        def work():
+            try:
+                future.set_result(fn())
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=work, daemon=True).start()
+        return future
+    
+    def _run_with_spinner(self, stdscr, fn, y: int, label: str):
+        """Run fn on a worker thread, animating a spinner after label at row y
+        
+        fn may also be a Future that is already running, to wait on it again.
+        Returns (True, result), or (False, None) if the user stopped waiting.
+        """
+        future = fn if isinstance(fn, Future) else self._start_worker(fn)
+        
+        stdscr.addstr(y + 1, 2, "(Press ESC, Ctrl+C, or Ctrl+X to stop waiting)")
+        stdscr.timeout(0)
+        try:
+            for glyph in itertools.cycle("|/-\\"):
+                stdscr.addstr(y, 2, f"{label} {glyph}")
+                self._flush(stdscr)
+                try:
+                    return True, future.result(timeout=0.1)
+                except FutureTimeout:
+                    pass
+                if stdscr.getch() in EXIT_KEYS:  # ESC, Ctrl+C, Ctrl+X
+                    return False, None
+        except KeyboardInterrupt:
+            return False, None
+        finally:
+            stdscr.timeout(-1)
+            stdscr.move(y + 1, 2)
+            stdscr.clrtoeol()
     
     def _configure_alerts(self, stdscr):
         """Configure alert notifications"""
@@ -385,24 +725,32 @@ class TerminalUI:
         stdscr.addstr(9, 2, "4. Custom Webhook")
         stdscr.addstr(10, 2, "5. Skip for now")
         stdscr.addstr(curses.LINES - 2, 2, "Enter choice (1-5):")
-        stdscr.refresh()
+        self._flush(stdscr)
         
         key = stdscr.getch()
         
-        if key == ord('1'):
-            self._configure_email(stdscr)
-        elif key == ord('2'):
-            self._configure_slack(stdscr)
-        elif key == ord('3'):
-            self._configure_discord(stdscr)
-        elif key == ord('4'):
-            self._configure_webhook(stdscr)
+        # Channel setup and the enable flag share one write
+        channel = None
+        with self.manager.config_manager.batch() as result:
+            if key == ord('1'):
+                channel = self._configure_email(stdscr)
+            elif key == ord('2'):
+                channel = self._configure_slack(stdscr)
+            elif key == ord('3'):
+                channel = self._configure_discord(stdscr)
+            elif key == ord('4'):
+                channel = self._configure_webhook(stdscr)
+            
+            self.manager.config_manager.config.alerts.enabled = True
+            self.manager.config_manager.save()
         
-        self.manager.config_manager.config.alerts.enabled = True
-        self.manager.config_manager.save()
+        if not result.saved:
+            self._show_message(stdscr, "Error", "Failed to save alert configuration", True)
+        elif channel:
+            self._show_message(stdscr, "Success", f"[OK] {channel} configuration saved!")
     
-    def _configure_email(self, stdscr):
-        """Configure email notifications"""
+    def _configure_email(self, stdscr) -> Optional[str]:
+        """Configure email notifications; returns the channel name if it was set up"""
         stdscr.clear()
         stdscr.addstr(1, 2, "Email Configuration")
         stdscr.addstr(2, 2, "=" * 19)
@@ -424,13 +772,13 @@ class TerminalUI:
             self.manager.config_manager.config.alerts.email.username = username
             self.manager.config_manager.config.alerts.email.password = password
             self.manager.config_manager.config.alerts.email.from_email = from_email or username
-            self.manager.config_manager.config.alerts.email.to_emails = [e.strip() for e in to_emails.split(',') if e.strip()]
+            self.manager.config_manager.config.alerts.email.to_emails = [e for e in _LIST_SEP.split((to_emails or '').strip()) if e]
             self.manager.config_manager.save()
-            
-            self._show_message(stdscr, "Success", "[OK] Email configuration saved!")
+            return "Email"
+        return None
     
-    def _configure_slack(self, stdscr):
-        """Configure Slack webhook"""
+    def _configure_slack(self, stdscr) -> Optional[str]:
+        """Configure Slack webhook; returns the channel name if it was set up"""
         stdscr.clear()
         stdscr.addstr(1, 2, "Slack Configuration")
         stdscr.addstr(2, 2, "=" * 19)
@@ -443,11 +791,11 @@ class TerminalUI:
             self.manager.config_manager.config.alerts.slack.webhook_url = webhook_url
             self.manager.config_manager.config.alerts.slack.channel = channel or "#alerts"
             self.manager.config_manager.save()
-            
-            self._show_message(stdscr, "Success", "[OK] Slack configuration saved!")
+            return "Slack"
+        return None
     
-    def _configure_discord(self, stdscr):
-        """Configure Discord webhook"""
+    def _configure_discord(self, stdscr) -> Optional[str]:
+        """Configure Discord webhook; returns the channel name if it was set up"""
         stdscr.clear()
         stdscr.addstr(1, 2, "Discord Configuration")
         stdscr.addstr(2, 2, "=" * 21)
@@ -458,11 +806,11 @@ class TerminalUI:
             self.manager.config_manager.config.alerts.discord.enabled = True
             self.manager.config_manager.config.alerts.discord.webhook_url = webhook_url
             self.manager.config_manager.save()
-            
-            self._show_message(stdscr, "Success", "[OK] Discord configuration saved!")
+            return "Discord"
+        return None
     
-    def _configure_webhook(self, stdscr):
-        """Configure custom webhook"""
+    def _configure_webhook(self, stdscr) -> Optional[str]:
+        """Configure custom webhook; returns the channel name if it was set up"""
         stdscr.clear()
         stdscr.addstr(1, 2, "Custom Webhook Configuration")
         stdscr.addstr(2, 2, "=" * 29)
@@ -473,20 +821,20 @@ class TerminalUI:
             self.manager.config_manager.config.alerts.webhook.enabled = True
             self.manager.config_manager.config.alerts.webhook.url = url
             self.manager.config_manager.save()
-            
-            self._show_message(stdscr, "Success", "[OK] Webhook configuration saved!")
+            return "Webhook"
+        return None
     
     def _configure_firewall_setup(self, stdscr):
         """Configure firewall during setup"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Firewall Setup")
-        stdscr.addstr(2, 2, "=" * 14)
-        stdscr.addstr(4, 2, "Enable UFW firewall with default web server rules? (y/n)")
-        stdscr.addstr(5, 2, "(This will allow ports 22, 80, 443)")
-        stdscr.refresh()
+        def draw():
+            stdscr.clear()
+            stdscr.addstr(1, 2, "Firewall Setup")
+            stdscr.addstr(2, 2, "=" * 14)
+            stdscr.addstr(4, 2, "Enable UFW firewall with default web server rules? (y/n)")
+            stdscr.addstr(5, 2, "(This will allow ports 22, 80, 443)")
         
-        key = stdscr.getch()
-        if key == ord('y') or key == ord('Y'):
+        key = self._read_key(stdscr, draw)
+        if key in YES_KEYS:
             self.manager.config_manager.config.firewall.enabled = True
             self.manager.config_manager.config.firewall.auto_enable = True
             self.manager.config_manager.save()
@@ -503,42 +851,52 @@ class TerminalUI:
     
     def _configure_security_setup(self, stdscr):
         """Configure security scanner during setup"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Security Scanner Setup")
-        stdscr.addstr(2, 2, "=" * 22)
-        stdscr.addstr(4, 2, "Run security scan on startup? (y/n)")
-        stdscr.refresh()
+        def draw():
+            stdscr.clear()
+            stdscr.addstr(1, 2, "Security Scanner Setup")
+            stdscr.addstr(2, 2, "=" * 22)
+            stdscr.addstr(4, 2, "Run security scan on startup? (y/n)")
         
-        key = stdscr.getch()
+        key = self._read_key(stdscr, draw)
         self.manager.config_manager.config.security.enabled = True
-        self.manager.config_manager.config.security.auto_scan_on_startup = (key == ord('y') or key == ord('Y'))
+        self.manager.config_manager.config.security.auto_scan_on_startup = key in YES_KEYS
         self.manager.config_manager.save()
     
     def _configure_docker_setup(self, stdscr):
         """Configure Docker integration during setup"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Docker Integration Setup")
-        stdscr.addstr(2, 2, "=" * 24)
-        stdscr.addstr(4, 2, "Auto-discover running Docker containers? (y/n)")
-        stdscr.refresh()
+        def draw():
+            stdscr.clear()
+            stdscr.addstr(1, 2, "Docker Integration Setup")
+            stdscr.addstr(2, 2, "=" * 24)
+            stdscr.addstr(4, 2, "Auto-discover running Docker containers? (y/n)")
         
-        key = stdscr.getch()
+        key = self._read_key(stdscr, draw)
         self.manager.config_manager.config.docker.enabled = True
-        self.manager.config_manager.config.docker.auto_discover = (key == ord('y') or key == ord('Y'))
+        self.manager.config_manager.config.docker.auto_discover = key in YES_KEYS
         self.manager.config_manager.save()
     
     def _main_loop(self, stdscr):
         """Main UI loop"""
         curses.curs_set(0)  # Hide cursor
         stdscr.keypad(True)  # Enable special keys
-        stdscr.timeout(100)  # Set timeout for non-blocking input
+        stdscr.timeout(-1)  # Block until a key arrives; nothing here changes on its own
         
         while True:
-            stdscr.clear()
-            self._draw_header(stdscr)
-            self._draw_menu(stdscr)
-            self._draw_footer(stdscr)
-            stdscr.refresh()
+            if self._show_background_messages(stdscr):
+                self._dirty = True
+            if self._dirty:
+                # erase() instead of clear() lets curses diff against the
+                # previous frame rather than repainting the whole terminal
+                stdscr.erase()
+                self._draw_header(stdscr)
+                self._draw_menu(stdscr)
+                self._draw_footer(stdscr)
+                self._dirty = False
+            elif self._last_selection != self.current_selection:
+                self._draw_menu_item(stdscr, self._last_selection)
+                self._draw_menu_item(stdscr, self.current_selection)
+            self._last_selection = self.current_selection
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
@@ -552,23 +910,24 @@ class TerminalUI:
             elif key == ord('q') or key == ord('Q'):  # Q key for quit
                 break
             elif key == curses.KEY_UP and self.current_selection > 0:
-                self.current_selection -= 1
+                self.current_selection = max(0, self.current_selection - self._drain_repeats(stdscr, key))
             elif key == curses.KEY_DOWN and self.current_selection < len(self.menu_items) - 1:
-                self.current_selection += 1
+                self.current_selection = min(len(self.menu_items) - 1,
+                                             self.current_selection + self._drain_repeats(stdscr, key))
             elif key == ord('\n') or key == ord(' '):
                 if self.current_selection == len(self.menu_items) - 1:  # Exit
                     break
                 else:
                     self._handle_menu_selection(stdscr)
-            elif key == -1:  # Timeout, continue loop
-                continue
+                    self._dirty = True
+            elif key == curses.KEY_RESIZE:
+                self._dirty = True
     
     def _draw_header(self, stdscr):
         """Draw the header"""
-        header = f"VPS NGINX Domain Manager v{VERSION}"
-        stdscr.addstr(1, 2, "=" * 60)
-        stdscr.addstr(2, 2, header.center(56))
-        stdscr.addstr(3, 2, "=" * 60)
+        stdscr.addstr(1, 2, SEP60)
+        stdscr.addstr(2, 2, self._header_title)
+        stdscr.addstr(3, 2, SEP60)
         
         # Show update notification if available
         if self.update_available and self.update_available[0]:
@@ -576,60 +935,36 @@ class TerminalUI:
             update_msg = f"UPDATE AVAILABLE: {latest} (current: {current}) - Check Settings > Manual Update"
             stdscr.addstr(4, 2, update_msg, curses.A_BOLD)
             stdscr.addstr(5, 2, f"Domains: {len(self.manager.domains)} | Manager Dir: {MANAGER_DIR}")
-            stdscr.addstr(6, 2, "=" * 60)
+            stdscr.addstr(6, 2, SEP60)
         else:
             stdscr.addstr(4, 2, f"Domains: {len(self.manager.domains)} | Manager Dir: {MANAGER_DIR}")
-            stdscr.addstr(5, 2, "=" * 60)
+            stdscr.addstr(5, 2, SEP60)
     
     def _draw_menu(self, stdscr):
         """Draw the main menu"""
+        for i in range(len(self.menu_items)):
+            self._draw_menu_item(stdscr, i)
+    
+    def _draw_menu_item(self, stdscr, i: int):
+        """Draw a single main menu line"""
         # Calculate menu start position based on header height
         menu_start_y = 7 if not (self.update_available and self.update_available[0]) else 8
-        for i, item in enumerate(self.menu_items):
-            if i == self.current_selection:
-                stdscr.addstr(menu_start_y + i, 4, f"> {item}", curses.A_REVERSE)
-            else:
-                stdscr.addstr(menu_start_y + i, 4, f"  {item}")
+        if i == self.current_selection:
+            stdscr.addstr(menu_start_y + i, 4, self._menu_selected[i], curses.A_REVERSE)
+        else:
+            stdscr.addstr(menu_start_y + i, 4, self._menu_normal[i])
     
     def _draw_footer(self, stdscr):
         """Draw the footer"""
         footer_y = curses.LINES - 3
-        stdscr.addstr(footer_y, 2, "=" * 60)
+        stdscr.addstr(footer_y, 2, SEP60)
         stdscr.addstr(footer_y + 1, 2, "Up/Down: Navigate | Enter/Space: Select | ESC/Ctrl+C/Ctrl+X/Q: Exit")
     
     def _handle_menu_selection(self, stdscr):
         """Handle menu selection"""
-        selection = self.current_selection
-        
-        if selection == 0:  # List Domains
-            self._list_domains(stdscr)
-        elif selection == 1:  # Add Domain
-            self._add_domain(stdscr)
-        elif selection == 2:  # Edit Domain
-            self._edit_domain(stdscr)
-        elif selection == 3:  # Delete Domain
-            self._delete_domain(stdscr)
-        elif selection == 4:  # NGINX Status
-            self._nginx_status(stdscr)
-        elif selection == 5:  # Version Control
-            if self._check_feature_configured(stdscr, "version_control"):
-                self._version_control_menu(stdscr)
-        elif selection == 6:  # Firewall Management
-            if self._check_feature_configured(stdscr, "firewall"):
-                self._firewall_management(stdscr)
-        elif selection == 7:  # Security Scanner
-            if self._check_feature_configured(stdscr, "security"):
-                self._security_scanner(stdscr)
-        elif selection == 8:  # Alerts & Monitoring
-            if self._check_feature_configured(stdscr, "alerts"):
-                self._alerts_monitoring(stdscr)
-        elif selection == 9:  # Docker Integration
-            if self._check_feature_configured(stdscr, "docker"):
-                self._docker_integration(stdscr)
-        elif selection == 10:  # View Logs
-            self._view_logs(stdscr)
-        elif selection == 11:  # Settings
-            self._settings_menu(stdscr)
+        handler, feature = self._menu_handlers[self.current_selection]
+        if handler is not None and (feature is None or self._check_feature_configured(stdscr, feature)):
+            handler(stdscr)
     
     def _get_input(self, stdscr, prompt: str, y: int, x: int, default: str = "") -> str:
         """Get user input with prompt and exit handling"""
@@ -638,24 +973,24 @@ class TerminalUI:
         if default:
             stdscr.addstr(y, x + len(prompt) + 2, default)
         stdscr.addstr(y + 1, x, "(Press ESC, Ctrl+C, or Ctrl+X to cancel)")
-        stdscr.refresh()
+        self._flush(stdscr)
         
         # Manual input handling for exit shortcuts
         input_str = ""
         cursor_pos = len(default)
+        field_x = x + len(prompt) + 2
         
         if default:
             input_str = default
         
         while True:
             # Position cursor
-            stdscr.move(y, x + len(prompt) + 2 + cursor_pos)
-            curses.curs_set(1)
+            stdscr.move(y, field_x + cursor_pos)
             
             key = stdscr.getch()
             
             # Handle exit shortcuts
-            if key == 27 or key == 3 or key == 24:  # ESC, Ctrl+C, Ctrl+X
+            if key in EXIT_KEYS:  # ESC, Ctrl+C, Ctrl+X
                 curses.curs_set(0)
                 return None  # Signal cancellation
             elif key == ord('\n'):  # Enter
@@ -664,10 +999,8 @@ class TerminalUI:
                 if cursor_pos > 0:
                     input_str = input_str[:cursor_pos-1] + input_str[cursor_pos:]
                     cursor_pos -= 1
-                    # Clear and redraw line
-                    stdscr.move(y, x + len(prompt) + 2)
-                    stdscr.clrtoeol()
-                    stdscr.addstr(y, x + len(prompt) + 2, input_str)
+                    # Shift the tail left over the deleted cell
+                    stdscr.delch(y, field_x + cursor_pos)
             elif key == curses.KEY_LEFT and cursor_pos > 0:
                 cursor_pos -= 1
             elif key == curses.KEY_RIGHT and cursor_pos < len(input_str):
@@ -675,11 +1008,9 @@ class TerminalUI:
             elif 32 <= key <= 126 and len(input_str) < 50:  # Printable characters
                 char = chr(key)
                 input_str = input_str[:cursor_pos] + char + input_str[cursor_pos:]
+                # Shift the tail right and write only the new cell
+                stdscr.insch(y, field_x + cursor_pos, key)
                 cursor_pos += 1
-                # Clear and redraw line
-                stdscr.move(y, x + len(prompt) + 2)
-                stdscr.clrtoeol()
-                stdscr.addstr(y, x + len(prompt) + 2, input_str)
         
         curses.curs_set(0)
         # Clear the cancel instruction line
@@ -692,29 +1023,21 @@ class TerminalUI:
         """Show a message dialog"""
         stdscr.clear()
         stdscr.addstr(1, 2, title)
-        stdscr.addstr(2, 2, "=" * len(title))
+        stdscr.addstr(2, 2, _hr(len(title)))
         
-        # Split long messages into multiple lines
-        lines = []
-        words = message.split(' ')
-        current_line = ""
-        max_width = curses.COLS - 6
+        height, width = curses.LINES, curses.COLS
         
-        for word in words:
-            if len(current_line + word) < max_width:
-                current_line += word + " "
-            else:
-                lines.append(current_line.strip())
-                current_line = word + " "
-        if current_line:
-            lines.append(current_line.strip())
+        # Split long messages into multiple lines, keeping paragraph breaks
+        max_width = width - 6
+        lines = [line for para in message.split('\n')
+                 for line in (textwrap.wrap(para, max_width) or [''])]
         
+        attr = curses.A_BOLD if is_error else curses.A_NORMAL
         for i, line in enumerate(lines):
-            attr = curses.A_BOLD if is_error else curses.A_NORMAL
             stdscr.addstr(4 + i, 2, line, attr)
         
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        stdscr.refresh()
+        stdscr.addstr(height - 2, 2, "Press any key to continue...")
+        self._flush(stdscr)
         
         self._wait_for_input(stdscr)
     
@@ -725,17 +1048,13 @@ class TerminalUI:
         stdscr.addstr(2, 2, "=" * 12)
         stdscr.addstr(4, 2, message)
         stdscr.addstr(6, 2, "Are you sure? (y/N): ")
-        stdscr.refresh()
+        self._flush(stdscr)
         
-        time.sleep(0.5)
-        # Flush input buffer
-        stdscr.nodelay(True)
-        while stdscr.getch() != -1:
-            pass
-        stdscr.nodelay(False)
+        # Drop any typeahead before reading the answer
+        self._flush_input()
         
         key = stdscr.getch()
-        return key in [ord('y'), ord('Y')]
+        return key in YES_KEYS
     
     def _select_from_list(self, stdscr, title: str, items: List[str], allow_cancel: bool = True) -> Optional[int]:
         """Select item from list"""
@@ -743,51 +1062,73 @@ class TerminalUI:
             self._show_message(stdscr, title, "No items available.")
             return None
         
-        current_selection = 0
-        
         # Flush input buffer before starting interaction
-        time.sleep(0.2)
-        stdscr.nodelay(True)
-        while stdscr.getch() != -1:
-            pass
-        stdscr.nodelay(False)
+        self._flush_input()
+        
+        return self._run_menu(stdscr, title, items, allow_cancel)
+    
+    def _run_menu(self, stdscr, title: str, items: List[str], allow_cancel: bool = True,
+                  current_selection: int = 0) -> Optional[int]:
+        """Shared highlight/navigate/select loop; returns the chosen index, None on cancel"""
+        # Bind key codes once; they are compared on every keystroke
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
+        select_keys = (ord('\n'), ord(' '))
+        
+        # Render every row in both states up front; navigation just picks one
+        labels = list(items) + (["Cancel"] if allow_cancel else [])
+        normal_rows = [f"  {label}" for label in labels]
+        reverse_rows = [f"> {label}" for label in labels]
+        # Cancel sits one blank line below the items
+        row_y = [4 + i for i in range(len(items))] + ([4 + len(items) + 1] if allow_cancel else [])
+        
+        def draw_row(i):
+            if i == current_selection:
+                stdscr.addstr(row_y[i], 4, reverse_rows[i], curses.A_REVERSE)
+            else:
+                stdscr.addstr(row_y[i], 4, normal_rows[i])
+        
+        max_selection = len(labels) - 1
+        repaint = True
+        prev_selection = current_selection
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, title)
-            stdscr.addstr(2, 2, "=" * len(title))
-            
-            for i, item in enumerate(items):
-                if i == current_selection:
-                    stdscr.addstr(4 + i, 4, f"> {item}", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(4 + i, 4, f"  {item}")
-            
-            if allow_cancel:
-                cancel_line = 4 + len(items) + 1
-                if current_selection == len(items):
-                    stdscr.addstr(cancel_line, 4, "> Cancel", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(cancel_line, 4, "  Cancel")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select")
-            stdscr.refresh()
+            if repaint:
+                stdscr.clear()
+                stdscr.addstr(1, 2, title)
+                stdscr.addstr(2, 2, _hr(len(title)))
+                for i in range(max_selection + 1):
+                    draw_row(i)
+                stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select")
+                repaint = False
+            elif prev_selection != current_selection:
+                # Only the old and new highlight rows change
+                draw_row(prev_selection)
+                draw_row(current_selection)
+            prev_selection = current_selection
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
-            max_selection = len(items) + (1 if allow_cancel else 0) - 1
-            
-            if key == curses.KEY_UP and current_selection > 0:
-                current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < max_selection:
-                current_selection += 1
-            elif key == ord('\n') or key == ord(' '):
+            if key == key_up and current_selection > 0:
+                # Held keys move several rows for a single repaint
+                current_selection = max(0, current_selection - self._drain_repeats(stdscr, key))
+            elif key == key_down and current_selection < max_selection:
+                current_selection = min(max_selection, current_selection + self._drain_repeats(stdscr, key))
+            elif key in select_keys:
                 if allow_cancel and current_selection == len(items):
                     return None  # Cancel
                 else:
                     return current_selection
             elif key == 27:  # ESC
                 return None
+            elif key == key_resize:
+                curses.update_lines_cols()
+                repaint = True
+    
+    def _draw_menu_selection(self, stdscr, items, prev: int, cur: int, start_y: int, x: int = 4):
+        """Move the highlight between two rows, leaving the rest of the menu as drawn"""
+        stdscr.addstr(start_y + prev, x, f"  {items[prev]}")
+        stdscr.addstr(start_y + cur, x, f"> {items[cur]}", curses.A_REVERSE)
     
     def _list_domains(self, stdscr):
         """Display list of domains"""
@@ -798,25 +1139,29 @@ class TerminalUI:
         if not self.manager.domains:
             stdscr.addstr(4, 2, "No domains configured.")
         else:
-            stdscr.addstr(4, 2, "Domain Name".ljust(25) + "Port".ljust(8) + "SSL".ljust(8) + "Config".ljust(12) + "Status")
+            stdscr.addstr(4, 2, self._DOMAIN_HEADER)
             stdscr.addstr(5, 2, "-" * 70)
             
+            # One directory read each instead of two stat() calls per domain
+            available = _dir_names(NGINX_SITES_DIR)
+            enabled = _dir_names(NGINX_ENABLED_DIR)
+            
             for i, domain in enumerate(self.manager.domains):
                 ssl_status = "Yes" if domain.ssl else "No"
                 config_type = "Custom" if domain.custom_config else "Default"
                 
                 # Check if NGINX config exists
-                config_file = NGINX_SITES_DIR / domain.name
-                enabled_file = NGINX_ENABLED_DIR / domain.name
-                
-                if config_file.exists() and enabled_file.exists():
+                if domain.name in available and domain.name in enabled:
                     status = "Active"
-                elif config_file.exists():
+                elif domain.name in available:
                     status = "Disabled"
                 else:
                     status = "Missing"
                 
-                line = f"{domain.name[:24].ljust(25)}{str(domain.port).ljust(8)}{ssl_status.ljust(8)}{config_type[:11].ljust(12)}{status}"
+                line = self._DOMAIN_ROW_FMT.format_map({
+                    'name': domain.name[:24], 'port': domain.port, 'ssl': ssl_status,
+                    'cfg': config_type[:11], 'status': status,
+                })
                 stdscr.addstr(6 + i, 2, line)
         
         stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
@@ -864,8 +1209,13 @@ class TerminalUI:
             if custom_choice.lower() in ['y', 'yes']:
                 # List available custom configs
                 custom_configs_dir = MANAGER_DIR / "custom-configs"
-                if custom_configs_dir.exists():
-                    configs = [f.name for f in custom_configs_dir.iterdir() if f.is_file() and f.suffix == '.conf']
+                try:
+                    # DirEntry.is_file() uses the d_type from readdir, no stat per file
+                    with os.scandir(custom_configs_dir) as entries:
+                        configs = [e.name for e in entries if e.name.endswith('.conf') and e.is_file()]
+                except FileNotFoundError:
+                    configs = None
+                if configs is not None:
                     if configs:
                         selection = self._select_from_list(stdscr, "Select Custom Configuration", configs)
                         if selection is not None:
@@ -874,13 +1224,17 @@ class TerminalUI:
                         self._show_message(stdscr, "Info", "No custom configurations found. Using default template.")
             
             # Show summary and confirm
-            summary = f"Domain: {domain_name}\nPort: {port}\nSSL: {'Yes' if ssl_enabled else 'No'}\nConfig: {custom_config or 'Default'}"
+            lines = [
+                f"Domain: {domain_name}",
+                f"Port: {port}",
+                f"SSL: {'Yes' if ssl_enabled else 'No'}",
+                f"Config: {custom_config or 'Default'}",
+            ]
             
             stdscr.clear()
             stdscr.addstr(1, 2, "Confirm Domain Addition")
             stdscr.addstr(2, 2, "=" * 23)
             
-            lines = summary.split('\n')
             for i, line in enumerate(lines):
                 stdscr.addstr(4 + i, 2, line)
             
@@ -889,12 +1243,13 @@ class TerminalUI:
                 stdscr.clear()
                 stdscr.addstr(1, 2, "Creating Domain...")
                 stdscr.addstr(3, 2, "Please wait, this may take a few moments...")
-                stdscr.refresh()
                 
                 # Create backup if auto-backup is enabled
-                if self.manager.config.get('auto_backup', False):
+                auto_backup = self.manager.config.get('auto_backup', False)
+                if auto_backup:
                     stdscr.addstr(4, 2, "Creating backup...")
-                    stdscr.refresh()
+                self._flush(stdscr)
+                if auto_backup:
                     self.manager.create_domain_backup(domain_name)
                 
                 # Add domain
@@ -926,7 +1281,7 @@ class TerminalUI:
         try:
             stdscr.clear()
             stdscr.addstr(1, 2, f"Edit Domain: {domain.name}")
-            stdscr.addstr(2, 2, "=" * (13 + len(domain.name)))
+            stdscr.addstr(2, 2, _hr(13 + len(domain.name)))
             stdscr.addstr(4, 2, "Leave empty to keep current value")
             
             # Get new values
@@ -940,6 +1295,11 @@ class TerminalUI:
             if new_ssl_str is None:  # User cancelled
                 return
             
+            # Enter through every prompt means nothing to compare
+            if not (new_name or new_port_str or new_ssl_str):
+                self._show_message(stdscr, "Info", "No changes specified.")
+                return
+            
             # Process inputs
             new_port = None
             if new_port_str:
@@ -1003,31 +1363,22 @@ class TerminalUI:
         domain_name = domain_names[selection]
         
         if self._confirm_action(stdscr, f"Delete domain '{domain_name}'?\n\nThis will remove the NGINX configuration and disable the site."):
-            # Show progress with proper timing
             stdscr.clear()
             stdscr.addstr(1, 2, "Deleting Domain...", curses.A_BOLD)
             stdscr.addstr(3, 2, "Please wait...", curses.A_DIM)
-            stdscr.refresh()
             
-            # Add a small delay to ensure the message is visible
-            time.sleep(0.5)
+            # Each stage is drawn as the manager actually reaches it
+            row = 5
             
-            # Show detailed progress
-            stdscr.addstr(5, 2, "- Disabling site...")
-            stdscr.refresh()
-            time.sleep(0.3)
+            def show_stage(stage):
+                nonlocal row
+                stdscr.addstr(row, 2, f"- {stage}")
+                row += 1
+                self._flush(stdscr)
             
-            # Delete domain
-            success, message = self.manager.delete_domain(domain_name)
+            success, message = self.manager.delete_domain(domain_name, progress=show_stage)
             
             if success:
-                stdscr.addstr(6, 2, "- Removing NGINX configuration...")
-                stdscr.refresh()
-                time.sleep(0.3)
-                stdscr.addstr(7, 2, "- Reloading NGINX...")
-                stdscr.refresh()
-                time.sleep(0.5)
-                
                 self._show_message(stdscr, "Success", message)
             else:
                 self._show_message(stdscr, "Error", message, True)
@@ -1038,28 +1389,26 @@ class TerminalUI:
         stdscr.addstr(1, 2, "NGINX Status & Management")
         stdscr.addstr(2, 2, "=" * 25)
         
-        # Get NGINX status
-        is_active, status = self.manager.get_nginx_status()
+        # Query the service and test the config concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_future = executor.submit(self.manager.get_nginx_status)
+            test_future = executor.submit(self.manager.run_command, "nginx -t")
+            is_active, status = status_future.result()
+            test_success, test_output = test_future.result()
+        
         status_text = "Running" if is_active else "Stopped"
         status_attr = curses.A_NORMAL if is_active else curses.A_BOLD
         
-        stdscr.addstr(4, 2, f"NGINX Status: ", curses.A_BOLD)
-        stdscr.addstr(4, 16, status_text, status_attr)
+        self._kv(stdscr, 4, 2, "NGINX Status: ", status_text, status_attr)
         
         # Test configuration
-        stdscr.addstr(6, 2, "Testing configuration...", curses.A_DIM)
-        stdscr.refresh()
-        
-        test_success, test_output = self.manager.run_command("nginx -t")
         test_status = "Valid" if test_success else "Invalid"
         test_attr = curses.A_NORMAL if test_success else curses.A_BOLD
         
-        stdscr.addstr(6, 2, f"Configuration: ")
-        stdscr.addstr(6, 17, test_status, test_attr)
+        self._kv(stdscr, 6, 2, "Configuration: ", test_status, test_attr, label_attr=curses.A_NORMAL)
         
         if not test_success:
-            stdscr.addstr(7, 2, "Error: ", curses.A_BOLD)
-            stdscr.addstr(7, 9, test_output[:curses.COLS - 12])
+            self._kv(stdscr, 7, 2, "Error: ", test_output[:curses.COLS - 12])
         
         # Management options
         options = ["Reload NGINX", "Restart NGINX", "Test Configuration", "Back to Main Menu"]
@@ -1069,21 +1418,17 @@ class TerminalUI:
             stdscr.addstr(11 + i, 4, f"{i + 1}. {option}")
         
         stdscr.addstr(curses.LINES - 2, 2, "Select option (1-4): ")
-        stdscr.refresh()
+        self._flush(stdscr)
         
-        time.sleep(0.5)
-        # Flush input buffer
-        stdscr.nodelay(True)
-        while stdscr.getch() != -1:
-            pass
-        stdscr.nodelay(False)
+        # Drop any typeahead before reading the answer
+        self._flush_input()
         
         key = stdscr.getch()
         
         if key == ord('1'):  # Reload
             stdscr.clear()
             stdscr.addstr(1, 2, "Reloading NGINX...")
-            stdscr.refresh()
+            self._flush(stdscr)
             success, output = self.manager.run_command("systemctl reload nginx")
             message = "NGINX reloaded successfully" if success else f"Failed to reload NGINX: {output}"
             self._show_message(stdscr, "Reload Result", message, not success)
@@ -1092,7 +1437,7 @@ class TerminalUI:
             if self._confirm_action(stdscr, "Restart NGINX service?"):
                 stdscr.clear()
                 stdscr.addstr(1, 2, "Restarting NGINX...")
-                stdscr.refresh()
+                self._flush(stdscr)
                 success, output = self.manager.restart_nginx()
                 message = "NGINX restarted successfully" if success else f"Failed to restart NGINX: {output}"
                 self._show_message(stdscr, "Restart Result", message, not success)
@@ -1108,8 +1453,9 @@ class TerminalUI:
             else:
                 stdscr.addstr(4, 2, "[X] Configuration has errors:", curses.A_BOLD)
                 lines = output.split('\n')
+                max_width = curses.COLS - 4
                 for i, line in enumerate(lines[:10]):  # Show first 10 lines
-                    stdscr.addstr(6 + i, 2, line[:curses.COLS - 4])
+                    stdscr.addstr(6 + i, 2, line[:max_width])
             
             stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
             self._wait_for_input(stdscr)
@@ -1153,12 +1499,13 @@ class TerminalUI:
     
     def _view_logs(self, stdscr):
         """View system logs"""
+        # Followed commands: new lines keep arriving while the view is open
         log_options = [
-            ("NGINX Error Log", "tail -n 50 /var/log/nginx/error.log"),
-            ("NGINX Access Log", "tail -n 50 /var/log/nginx/access.log"),
-            ("System Log (nginx)", "journalctl -u nginx -n 50 --no-pager"),
-            ("Certbot Log", "tail -n 50 /var/log/letsencrypt/letsencrypt.log"),
-            ("Manager Log", f"tail -n 50 {LOG_FILE}")
+            ("NGINX Error Log", ["tail", "-n", "50", "-F", "/var/log/nginx/error.log"]),
+            ("NGINX Access Log", ["tail", "-n", "50", "-F", "/var/log/nginx/access.log"]),
+            ("System Log (nginx)", ["journalctl", "-u", "nginx", "-n", "50", "-f", "--no-pager"]),
+            ("Certbot Log", ["tail", "-n", "50", "-F", "/var/log/letsencrypt/letsencrypt.log"]),
+            ("Manager Log", ["tail", "-n", "50", "-F", str(LOG_FILE)])
         ]
         
         log_names = [option[0] for option in log_options]
@@ -1173,55 +1520,125 @@ class TerminalUI:
         stdscr.addstr(1, 2, f"Loading {log_name}...")
         stdscr.refresh()
         
-        success, output = self.manager.run_command(log_command)
-        
-        if not success:
-            self._show_message(stdscr, "Error", f"Failed to read log: {output}", True)
+        try:
+            log_proc, snapshot = self._follow_output(log_command)
+        except OSError as e:
+            self._show_message(stdscr, "Error", f"Failed to read log: {e}", True)
             return
         
+        try:
+            self._browse_log(stdscr, log_name, snapshot)
+        finally:
+            log_proc.terminate()
+            log_proc.wait()
+    
+    def _follow_output(self, command: List[str]):
+        """Start a following command and wait for its initial backlog
+        
+        Returns (process, snapshot); snapshot(since) gives (version, lines), with lines
+        None if nothing arrived after since. The caller terminates the process.
+        """
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                stdin=subprocess.DEVNULL, text=True, bufsize=1)
+        
+        # Only the newest LOG_BUFFER_LINES lines are kept, however long the view stays open
+        log_buffer = collections.deque(maxlen=LOG_BUFFER_LINES)
+        buffer_lock = threading.Lock()
+        received = 0  # lines appended so far; doubles as a version number
+        
+        def pump():
+            nonlocal received
+            for line in proc.stdout:
+                with buffer_lock:
+                    log_buffer.append(line.rstrip('\n'))
+                    received += 1
+        
+        def snapshot(since: int = -1):
+            """(version, lines) -- lines is None if nothing arrived after since"""
+            with buffer_lock:
+                if received == since:
+                    return since, None
+                return received, list(log_buffer)
+        
+        threading.Thread(target=pump, daemon=True).start()
+        
+        # Let the initial backlog arrive: stop once output goes quiet
+        deadline = time.monotonic() + LOG_STARTUP_WAIT
+        seen = -1
+        while time.monotonic() < deadline and proc.poll() is None:
+            time.sleep(0.05)
+            if len(log_buffer) == seen:
+                break
+            seen = len(log_buffer) if log_buffer else -1
+        
+        return proc, snapshot
+    
+    def _browse_log(self, stdscr, log_name: str, snapshot):
+        """Scroll through the current lines of a followed log; 'r' takes a new snapshot"""
         # Display log content
-        lines = output.split('\n')
+        version, lines = snapshot()
         current_line = 0
         
+        def build_pad():
+            # Render the whole log once; scrolling just moves the viewport
+            width = max(curses.COLS - 3, 2)
+            log_pad = curses.newpad(len(lines) + 1, width)
+            for i, line in enumerate(lines):
+                try:
+                    log_pad.addnstr(i, 0, line, width - 1)
+                except curses.error:
+                    pass
+            return log_pad
+        
+        log_pad = build_pad()
+        repaint = True
+        
+        # Bind curses constants once; they are read on every keystroke
+        key_up, key_down = curses.KEY_UP, curses.KEY_DOWN
+        key_ppage, key_npage, key_resize = curses.KEY_PPAGE, curses.KEY_NPAGE, curses.KEY_RESIZE
+        lines_count, cols_count = curses.LINES, curses.COLS
+        page = lines_count - 6
+        
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, f"{log_name} (Lines {current_line + 1}-{min(current_line + curses.LINES - 6, len(lines))})")
-            stdscr.addstr(2, 2, "=" * (len(log_name) + 20))
-            
-            # Display lines
-            display_lines = lines[current_line:current_line + curses.LINES - 6]
-            for i, line in enumerate(display_lines):
-                if i < curses.LINES - 6:
-                    # Truncate long lines
-                    display_line = line[:curses.COLS - 4] if len(line) > curses.COLS - 4 else line
-                    stdscr.addstr(4 + i, 2, display_line)
-            
-            # Navigation info
-            nav_info = "Up/Down: Scroll, q: Quit, r: Refresh"
-            stdscr.addstr(curses.LINES - 2, 2, nav_info)
-            stdscr.refresh()
+            if repaint:
+                stdscr.clear()
+                stdscr.addstr(2, 2, _hr(len(log_name) + 20))
+                # Navigation info
+                nav_info = "Up/Down: Scroll, q: Quit, r: Refresh"
+                stdscr.addstr(lines_count - 2, 2, nav_info)
+                repaint = False
+            stdscr.move(1, 2)
+            stdscr.clrtoeol()
+            stdscr.addstr(1, 2, f"{log_name} (Lines {current_line + 1}-{min(current_line + page, len(lines))})")
+            stdscr.noutrefresh()
+            log_pad.noutrefresh(current_line, 0, 4, 2, lines_count - 3, cols_count - 2)
+            curses.doupdate()
             
             key = stdscr.getch()
             
             if key == ord('q') or key == 27:  # q or ESC
                 break
             elif key == ord('r'):  # Refresh
-                stdscr.clear()
-                stdscr.addstr(1, 2, f"Refreshing {log_name}...")
-                stdscr.refresh()
-                success, output = self.manager.run_command(log_command)
-                if success:
-                    lines = output.split('\n')
-                    current_line = max(0, len(lines) - (curses.LINES - 6))  # Go to end
-            elif key == curses.KEY_UP and current_line > 0:
+                version, new_lines = snapshot(version)
+                if new_lines is not None:  # Only re-render when the log grew
+                    lines = new_lines
+                    log_pad = build_pad()
+                current_line = max(0, len(lines) - page)  # Go to end
+            elif key == key_up and current_line > 0:
                 current_line -= 1
-            elif key == curses.KEY_DOWN and current_line < len(lines) - (curses.LINES - 6):
+            elif key == key_down and current_line < len(lines) - page:
                 current_line += 1
-            elif key == curses.KEY_PPAGE:  # Page Up
-                current_line = max(0, current_line - (curses.LINES - 6))
-            elif key == curses.KEY_NPAGE:  # Page Down
-                current_line = min(len(lines) - (curses.LINES - 6), current_line + (curses.LINES - 6))
+            elif key == key_ppage:  # Page Up
+                current_line = max(0, current_line - page)
+            elif key == key_npage:  # Page Down
+                current_line = min(len(lines) - page, current_line + page)
                 current_line = max(0, current_line)
+            elif key == key_resize:
+                curses.update_lines_cols()
+                lines_count, cols_count = curses.LINES, curses.COLS
+                page = lines_count - 6
+                log_pad = build_pad()
+                repaint = True
     
     def _onboarding_flow(self, stdscr):
         """First-time setup onboarding flow"""
@@ -1291,17 +1708,17 @@ class TerminalUI:
         stdscr.addstr(1, 2, "Configuration Summary")
         stdscr.addstr(2, 2, "=" * 21)
         
-        y_pos = 4
-        stdscr.addstr(y_pos, 2, f"Email for SSL: {self.manager.config.get('certbot_email', 'Domain-specific')}")
-        y_pos += 1
-        stdscr.addstr(y_pos, 2, f"Auto-backup: {'Yes' if self.manager.config.get('auto_backup', False) else 'No'}")
-        y_pos += 1
-        stdscr.addstr(y_pos, 2, f"Default SSL: {'Yes' if self.manager.config.get('default_ssl', True) else 'No'}")
-        y_pos += 1
-        stdscr.addstr(y_pos, 2, f"Auto-update: {'Yes' if self.manager.config.get('auto_update', True) else 'No'}")
-        y_pos += 2
-        
-        stdscr.addstr(y_pos, 2, "Press any key to save configuration and continue...")
+        config = self.manager.config
+        summary_lines = [
+            f"Email for SSL: {config.get('certbot_email', 'Domain-specific')}",
+            f"Auto-backup: {'Yes' if config.get('auto_backup', False) else 'No'}",
+            f"Default SSL: {'Yes' if config.get('default_ssl', True) else 'No'}",
+            f"Auto-update: {'Yes' if config.get('auto_update', True) else 'No'}",
+        ]
+        for i, line in enumerate(summary_lines):
+            stdscr.addstr(4 + i, 2, line)
+        
+        stdscr.addstr(5 + len(summary_lines), 2, "Press any key to save configuration and continue...")
         stdscr.refresh()
         self._wait_for_input(stdscr)
         
@@ -1333,7 +1750,8 @@ class TerminalUI:
         stdscr.refresh()
         self._wait_for_input(stdscr)
         
-        # Handle each missing option
+        # Handle each missing option; handlers only mutate config, which
+        # update_config_version() below writes out once
         for option in missing_options:
             if option == 'auto_update':
                 self._configure_auto_update_option(stdscr)
@@ -1353,7 +1771,7 @@ class TerminalUI:
         self.manager.update_config_version()
     
     def _configure_auto_update_option(self, stdscr):
-        """Configure the auto-update option during selective onboarding"""
+        """Configure the auto-update option during selective onboarding (caller saves)"""
         stdscr.clear()
         stdscr.addstr(1, 2, "Auto-Update Configuration")
         stdscr.addstr(2, 2, "=" * 25)
@@ -1366,7 +1784,6 @@ class TerminalUI:
         if auto_update is None:  # User cancelled, set default
             auto_update = "y"
         self.manager.config['auto_update'] = auto_update.lower() not in ['n', 'no']
-        self.manager.save_config()
     
     def _settings_menu(self, stdscr):
         """Settings management menu"""
@@ -1386,57 +1803,44 @@ class TerminalUI:
             "Back to Main Menu"
         ]
         
+        handlers = {
+            0: self._change_certbot_email,
+            1: partial(self._toggle_bool, key='auto_backup', default=False, label="Auto-backup"),
+            2: partial(self._toggle_bool, key='default_ssl', default=True, label="Default SSL"),
+            3: partial(self._toggle_bool, key='auto_update', default=True, label="Auto-update"),
+            4: self._manual_update_check,
+            5: self._configure_alerts,
+            6: self._configure_firewall_setup,
+            7: self._configure_security_setup,
+            8: self._configure_docker_setup,
+            9: self._enable_version_control,
+            10: self._view_current_settings,
+            11: self._reset_settings,
+        }
+        
         current_selection = 0
         
-        while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, "Settings Menu")
-            stdscr.addstr(2, 2, "=" * 13)
-            
-            for i, option in enumerate(settings_options):
-                if i == current_selection:
-                    stdscr.addstr(4 + i, 4, f"> {option}", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(4 + i, 4, f"  {option}")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select")
-            stdscr.refresh()
-            
-            key = stdscr.getch()
-            
-            if key == curses.KEY_UP and current_selection > 0:
-                current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < len(settings_options) - 1:
-                current_selection += 1
-            elif key == ord('\n') or key == ord(' '):
-                if current_selection == 0:  # Change Certbot Email
-                    self._change_certbot_email(stdscr)
-                elif current_selection == 1:  # Toggle Auto-backup
-                    self._toggle_auto_backup(stdscr)
-                elif current_selection == 2:  # Toggle Default SSL
-                    self._toggle_default_ssl(stdscr)
-                elif current_selection == 3:  # Toggle Auto-update
-                    self._toggle_auto_update(stdscr)
-                elif current_selection == 4:  # Check for Updates
-                    self._manual_update_check(stdscr)
-                elif current_selection == 5:  # Configure Alerts
-                    self._configure_alerts(stdscr)
-                elif current_selection == 6:  # Configure Firewall
-                    self._configure_firewall_setup(stdscr)
-                elif current_selection == 7:  # Configure Security
-                    self._configure_security_setup(stdscr)
-                elif current_selection == 8:  # Configure Docker
-                    self._configure_docker_setup(stdscr)
-                elif current_selection == 9:  # Configure Version Control
-                    self._enable_version_control(stdscr)
-                elif current_selection == 10:  # View Current Settings
-                    self._view_current_settings(stdscr)
-                elif current_selection == 11:  # Reset to Defaults
-                    self._reset_settings(stdscr)
-                elif current_selection == 12:  # Back
+        try:
+            while True:
+                current_selection = self._run_menu(stdscr, "Settings Menu", settings_options,
+                                                   allow_cancel=False, current_selection=current_selection)
+                handler = handlers.get(current_selection)
+                if handler is None:  # ESC or Back
                     break
-            elif key == 27:  # ESC
-                break
+                handler(stdscr)
+        finally:
+            # Edits made in this visit are written together on the way out
+            self._save_config_if_dirty()
+    
+    def _mark_config_dirty(self):
+        """Note an unsaved settings change; the settings menu saves it on exit"""
+        self._config_dirty = True
+    
+    def _save_config_if_dirty(self):
+        """Write the legacy config if any setting changed since the last save"""
+        if self._config_dirty:
+            self.manager.save_config()
+            self._config_dirty = False
     
     def _change_certbot_email(self, stdscr):
         """Change Certbot email setting"""
@@ -1451,38 +1855,17 @@ class TerminalUI:
         
         if new_email:
             self.manager.config['certbot_email'] = new_email
-            self.manager.save_config()
+            self._mark_config_dirty()
             self._show_message(stdscr, "Success", "Email address updated successfully.")
     
-    def _toggle_auto_backup(self, stdscr):
-        """Toggle auto-backup setting"""
-        current = self.manager.config.get('auto_backup', False)
-        new_value = not current
-        self.manager.config['auto_backup'] = new_value
-        self.manager.save_config()
-        
-        status = "enabled" if new_value else "disabled"
-        self._show_message(stdscr, "Success", f"Auto-backup has been {status}.")
-    
-    def _toggle_default_ssl(self, stdscr):
-        """Toggle default SSL setting"""
-        current = self.manager.config.get('default_ssl', True)
-        new_value = not current
-        self.manager.config['default_ssl'] = new_value
-        self.manager.save_config()
-        
-        status = "enabled" if new_value else "disabled"
-        self._show_message(stdscr, "Success", f"Default SSL has been {status}.")
-    
-    def _toggle_auto_update(self, stdscr):
-        """Toggle auto-update setting"""
-        current = self.manager.config.get('auto_update', True)
-        new_value = not current
-        self.manager.config['auto_update'] = new_value
-        self.manager.save_config()
+    def _toggle_bool(self, stdscr, key: str, default: bool, label: str):
+        """Flip a boolean setting and report its new state"""
+        new_value = not self.manager.config.get(key, default)
+        self.manager.config[key] = new_value
+        self._mark_config_dirty()
         
         status = "enabled" if new_value else "disabled"
-        self._show_message(stdscr, "Success", f"Auto-update has been {status}.")
+        self._show_message(stdscr, "Success", f"{label} has been {status}.")
     
     def _manual_update_check(self, stdscr):
         """Manually check for updates"""
@@ -1517,82 +1900,50 @@ class TerminalUI:
     
     def _view_current_settings(self, stdscr):
         """View current configuration settings"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Current Settings")
-        stdscr.addstr(2, 2, "=" * 16)
-        
-        config = self.manager.config
-        app_config = self.manager.config_manager.config
-        y = 4
-        
-        # Legacy settings
-        stdscr.addstr(y, 2, "General Settings:", curses.A_BOLD)
-        y += 1
-        for key, value in config.items():
-            if y < curses.LINES - 4:
-                stdscr.addstr(y, 4, f"{key}: {value}")
-                y += 1
+        # Keep what's shown in step with what's on disk
+        self._save_config_if_dirty()
         
-        y += 1
-        if y < curses.LINES - 4:
-            stdscr.addstr(y, 2, "Feature Configuration:", curses.A_BOLD)
-            y += 1
+        with self._overlay(stdscr) as win:
+            win.addstr(1, 2, "Current Settings")
+            win.addstr(2, 2, "=" * 16)
             
-            # Alerts
-            status = "Enabled" if app_config.alerts.enabled else "Disabled"
-            stdscr.addstr(y, 4, f"Alerts & Monitoring: {status}")
-            y += 1
-            if app_config.alerts.enabled:
-                channels = []
-                if app_config.alerts.email.enabled:
-                    channels.append("Email")
-                if app_config.alerts.slack.enabled:
-                    channels.append("Slack")
-                if app_config.alerts.discord.enabled:
-                    channels.append("Discord")
-                if app_config.alerts.webhook.enabled:
-                    channels.append("Webhook")
-                if channels:
-                    stdscr.addstr(y, 6, f"Channels: {', '.join(channels)}")
-                    y += 1
+            config = self.manager.config
+            app_config = self.manager.config_manager.config
             
-            # Firewall
-            status = "Enabled" if app_config.firewall.enabled else "Disabled"
-            stdscr.addstr(y, 4, f"Firewall Management: {status}")
-            y += 1
+            def enabled(flag):
+                return "Enabled" if flag else "Disabled"
             
-            # Security
-            status = "Enabled" if app_config.security.enabled else "Disabled"
-            stdscr.addstr(y, 4, f"Security Scanner: {status}")
-            y += 1
-            if app_config.security.auto_scan_on_startup:
-                stdscr.addstr(y, 6, "Auto-scan: Yes")
-                y += 1
+            # (x, text, attr) per row, laid out top to bottom
+            rows = [(2, "General Settings:", curses.A_BOLD)]
+            rows.extend((4, f"{key}: {value}", curses.A_NORMAL) for key, value in config.items())
+            rows.append((2, "", curses.A_NORMAL))
+            rows.append((2, "Feature Configuration:", curses.A_BOLD))
             
-            # Docker
-            status = "Enabled" if app_config.docker.enabled else "Disabled"
-            stdscr.addstr(y, 4, f"Docker Integration: {status}")
-            y += 1
-            if app_config.docker.auto_discover:
-                stdscr.addstr(y, 6, "Auto-discover: Yes")
-                y += 1
+            alerts = app_config.alerts
+            rows.append((4, f"Alerts & Monitoring: {enabled(alerts.enabled)}", curses.A_NORMAL))
+            if alerts.enabled:
+                channels = [label for attr, label in ALERT_CHANNELS if getattr(alerts, attr).enabled]
+                if channels:
+                    rows.append((6, f"Channels: {', '.join(channels)}", curses.A_NORMAL))
             
-            # Version Control
-            status = "Enabled" if app_config.version_control.enabled else "Disabled"
-            stdscr.addstr(y, 4, f"Version Control: {status}")
-            y += 1
-            if app_config.version_control.auto_commit:
-                stdscr.addstr(y, 6, "Auto-commit: Yes")
-                y += 1
-        
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        self._wait_for_input(stdscr)
+            for label, section, option, option_label in FEATURE_SUMMARY:
+                feature = getattr(app_config, section)
+                rows.append((4, f"{label}: {enabled(feature.enabled)}", curses.A_NORMAL))
+                if option and getattr(feature, option):
+                    rows.append((6, f"{option_label}: Yes", curses.A_NORMAL))
+            
+            # One bound check for every row, leaving room for the footer
+            for y, (x, text, attr) in enumerate(rows[:max(0, curses.LINES - 8)], 4):
+                win.addstr(y, x, text, attr)
+            
+            win.addstr(curses.LINES - 2, 2, "Press any key to continue...")
+            self._wait_for_input(win)
     
     def _reset_settings(self, stdscr):
         """Reset settings to defaults"""
         if self._confirm_action(stdscr, "Reset all settings to defaults?\n\nThis will not affect your domains."):
             self.manager.config = {}
-            self.manager.save_config()
+            self._mark_config_dirty()
             self._show_message(stdscr, "Success", "Settings have been reset to defaults.")
     
     # ==================== NEW FEATURES ====================
@@ -1606,105 +1957,138 @@ class TerminalUI:
                              f"{msg}\n\nInstall with: sudo apt install ufw", True)
             return
         
-        menu_items = [
-            "View Firewall Status",
-            "Enable Firewall",
-            "Disable Firewall",
-            "Allow Port",
-            "Deny Port",
-            "Limit Port (Rate Limit)",
-            "Delete Rule",
-            "Allow from IP",
-            "Deny from IP",
-            "Quick Setup (Web Server)",
-            "List All Rules",
-            "Back to Main Menu"
-        ]
+        menu_items = FIREWALL_MENU
+        # One handler per FIREWALL_MENU entry, None for Back
+        handlers = (
+            self._firewall_view_status,
+            self._firewall_enable,
+            self._firewall_disable,
+            self._firewall_allow_port,
+            self._firewall_deny_port,
+            self._firewall_limit_port,
+            self._firewall_delete_rule,
+            self._firewall_allow_ip,
+            self._firewall_deny_ip,
+            self._firewall_quick_setup,
+            self._firewall_list_rules,
+            None,
+        )
+        # Bind key codes once; they are compared on every keystroke
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
         
         current_selection = 0
+        repaint = True
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, "Firewall Management (UFW)")
-            stdscr.addstr(2, 2, "=" * 26)
-            
-            # Show current status
-            success, output, is_active = self.manager.firewall.get_status()
-            status_text = "ACTIVE" if is_active else "INACTIVE"
-            status_attr = curses.A_NORMAL if is_active else curses.A_DIM
-            stdscr.addstr(4, 2, f"Status: ", curses.A_BOLD)
-            stdscr.addstr(4, 10, status_text, status_attr)
-            
-            # Draw menu
-            for i, item in enumerate(menu_items):
-                if i == current_selection:
-                    stdscr.addstr(6 + i, 4, f"> {item}", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(6 + i, 4, f"  {item}")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select, ESC to go back")
-            stdscr.refresh()
+            if repaint:
+                stdscr.erase()
+                stdscr.addstr(1, 2, "Firewall Management (UFW)")
+                stdscr.addstr(2, 2, "=" * 26)
+                
+                # Show current status
+                success, output, is_active = self._firewall_status()
+                status_text = "ACTIVE" if is_active else "INACTIVE"
+                status_attr = curses.A_NORMAL if is_active else curses.A_DIM
+                self._kv(stdscr, 4, 2, "Status: ", status_text, status_attr)
+                
+                # Draw menu
+                for i, item in enumerate(menu_items):
+                    if i == current_selection:
+                        stdscr.addstr(6 + i, 4, f"> {item}", curses.A_REVERSE)
+                    else:
+                        stdscr.addstr(6 + i, 4, f"  {item}")
+                
+                stdscr.addstr(curses.LINES - 2, 2, SUBMENU_FOOTER)
+                repaint = False
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
-            if key == curses.KEY_UP and current_selection > 0:
+            if key == key_up and current_selection > 0:
                 current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < len(menu_items) - 1:
+                self._draw_menu_selection(stdscr, menu_items, current_selection + 1, current_selection, 6)
+            elif key == key_down and current_selection < len(menu_items) - 1:
                 current_selection += 1
+                self._draw_menu_selection(stdscr, menu_items, current_selection - 1, current_selection, 6)
             elif key == ord('\n') or key == ord(' '):
-                if current_selection == 0:  # View Status
-                    self._firewall_view_status(stdscr)
-                elif current_selection == 1:  # Enable
-                    success, msg = self.manager.firewall.enable()
-                    self._show_message(stdscr, "Firewall", msg, not success)
-                elif current_selection == 2:  # Disable
-                    if self._confirm_action(stdscr, "Disable firewall? This may expose your server."):
-                        success, msg = self.manager.firewall.disable()
-                        self._show_message(stdscr, "Firewall", msg, not success)
-                elif current_selection == 3:  # Allow Port
-                    self._firewall_allow_port(stdscr)
-                elif current_selection == 4:  # Deny Port
-                    self._firewall_deny_port(stdscr)
-                elif current_selection == 5:  # Limit Port
-                    self._firewall_limit_port(stdscr)
-                elif current_selection == 6:  # Delete Rule
-                    self._firewall_delete_rule(stdscr)
-                elif current_selection == 7:  # Allow from IP
-                    self._firewall_allow_ip(stdscr)
-                elif current_selection == 8:  # Deny from IP
-                    self._firewall_deny_ip(stdscr)
-                elif current_selection == 9:  # Quick Setup
-                    if self._confirm_action(stdscr, "Configure firewall for web server?\n\nThis will allow ports 22, 80, 443"):
-                        success, msg = self.manager.firewall.quick_setup_web_server()
-                        self._show_message(stdscr, "Quick Setup", msg, not success)
-                elif current_selection == 10:  # List Rules
-                    self._firewall_list_rules(stdscr)
-                elif current_selection == 11:  # Back
+                # Every action takes over the screen
+                repaint = True
+                handler = handlers[current_selection]
+                if handler is None:  # Back
                     break
+                handler(stdscr)
             elif key == 27:  # ESC
                 break
+            elif key == key_resize:
+                curses.update_lines_cols()
+                repaint = True
+    
+    def _firewall_enable(self, stdscr):
+        """Enable the firewall"""
+        success, msg = self.manager.firewall.enable()
+        self._invalidate_firewall_cache()
+        self._show_message(stdscr, "Firewall", msg, not success)
+    
+    def _firewall_disable(self, stdscr):
+        """Disable the firewall after confirmation"""
+        if self._confirm_action(stdscr, "Disable firewall? This may expose your server."):
+            success, msg = self.manager.firewall.disable()
+            self._invalidate_firewall_cache()
+            self._show_message(stdscr, "Firewall", msg, not success)
+    
+    def _firewall_quick_setup(self, stdscr):
+        """Apply the web server rule set after confirmation"""
+        if self._confirm_action(stdscr, "Configure firewall for web server?\n\nThis will allow ports 22, 80, 443"):
+            success, msg = self.manager.firewall.quick_setup_web_server()
+            self._invalidate_firewall_cache()
+            self._show_message(stdscr, "Quick Setup", msg, not success)
+    
+    def _firewall_status(self):
+        """ufw status, reused for a short while so menu repaints don't re-run ufw"""
+        now = time.monotonic()
+        cached = self._fw_status_cache
+        if cached is None or now - cached[0] >= FIREWALL_CACHE_TTL:
+            cached = self._fw_status_cache = (now, self.manager.firewall.get_status())
+        return cached[1]
+    
+    def _firewall_rules(self):
+        """Numbered ufw rules, cached like _firewall_status"""
+        now = time.monotonic()
+        cached = self._fw_rules_cache
+        if cached is None or now - cached[0] >= FIREWALL_CACHE_TTL:
+            cached = self._fw_rules_cache = (now, self.manager.firewall.list_rules())
+        return cached[1]
+    
+    def _invalidate_firewall_cache(self):
+        """Forget cached ufw output after a change to the firewall"""
+        self._fw_status_cache = None
+        self._fw_rules_cache = None
+        self._rules_view = None
     
     def _firewall_view_status(self, stdscr):
         """View detailed firewall status"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Firewall Status")
-        stdscr.addstr(2, 2, "=" * 15)
-        
-        success, output, is_active = self.manager.firewall.get_status()
-        
-        if success:
-            lines = output.split('\n')
-            for i, line in enumerate(lines[:curses.LINES - 6]):
-                stdscr.addstr(4 + i, 2, line[:curses.COLS - 4])
-        
-        policies = self.manager.firewall.get_default_policies()
-        y = min(len(lines) + 5, curses.LINES - 8)
-        stdscr.addstr(y, 2, f"Default Policies:", curses.A_BOLD)
-        stdscr.addstr(y + 1, 2, f"  Incoming: {policies['incoming']}")
-        stdscr.addstr(y + 2, 2, f"  Outgoing: {policies['outgoing']}")
-        
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        self._wait_for_input(stdscr)
+        with self._overlay(stdscr) as win:
+            win.addstr(1, 2, "Firewall Status")
+            win.addstr(2, 2, "=" * 15)
+            
+            success, output, is_active = self._firewall_status()
+            
+            line_count = 0
+            if success:
+                # Only the rows that fit are ever split out of the output
+                max_width = curses.COLS - 4
+                for line in itertools.islice(_iter_lines(output), curses.LINES - 6):
+                    win.addstr(4 + line_count, 2, line[:max_width])
+                    line_count += 1
+            
+            policies = self.manager.firewall.get_default_policies()
+            y = min(line_count + 5, curses.LINES - 8)
+            win.addstr(y, 2, f"Default Policies:", curses.A_BOLD)
+            win.addstr(y + 1, 2, f"  Incoming: {policies['incoming']}")
+            win.addstr(y + 2, 2, f"  Outgoing: {policies['outgoing']}")
+            
+            win.addstr(curses.LINES - 2, 2, "Press any key to continue...")
+            self._wait_for_input(win)
     
     def _firewall_allow_port(self, stdscr):
         """Allow a port through firewall"""
@@ -1729,6 +2113,7 @@ class TerminalUI:
         comment = self._get_input(stdscr, "Comment (optional)", 6, 2, "")
         
         success, msg = self.manager.firewall.allow_port(port, protocol, comment or None)
+        self._invalidate_firewall_cache()
         self._show_message(stdscr, "Allow Port", msg, not success)
     
     def _firewall_deny_port(self, stdscr):
@@ -1752,6 +2137,7 @@ class TerminalUI:
             return
         
         success, msg = self.manager.firewall.deny_port(port, protocol)
+        self._invalidate_firewall_cache()
         self._show_message(stdscr, "Deny Port", msg, not success)
     
     def _firewall_limit_port(self, stdscr):
@@ -1776,11 +2162,12 @@ class TerminalUI:
             return
         
         success, msg = self.manager.firewall.limit_port(port, protocol)
+        self._invalidate_firewall_cache()
         self._show_message(stdscr, "Limit Port", msg, not success)
     
     def _firewall_delete_rule(self, stdscr):
         """Delete a firewall rule"""
-        success, rules = self.manager.firewall.list_rules()
+        success, rules = self._firewall_rules()
         if not success or not rules:
             self._show_message(stdscr, "Delete Rule", "No rules to delete")
             return
@@ -1792,6 +2179,7 @@ class TerminalUI:
             rule = rules[selection]
             if self._confirm_action(stdscr, f"Delete rule {rule.number}?\n\n{rule}"):
                 success, msg = self.manager.firewall.delete_rule(rule.number)
+                self._invalidate_firewall_cache()
                 self._show_message(stdscr, "Delete Rule", msg, not success)
     
     def _firewall_allow_ip(self, stdscr):
@@ -1805,6 +2193,7 @@ class TerminalUI:
             return
         
         success, msg = self.manager.firewall.allow_from_ip(ip)
+        self._invalidate_firewall_cache()
         self._show_message(stdscr, "Allow IP", msg, not success)
     
     def _firewall_deny_ip(self, stdscr):
@@ -1818,87 +2207,103 @@ class TerminalUI:
             return
         
         success, msg = self.manager.firewall.deny_from_ip(ip)
+        self._invalidate_firewall_cache()
         self._show_message(stdscr, "Deny IP", msg, not success)
     
     def _firewall_list_rules(self, stdscr):
         """List all firewall rules"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Firewall Rules")
-        stdscr.addstr(2, 2, "=" * 14)
-        
-        success, rules = self.manager.firewall.list_rules()
+        success, rules = self._firewall_rules()
         
-        if not success or not rules:
-            stdscr.addstr(4, 2, "No rules configured")
-        else:
-            stdscr.addstr(4, 2, f"Total Rules: {len(rules)}")
-            stdscr.addstr(5, 2, "-" * 60)
-            
-            for i, rule in enumerate(rules[:curses.LINES - 10]):
-                stdscr.addstr(6 + i, 2, str(rule)[:curses.COLS - 4])
+        # Rule count plus first/last rule number (and the screen size) identify the listing
+        sig = ((len(rules), rules[0].number, rules[-1].number) if success and rules else (0,),
+               curses.LINES, curses.COLS)
+        reuse = self._rules_view is not None and self._rules_view[0] == sig
         
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        self._wait_for_input(stdscr)
+        with self._overlay(stdscr, self._rules_view[1] if reuse else None) as win:
+            if not reuse:
+                win.addstr(1, 2, "Firewall Rules")
+                win.addstr(2, 2, "=" * 14)
+                
+                if not success or not rules:
+                    win.addstr(4, 2, "No rules configured")
+                else:
+                    win.addstr(4, 2, f"Total Rules: {len(rules)}")
+                    win.addstr(5, 2, "-" * 60)
+                    
+                    max_width = curses.COLS - 4
+                    for i, rule in enumerate(rules[:curses.LINES - 10]):
+                        win.addstr(6 + i, 2, str(rule)[:max_width])
+                
+                win.addstr(curses.LINES - 2, 2, "Press any key to continue...")
+                self._rules_view = (sig, win)
+            self._wait_for_input(win)
     
     def _security_scanner(self, stdscr):
         """Security scanning and hardening"""
-        menu_items = [
-            "Run Security Scan",
-            "View Last Scan Results",
-            "Apply Security Headers (Domain)",
-            "View Security Score",
-            "Export Security Report",
-            "Back to Main Menu"
-        ]
+        menu_items = SECURITY_MENU
+        # One handler per SECURITY_MENU entry, None for Back
+        handlers = (
+            self._security_run_scan,
+            self._security_view_results,
+            self._security_apply_headers,
+            self._security_view_score,
+            self._security_export_report,
+            None,
+        )
+        # Bind key codes once; they are compared on every keystroke
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
         
         current_selection = 0
+        start_y = 6
+        repaint = True
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, "Security Scanner")
-            stdscr.addstr(2, 2, "=" * 16)
-            
-            # Show security score if available
-            if hasattr(self.manager.security, 'issues') and self.manager.security.issues:
-                score = self.manager.security.get_security_score()
-                score_color = curses.A_NORMAL
-                if score < 50:
-                    score_color = curses.A_BOLD
-                stdscr.addstr(4, 2, f"Security Score: ", curses.A_BOLD)
-                stdscr.addstr(4, 18, f"{score}/100", score_color)
-            
-            # Draw menu
-            start_y = 6
-            for i, item in enumerate(menu_items):
-                if i == current_selection:
-                    stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(start_y + i, 4, f"  {item}")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select, ESC to go back")
-            stdscr.refresh()
+            if self._show_background_messages(stdscr):
+                repaint = True
+            if repaint:
+                stdscr.erase()
+                stdscr.addstr(1, 2, "Security Scanner")
+                stdscr.addstr(2, 2, "=" * 16)
+                
+                # Show security score if available
+                if self.manager.security.issues:
+                    score = self.manager.security.get_security_score()
+                    score_color = curses.A_NORMAL
+                    if score < 50:
+                        score_color = curses.A_BOLD
+                    self._kv(stdscr, 4, 2, "Security Score: ", f"{score}/100", score_color)
+                
+                # Draw menu
+                for i, item in enumerate(menu_items):
+                    if i == current_selection:
+                        stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
+                    else:
+                        stdscr.addstr(start_y + i, 4, f"  {item}")
+                
+                stdscr.addstr(curses.LINES - 2, 2, SUBMENU_FOOTER)
+                repaint = False
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
-            if key == curses.KEY_UP and current_selection > 0:
+            if key == key_up and current_selection > 0:
                 current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < len(menu_items) - 1:
+                self._draw_menu_selection(stdscr, menu_items, current_selection + 1, current_selection, start_y)
+            elif key == key_down and current_selection < len(menu_items) - 1:
                 current_selection += 1
+                self._draw_menu_selection(stdscr, menu_items, current_selection - 1, current_selection, start_y)
             elif key == ord('\n') or key == ord(' '):
-                if current_selection == 0:  # Run Scan
-                    self._security_run_scan(stdscr)
-                elif current_selection == 1:  # View Results
-                    self._security_view_results(stdscr)
-                elif current_selection == 2:  # Apply Headers
-                    self._security_apply_headers(stdscr)
-                elif current_selection == 3:  # View Score
-                    self._security_view_score(stdscr)
-                elif current_selection == 4:  # Export Report
-                    self._security_export_report(stdscr)
-                elif current_selection == 5:  # Back
+                # Every action takes over the screen
+                repaint = True
+                handler = handlers[current_selection]
+                if handler is None:  # Back
                     break
+                handler(stdscr)
             elif key == 27:  # ESC
                 break
+            elif key == key_resize:
+                curses.update_lines_cols()
+                repaint = True
     
     def _security_run_scan(self, stdscr):
         """Run security scan"""
@@ -1915,7 +2320,7 @@ class TerminalUI:
         stdscr.addstr(1, 2, "Security Scan Complete", curses.A_BOLD)
         stdscr.addstr(2, 2, "=" * 22)
         
-        grouped = self.manager.security.get_issues_by_severity()
+        counts = self._severity_counts()
         score = self.manager.security.get_security_score()
         
         y = 4
@@ -1924,10 +2329,7 @@ class TerminalUI:
         stdscr.addstr(y, 2, f"Total Issues: {len(issues)}")
         y += 2
         
-        from .security import SecurityIssue
-        for severity in [SecurityIssue.SEVERITY_CRITICAL, SecurityIssue.SEVERITY_HIGH,
-                        SecurityIssue.SEVERITY_MEDIUM, SecurityIssue.SEVERITY_LOW]:
-            count = len(grouped[severity])
+        for severity, count in zip(SCORE_SEVERITIES, counts):
             if count > 0:
                 stdscr.addstr(y, 2, f"{severity}: {count}")
                 y += 1
@@ -1938,58 +2340,60 @@ class TerminalUI:
         # Show detailed results
         self._security_view_results(stdscr)
     
+    def _severity_counts(self) -> tuple:
+        """Issue count per SCORE_SEVERITIES entry, computed once per scan result"""
+        issues = self.manager.security.issues
+        cached = self._scan_counts
+        if cached is None or cached[0] is not issues:
+            grouped = self.manager.security.get_issues_by_severity()
+            cached = self._scan_counts = (issues, tuple(len(grouped.get(s, ())) for s in SCORE_SEVERITIES))
+        return cached[1]
+    
     def _security_view_results(self, stdscr):
         """View security scan results"""
-        if not hasattr(self.manager.security, 'issues') or not self.manager.security.issues:
+        if not self.manager.security.issues:
             self._show_message(stdscr, "Security Scan", "No scan results available. Run a scan first.")
             return
         
         issues = self.manager.security.issues
         current_issue = 0
+        # Wrapped descriptions for this visit, so paging back and forth doesn't re-wrap
+        self._wrap_cache.clear()
+        
+        # Rows drawn for the previous issue; only rows that differ are rewritten
+        prev_frame = {}
+        stdscr.erase()
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, f"Security Issues ({current_issue + 1}/{len(issues)})")
-            stdscr.addstr(2, 2, "=" * 40)
-            
             issue = issues[current_issue]
             
-            y = 4
-            stdscr.addstr(y, 2, f"Severity: {issue.severity}", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, f"Category: {issue.category}")
-            y += 2
-            stdscr.addstr(y, 2, f"Title:", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, issue.title)
-            y += 2
-            stdscr.addstr(y, 2, f"Description:", curses.A_BOLD)
-            y += 1
-            
             # Wrap description
-            desc_lines = []
-            words = issue.description.split()
-            current_line = ""
-            for word in words:
-                if len(current_line + word) < curses.COLS - 6:
-                    current_line += word + " "
-                else:
-                    desc_lines.append(current_line)
-                    current_line = word + " "
-            if current_line:
-                desc_lines.append(current_line)
-            
+            wrap_key = (id(issue), curses.COLS)
+            desc_lines = self._wrap_cache.get(wrap_key)
+            if desc_lines is None:
+                desc_lines = self._wrap_cache[wrap_key] = textwrap.wrap(issue.description, curses.COLS - 6)
+            
+            # y -> (x, text, attr)
+            frame = {
+                1: (2, f"Security Issues ({current_issue + 1}/{len(issues)})", curses.A_NORMAL),
+                2: (2, "=" * 40, curses.A_NORMAL),
+                4: (2, f"Severity: {issue.severity}", curses.A_BOLD),
+                5: (2, f"Category: {issue.category}", curses.A_NORMAL),
+                7: (2, "Title:", curses.A_BOLD),
+                8: (2, issue.title, curses.A_NORMAL),
+                10: (2, "Description:", curses.A_BOLD),
+            }
+            y = 11
             for line in desc_lines:
-                stdscr.addstr(y, 2, line)
+                frame[y] = (2, line, curses.A_NORMAL)
                 y += 1
+            frame[y + 1] = (2, "Recommendation:", curses.A_BOLD)
+            frame[y + 2] = (2, issue.recommendation, curses.A_NORMAL)
+            frame[curses.LINES - 2] = (2, "Left/Right: Navigate | ESC/Q: Back", curses.A_NORMAL)
             
-            y += 1
-            stdscr.addstr(y, 2, f"Recommendation:", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, issue.recommendation)
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Left/Right: Navigate | ESC/Q: Back")
-            stdscr.refresh()
+            self._paint_frame(stdscr, frame, prev_frame)
+            prev_frame = frame
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
@@ -1997,6 +2401,10 @@ class TerminalUI:
                 current_issue -= 1
             elif key == curses.KEY_RIGHT and current_issue < len(issues) - 1:
                 current_issue += 1
+            elif key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                stdscr.erase()
+                prev_frame = {}
             elif key == 27 or key == ord('q'):
                 break
     
@@ -2013,130 +2421,140 @@ class TerminalUI:
             domain_name = domain_names[selection]
             
             if self._confirm_action(stdscr, f"Apply security headers to {domain_name}?"):
-                from .security import SecurityHardening
                 hardening = SecurityHardening(self.manager)
                 success, msg = hardening.apply_nginx_security_headers(domain_name)
                 self._show_message(stdscr, "Apply Headers", msg, not success)
     
     def _security_view_score(self, stdscr):
         """View security score breakdown"""
-        if not hasattr(self.manager.security, 'issues'):
-            self._show_message(stdscr, "Security Score", "Run a security scan first")
-            return
-        
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Security Score Breakdown")
-        stdscr.addstr(2, 2, "=" * 24)
-        
-        score = self.manager.security.get_security_score()
-        grouped = self.manager.security.get_issues_by_severity()
-        
-        y = 4
-        stdscr.addstr(y, 2, f"Overall Score: {score}/100", curses.A_BOLD)
-        y += 2
-        
-        from .security import SecurityIssue
-        stdscr.addstr(y, 2, "Issues by Severity:")
-        y += 1
-        
-        for severity in [SecurityIssue.SEVERITY_CRITICAL, SecurityIssue.SEVERITY_HIGH,
-                        SecurityIssue.SEVERITY_MEDIUM, SecurityIssue.SEVERITY_LOW]:
-            count = len(grouped[severity])
-            stdscr.addstr(y, 4, f"{severity}: {count}")
+        with self._overlay(stdscr) as win:
+            win.addstr(1, 2, "Security Score Breakdown")
+            win.addstr(2, 2, "=" * 24)
+            
+            score = self.manager.security.get_security_score()
+            counts = self._severity_counts()
+            
+            y = 4
+            win.addstr(y, 2, f"Overall Score: {score}/100", curses.A_BOLD)
+            y += 2
+            
+            win.addstr(y, 2, "Issues by Severity:")
             y += 1
-        
-        y += 1
-        stdscr.addstr(y, 2, "Score Interpretation:")
-        y += 1
-        stdscr.addstr(y, 4, "90-100: Excellent security posture")
-        y += 1
-        stdscr.addstr(y, 4, "70-89:  Good, minor improvements needed")
-        y += 1
-        stdscr.addstr(y, 4, "50-69:  Fair, several issues to address")
-        y += 1
-        stdscr.addstr(y, 4, "0-49:   Poor, immediate action required")
-        
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        self._wait_for_input(stdscr)
+            
+            for severity, count in zip(SCORE_SEVERITIES, counts):
+                win.addstr(y, 4, f"{severity}: {count}")
+                y += 1
+            
+            y += 1
+            win.addstr(y, 2, "Score Interpretation:")
+            y += 1
+            win.addstr(y, 4, "90-100: Excellent security posture")
+            y += 1
+            win.addstr(y, 4, "70-89:  Good, minor improvements needed")
+            y += 1
+            win.addstr(y, 4, "50-69:  Fair, several issues to address")
+            y += 1
+            win.addstr(y, 4, "0-49:   Poor, immediate action required")
+            
+            win.addstr(curses.LINES - 2, 2, "Press any key to continue...")
+            self._wait_for_input(win)
     
     def _security_export_report(self, stdscr):
         """Export security report to file"""
-        if not hasattr(self.manager.security, 'issues'):
-            self._show_message(stdscr, "Export Report", "Run a security scan first")
-            return
-        
         report = self.manager.security.generate_report()
         report_file = MANAGER_DIR / f"security_report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         
+        # The file write happens off the UI thread; its outcome is posted to _bg_msgs
+        threading.Thread(target=self._write_report_bg, args=(report, report_file), daemon=True).start()
+        self._show_message(stdscr, "Export Report", f"Writing report to:\n{report_file}")
+    
+    def _write_report_bg(self, report: str, report_file):
+        """Write a security report, then queue the result for the UI thread to show"""
         try:
             with open(report_file, 'w') as f:
                 f.write(report)
-            self._show_message(stdscr, "Export Report", f"Report saved to:\n{report_file}")
+            self._bg_msgs.put(("Export Report", f"Report saved to:\n{report_file}", False))
         except Exception as e:
-            self._show_message(stdscr, "Error", f"Failed to export report: {e}", True)
+            self._bg_msgs.put(("Error", f"Failed to export report: {e}", True))
+    
+    def _show_background_messages(self, stdscr) -> bool:
+        """Show any results posted by background work; True if a dialog was shown"""
+        shown = False
+        while True:
+            try:
+                title, message, is_error = self._bg_msgs.get_nowait()
+            except queue.Empty:
+                return shown
+            self._show_message(stdscr, title, message, is_error)
+            shown = True
     
     def _alerts_monitoring(self, stdscr):
         """Alerts and monitoring menu"""
-        menu_items = [
-            "View Active Alerts",
-            "Run All Checks Now",
-            "Acknowledge Alert",
-            "Clear Old Alerts",
-            "Configure Notifications",
-            "Test Notification",
-            "Back to Main Menu"
-        ]
+        menu_items = ALERTS_MENU
+        # One handler per ALERTS_MENU entry, None for Back
+        handlers = (
+            self._alerts_view_active,
+            self._alerts_run_checks,
+            self._alerts_acknowledge,
+            self._alerts_clear_old,
+            self._alerts_configure_notifications,
+            self._alerts_test_notification,
+            None,
+        )
+        # Bind key codes once; they are compared on every keystroke
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
         
         current_selection = 0
+        start_y = 6
+        repaint = True
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, "Alerts & Monitoring")
-            stdscr.addstr(2, 2, "=" * 19)
-            
-            # Show alert count
-            unack_alerts = self.manager.alerts.get_unacknowledged_alerts()
-            alert_count = len(unack_alerts)
-            
-            if alert_count > 0:
-                stdscr.addstr(4, 2, f"Unacknowledged Alerts: {alert_count}", curses.A_BOLD)
-            else:
-                stdscr.addstr(4, 2, "No active alerts")
-            
-            # Draw menu
-            start_y = 6
-            for i, item in enumerate(menu_items):
-                if i == current_selection:
-                    stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
+            if repaint:
+                stdscr.erase()
+                stdscr.addstr(1, 2, "Alerts & Monitoring")
+                stdscr.addstr(2, 2, "=" * 19)
+                
+                # Show alert count
+                unack_alerts = self.manager.alerts.get_unacknowledged_alerts()
+                alert_count = len(unack_alerts)
+                
+                if alert_count > 0:
+                    stdscr.addstr(4, 2, f"Unacknowledged Alerts: {alert_count}", curses.A_BOLD)
                 else:
-                    stdscr.addstr(start_y + i, 4, f"  {item}")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select, ESC to go back")
-            stdscr.refresh()
+                    stdscr.addstr(4, 2, "No active alerts")
+                
+                # Draw menu
+                for i, item in enumerate(menu_items):
+                    if i == current_selection:
+                        stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
+                    else:
+                        stdscr.addstr(start_y + i, 4, f"  {item}")
+                
+                self._draw_notice(stdscr)
+                stdscr.addstr(curses.LINES - 2, 2, SUBMENU_FOOTER)
+                repaint = False
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
-            if key == curses.KEY_UP and current_selection > 0:
+            if key == key_up and current_selection > 0:
                 current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < len(menu_items) - 1:
+                self._draw_menu_selection(stdscr, menu_items, current_selection + 1, current_selection, start_y)
+            elif key == key_down and current_selection < len(menu_items) - 1:
                 current_selection += 1
+                self._draw_menu_selection(stdscr, menu_items, current_selection - 1, current_selection, start_y)
             elif key == ord('\n') or key == ord(' '):
-                if current_selection == 0:  # View Alerts
-                    self._alerts_view_active(stdscr)
-                elif current_selection == 1:  # Run Checks
-                    self._alerts_run_checks(stdscr)
-                elif current_selection == 2:  # Acknowledge
-                    self._alerts_acknowledge(stdscr)
-                elif current_selection == 3:  # Clear Old
-                    self._alerts_clear_old(stdscr)
-                elif current_selection == 4:  # Configure
-                    self._alerts_configure_notifications(stdscr)
-                elif current_selection == 5:  # Test
-                    self._alerts_test_notification(stdscr)
-                elif current_selection == 6:  # Back
+                # Every action takes over the screen
+                repaint = True
+                handler = handlers[current_selection]
+                if handler is None:  # Back
                     break
+                handler(stdscr)
             elif key == 27:  # ESC
                 break
+            elif key == key_resize:
+                curses.update_lines_cols()
+                repaint = True
     
     def _alerts_view_active(self, stdscr):
         """View active alerts"""
@@ -2147,64 +2565,76 @@ class TerminalUI:
             return
         
         current_alert = 0
+        # Rows drawn for the previous alert; only rows that differ are rewritten
+        prev_frame, drawn_state = {}, None
+        stdscr.erase()
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, f"Active Alerts ({current_alert + 1}/{len(alerts)})")
-            stdscr.addstr(2, 2, "=" * 40)
-            
-            alert = alerts[current_alert]
-            
-            y = 4
-            stdscr.addstr(y, 2, f"Level: {alert.level.value.upper()}", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, f"Type: {alert.alert_type.value}")
-            y += 1
-            stdscr.addstr(y, 2, f"Time: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            y += 2
-            stdscr.addstr(y, 2, f"Title:", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, alert.title)
-            y += 2
-            stdscr.addstr(y, 2, f"Message:", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, alert.message)
-            
-            if alert.details:
-                y += 2
-                stdscr.addstr(y, 2, f"Details:", curses.A_BOLD)
-                y += 1
-                for key, value in alert.details.items():
-                    stdscr.addstr(y, 4, f"{key}: {value}")
-                    y += 1
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Left/Right: Navigate | A: Acknowledge | ESC/Q: Back")
-            stdscr.refresh()
+            state = (current_alert, len(alerts))
+            # Keys that changed nothing (unmapped keys, scrolling past an end) skip the frame entirely
+            if state != drawn_state:
+                alert = alerts[current_alert]
+                
+                # y -> (x, text, attr)
+                frame = {
+                    1: (2, f"Active Alerts ({current_alert + 1}/{len(alerts)})", curses.A_NORMAL),
+                    2: (2, "=" * 40, curses.A_NORMAL),
+                    4: (2, f"Level: {alert.level.value.upper()}", curses.A_BOLD),
+                    5: (2, f"Type: {alert.alert_type.value}", curses.A_NORMAL),
+                    6: (2, f"Time: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S')}", curses.A_NORMAL),
+                    8: (2, "Title:", curses.A_BOLD),
+                    9: (2, alert.title, curses.A_NORMAL),
+                    11: (2, "Message:", curses.A_BOLD),
+                    12: (2, alert.message, curses.A_NORMAL),
+                }
+                if alert.details:
+                    frame[14] = (2, "Details:", curses.A_BOLD)
+                    for y, (name, value) in enumerate(alert.details.items(), 15):
+                        frame[y] = (4, f"{name}: {value}", curses.A_NORMAL)
+                frame[curses.LINES - 2] = (2, "Left/Right: Navigate | A: Acknowledge | ESC/Q: Back", curses.A_NORMAL)
+                
+                self._paint_frame(stdscr, frame, prev_frame)
+                prev_frame = frame
+                self._flush(stdscr)
+                drawn_at = time.monotonic()
+                drawn_state = state
             
             key = stdscr.getch()
             
-            if key == curses.KEY_LEFT and current_alert > 0:
-                current_alert -= 1
-            elif key == curses.KEY_RIGHT and current_alert < len(alerts) - 1:
-                current_alert += 1
+            if key in HORIZONTAL_KEYS:
+                # Apply every arrow press queued behind this one, then draw once
+                for key in [key] + self._drain_keys(stdscr, HORIZONTAL_KEYS, drawn_at):
+                    if key == curses.KEY_LEFT:
+                        current_alert = max(0, current_alert - 1)
+                    else:
+                        current_alert = min(len(alerts) - 1, current_alert + 1)
             elif key == ord('a') or key == ord('A'):
                 self.manager.alerts.acknowledge_alert(alert)
-                alerts = self.manager.alerts.get_unacknowledged_alerts()
+                # Only this alert left the unacknowledged set; drop it rather than refetching
+                alerts.pop(current_alert)
                 if not alerts:
-                    self._show_message(stdscr, "Alerts", "All alerts acknowledged")
+                    self._notify("All alerts acknowledged")
                     break
                 current_alert = min(current_alert, len(alerts) - 1)
             elif key == 27 or key == ord('q'):
                 break
+            elif key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                stdscr.erase()
+                prev_frame, drawn_state = {}, None
     
     def _alerts_run_checks(self, stdscr):
         """Run all monitoring checks"""
         stdscr.clear()
         stdscr.addstr(1, 2, "Running Monitoring Checks...", curses.A_BOLD)
-        stdscr.addstr(3, 2, "Please wait...")
-        stdscr.refresh()
         
-        self.manager.alerts.run_all_checks()
+        # A run the user stopped waiting for keeps going; wait on it rather than start a second one
+        if self._checks_future is None or self._checks_future.done():
+            self._checks_future = self._start_worker(self.manager.alerts.run_all_checks)
+        
+        finished, _ = self._run_with_spinner(stdscr, self._checks_future, 3, "Please wait...")
+        if not finished:
+            return
         
         new_alerts = self.manager.alerts.get_unacknowledged_alerts()
         self._show_message(stdscr, "Monitoring Checks", 
@@ -2223,7 +2653,7 @@ class TerminalUI:
         
         if selection is not None:
             self.manager.alerts.acknowledge_alert(alerts[selection])
-            self._show_message(stdscr, "Acknowledge", "Alert acknowledged")
+            self._notify("Alert acknowledged")
     
     def _alerts_clear_old(self, stdscr):
         """Clear old acknowledged alerts"""
@@ -2249,8 +2679,6 @@ class TerminalUI:
     
     def _alerts_test_notification(self, stdscr):
         """Send test notification"""
-        from .alerts import Alert, AlertType, AlertLevel
-        
         test_alert = Alert(
             AlertType.SYSTEM_UPDATE,
             AlertLevel.INFO,
@@ -2283,98 +2711,111 @@ class TerminalUI:
                              f"{msg}\n\nInstall with: curl -fsSL https://get.docker.com | sh", True)
             return
         
-        menu_items = [
-            "List Running Containers",
-            "Auto-Configure Container",
-            "Scan & Suggest Configs",
-            "Container Details",
-            "Container Logs",
-            "Start Container",
-            "Stop Container",
-            "Restart Container",
-            "Back to Main Menu"
-        ]
+        # Containers changed outside this UI drop the cached listings as it happens
+        self.manager.docker.watch_events(self._on_docker_event)
+        
+        menu_items = DOCKER_MENU
+        # One handler per DOCKER_MENU entry, None for Back
+        handlers = (
+            self._docker_list_containers,
+            self._docker_auto_configure,
+            self._docker_scan_suggest,
+            self._docker_container_details,
+            self._docker_container_logs,
+            self._docker_start_container,
+            self._docker_stop_container,
+            self._docker_restart_container,
+            None,
+        )
+        # Bind key codes once; they are compared on every keystroke
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
         
         current_selection = 0
+        start_y = 6
+        repaint = True
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, "Docker Integration")
-            stdscr.addstr(2, 2, "=" * 17)
-            
-            # Show Docker version
-            success, version = self.manager.docker.get_version()
-            if success:
-                stdscr.addstr(4, 2, f"Docker: {version}")
-            
-            # Draw menu
-            start_y = 6
-            for i, item in enumerate(menu_items):
-                if i == current_selection:
-                    stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(start_y + i, 4, f"  {item}")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Use Up/Down to navigate, Enter to select, ESC to go back")
-            stdscr.refresh()
+            if repaint:
+                stdscr.erase()
+                stdscr.addstr(1, 2, "Docker Integration")
+                stdscr.addstr(2, 2, "=" * 17)
+                
+                # Show Docker version
+                success, version = self._cached('docker_version', DOCKER_VERSION_TTL, self.manager.docker.get_version)
+                if success:
+                    stdscr.addstr(4, 2, f"Docker: {version}")
+                
+                # Draw menu
+                for i, item in enumerate(menu_items):
+                    if i == current_selection:
+                        stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
+                    else:
+                        stdscr.addstr(start_y + i, 4, f"  {item}")
+                
+                self._draw_notice(stdscr)
+                stdscr.addstr(curses.LINES - 2, 2, SUBMENU_FOOTER)
+                repaint = False
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
-            if key == curses.KEY_UP and current_selection > 0:
+            if key == key_up and current_selection > 0:
                 current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < len(menu_items) - 1:
+                self._draw_menu_selection(stdscr, menu_items, current_selection + 1, current_selection, start_y)
+            elif key == key_down and current_selection < len(menu_items) - 1:
                 current_selection += 1
+                self._draw_menu_selection(stdscr, menu_items, current_selection - 1, current_selection, start_y)
             elif key == ord('\n') or key == ord(' '):
-                if current_selection == 0:  # List Containers
-                    self._docker_list_containers(stdscr)
-                elif current_selection == 1:  # Auto-Configure
-                    self._docker_auto_configure(stdscr)
-                elif current_selection == 2:  # Scan & Suggest
-                    self._docker_scan_suggest(stdscr)
-                elif current_selection == 3:  # Container Details
-                    self._docker_container_details(stdscr)
-                elif current_selection == 4:  # Container Logs
-                    self._docker_container_logs(stdscr)
-                elif current_selection == 5:  # Start
-                    self._docker_start_container(stdscr)
-                elif current_selection == 6:  # Stop
-                    self._docker_stop_container(stdscr)
-                elif current_selection == 7:  # Restart
-                    self._docker_restart_container(stdscr)
-                elif current_selection == 8:  # Back
+                # Every action takes over the screen
+                repaint = True
+                handler = handlers[current_selection]
+                if handler is None:  # Back
                     break
+                handler(stdscr)
             elif key == 27:  # ESC
                 break
+            elif key == key_resize:
+                curses.update_lines_cols()
+                repaint = True
+    
+    def _list_containers(self, all_containers: bool = False):
+        """docker ps, shared between the container screens for a few seconds"""
+        return self._cached(('containers', all_containers), CONTAINERS_CACHE_TTL,
+                            partial(self.manager.docker.list_containers, all_containers=all_containers))
+    
+    def _invalidate_containers(self):
+        """Forget cached listings after a container changed state"""
+        self._invalidate_cached(('containers', False), ('containers', True))
+    
+    def _on_docker_event(self, event: dict):
+        """Daemon event stream callback; runs on the docker event thread"""
+        self._invalidate_containers()
+        self._invalidate_cached('docker_suggestions')
     
     def _docker_list_containers(self, stdscr):
         """List Docker containers"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Docker Containers")
-        stdscr.addstr(2, 2, "=" * 17)
-        
-        success, containers = self.manager.docker.list_containers()
-        
-        if not success or not containers:
-            stdscr.addstr(4, 2, "No running containers found")
-        else:
-            stdscr.addstr(4, 2, f"Name".ljust(20) + "Image".ljust(25) + "Status".ljust(15) + "Ports")
-            stdscr.addstr(5, 2, "-" * 75)
-            
-            for i, container in enumerate(containers[:curses.LINES - 10]):
-                name = container.name[:19]
-                image = container.image[:24]
-                status = container.status[:14]
-                ports = str(container.get_external_port() or "") or "-"
+        with self._overlay(stdscr) as win:
+            win.addstr(1, 2, "Docker Containers")
+            win.addstr(2, 2, "=" * 17)
+            
+            success, containers = self._list_containers()
+            
+            if not success or not containers:
+                win.addstr(4, 2, "No running containers found")
+            else:
+                win.addstr(4, 2, CONTAINER_HEADER)
+                win.addstr(5, 2, "-" * 75)
                 
-                line = f"{name.ljust(20)}{image.ljust(25)}{status.ljust(15)}{ports}"
-                stdscr.addstr(6 + i, 2, line[:curses.COLS - 4])
-        
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        self._wait_for_input(stdscr)
+                max_width = curses.COLS - 4
+                for y, container in enumerate(itertools.islice(containers, curses.LINES - 10), 6):
+                    win.addstr(y, 2, container.list_row[:max_width])
+            
+            win.addstr(curses.LINES - 2, 2, "Press any key to continue...")
+            self._wait_for_input(win)
     
     def _docker_auto_configure(self, stdscr):
         """Auto-configure NGINX for a Docker container"""
-        success, containers = self.manager.docker.list_containers()
+        success, containers = self._list_containers()
         
         if not success or not containers:
             self._show_message(stdscr, "Auto-Configure", "No running containers found")
@@ -2390,7 +2831,7 @@ class TerminalUI:
         
         stdscr.clear()
         stdscr.addstr(1, 2, f"Auto-Configure: {container_name}")
-        stdscr.addstr(2, 2, "=" * (16 + len(container_name)))
+        stdscr.addstr(2, 2, _hr(16 + len(container_name)))
         
         # Get domain
         suggested_domain = f"{container_name}.example.com"
@@ -2410,17 +2851,19 @@ class TerminalUI:
         stdscr.refresh()
         
         success, msg = self.manager.docker.auto_configure_container(container_name, domain, ssl_enabled)
+        if success:
+            self._invalidate_cached('docker_suggestions')  # The container now counts as configured
         self._show_message(stdscr, "Auto-Configure", msg, not success)
     
     def _docker_scan_suggest(self, stdscr):
         """Scan containers and suggest configurations"""
-        stdscr.clear()
-        stdscr.addstr(1, 2, "Scanning Docker Containers...")
-        stdscr.refresh()
-        
-        suggestions = self.manager.docker.scan_and_suggest_configs()
+        finished, rows = self._cached('docker_suggestions', SUGGESTIONS_CACHE_TTL,
+                                      partial(self._scan_suggestion_rows, stdscr))
+        if not finished:
+            self._invalidate_cached('docker_suggestions')
+            return
         
-        if not suggestions:
+        if not rows:
             self._show_message(stdscr, "Scan Results", "No web containers found")
             return
         
@@ -2428,24 +2871,39 @@ class TerminalUI:
         stdscr.addstr(1, 2, "Configuration Suggestions")
         stdscr.addstr(2, 2, "=" * 25)
         
+        # Each suggestion takes four rows plus a gap; show as many as fit above the footer
         y = 4
-        for i, sug in enumerate(suggestions[:curses.LINES - 10]):
-            configured = "[OK] Configured" if sug['already_configured'] else "[ ] Not Configured"
-            stdscr.addstr(y, 2, f"{i + 1}. {sug['container_name']}")
-            y += 1
-            stdscr.addstr(y, 4, f"Image: {sug['image'][:40]}")
-            y += 1
-            stdscr.addstr(y, 4, f"Suggested Domain: {sug['suggested_domain']}")
-            y += 1
-            stdscr.addstr(y, 4, f"Port: {sug['port']} | {configured}")
-            y += 2
+        for row in itertools.islice(rows, (curses.LINES - 6) // 5):
+            stdscr.addstr(y, 2, row[0])
+            stdscr.addstr(y + 1, 4, row[1])
+            stdscr.addstr(y + 2, 4, row[2])
+            stdscr.addstr(y + 3, 4, row[3])
+            y += 5
         
         stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
         self._wait_for_input(stdscr)
     
+    def _scan_suggestion_rows(self, stdscr):
+        """Run the container scan behind a spinner; (finished, one tuple of display lines per suggestion)"""
+        stdscr.clear()
+        stdscr.addstr(1, 2, "Scanning Docker Containers...")
+        
+        finished, suggestions = self._run_with_spinner(stdscr, self.manager.docker.scan_and_suggest_configs,
+                                                       3, "Please wait...")
+        if not finished:
+            return False, None
+        
+        return True, [
+            (f"{i}. {sug['container_name']}",
+             f"Image: {sug['image'][:40]}",
+             f"Suggested Domain: {sug['suggested_domain']}",
+             f"Port: {sug['port']} | {'[OK] Configured' if sug['already_configured'] else '[ ] Not Configured'}")
+            for i, sug in enumerate(suggestions, 1)
+        ]
+    
     def _docker_container_details(self, stdscr):
         """View container details"""
-        success, containers = self.manager.docker.list_containers(all_containers=True)
+        success, containers = self._list_containers(all_containers=True)
         
         if not success or not containers:
             self._show_message(stdscr, "Container Details", "No containers found")
@@ -2459,36 +2917,36 @@ class TerminalUI:
         
         container = containers[selection]
         
-        stdscr.clear()
-        stdscr.addstr(1, 2, f"Container: {container.name}")
-        stdscr.addstr(2, 2, "=" * (11 + len(container.name)))
-        
-        y = 4
-        stdscr.addstr(y, 2, f"ID: {container.container_id}")
-        y += 1
-        stdscr.addstr(y, 2, f"Image: {container.image}")
-        y += 1
-        stdscr.addstr(y, 2, f"Status: {container.status}")
-        y += 2
-        
-        if container.ports:
-            stdscr.addstr(y, 2, "Port Mappings:")
+        with self._overlay(stdscr) as win:
+            win.addstr(1, 2, f"Container: {container.name}")
+            win.addstr(2, 2, _hr(11 + len(container.name)))
+            
+            y = 4
+            win.addstr(y, 2, f"ID: {container.container_id}")
             y += 1
-            for internal, external in container.ports.items():
-                stdscr.addstr(y, 4, f"{external} -> {internal}")
-                y += 1
-        
-        ip = self.manager.docker.get_container_ip(container.name)
-        if ip:
+            win.addstr(y, 2, f"Image: {container.image}")
             y += 1
-            stdscr.addstr(y, 2, f"IP Address: {ip}")
-        
-        stdscr.addstr(curses.LINES - 2, 2, "Press any key to continue...")
-        self._wait_for_input(stdscr)
+            win.addstr(y, 2, f"Status: {container.status}")
+            y += 2
+            
+            if container.ports:
+                win.addstr(y, 2, "Port Mappings:")
+                y += 1
+                for internal, external in container.ports.items():
+                    win.addstr(y, 4, f"{external} -> {internal}")
+                    y += 1
+            
+            ip = self.manager.docker.get_container_ip(container.name)
+            if ip:
+                y += 1
+                win.addstr(y, 2, f"IP Address: {ip}")
+            
+            win.addstr(curses.LINES - 2, 2, "Press any key to continue...")
+            self._wait_for_input(win)
     
     def _docker_container_logs(self, stdscr):
         """View container logs"""
-        success, containers = self.manager.docker.list_containers()
+        success, containers = self._list_containers()
         
         if not success or not containers:
             self._show_message(stdscr, "Container Logs", "No running containers found")
@@ -2506,46 +2964,75 @@ class TerminalUI:
         stdscr.addstr(1, 2, f"Loading logs for {container_name}...")
         stdscr.refresh()
         
-        success, logs = self.manager.docker.get_container_logs(container_name, lines=100)
-        
-        if not success:
-            self._show_message(stdscr, "Error", logs, True)
+        # Follow the container so new lines arrive without running docker logs again
+        try:
+            log_proc, snapshot = self._follow_output(["docker", "logs", "-f", "--tail", "100", container_name])
+        except OSError as e:
+            self._show_message(stdscr, "Error", f"Failed to get logs: {e}", True)
             return
         
-        # Display logs
-        lines = logs.split('\n')
-        current_line = max(0, len(lines) - (curses.LINES - 6))
+        try:
+            self._browse_container_logs(stdscr, container_name, snapshot)
+        finally:
+            log_proc.terminate()
+            log_proc.wait()
+    
+    def _browse_container_logs(self, stdscr, container_name: str, snapshot):
+        """Scroll through a followed container log; 'r' jumps to the newest lines"""
+        # Screen geometry is read once and again only after a resize
+        page, footer_y, max_width = curses.LINES - 6, curses.LINES - 2, curses.COLS - 4
+        version, lines = snapshot()
+        current_line = max(0, len(lines) - page)
+        
+        title = f"Logs: {container_name}"
+        prev_frame, drawn_state = {}, None
+        stdscr.erase()
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, f"Logs: {container_name}")
-            stdscr.addstr(2, 2, "=" * (6 + len(container_name)))
-            
-            display_lines = lines[current_line:current_line + curses.LINES - 6]
-            for i, line in enumerate(display_lines):
-                if i < curses.LINES - 6:
-                    stdscr.addstr(4 + i, 2, line[:curses.COLS - 4])
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Up/Down: Scroll | R: Refresh | Q: Quit")
-            stdscr.refresh()
+            state = (current_line, version)
+            # Keys that changed nothing (unmapped keys, scrolling past an end) skip the frame entirely
+            if state != drawn_state:
+                # y -> (x, text, attr); scrolling by one rewrites only the rows whose text changed
+                frame = {
+                    1: (2, title, curses.A_NORMAL),
+                    2: (2, _hr(len(title)), curses.A_NORMAL),
+                }
+                for y, line in enumerate(lines[current_line:current_line + page], 4):
+                    frame[y] = (2, line[:max_width], curses.A_NORMAL)
+                frame[footer_y] = (2, "Up/Down: Scroll | R: Refresh | Q: Quit", curses.A_NORMAL)
+                
+                self._paint_frame(stdscr, frame, prev_frame)
+                prev_frame = frame
+                self._flush(stdscr)
+                drawn_at = time.monotonic()
+                drawn_state = state
             
             key = stdscr.getch()
             
-            if key == ord('q') or key == ord('Q') or key == 27:
+            if key in VERTICAL_KEYS:
+                # Apply every scroll press queued behind this one, then draw once
+                last_line = max(0, len(lines) - page)
+                for key in [key] + self._drain_keys(stdscr, VERTICAL_KEYS, drawn_at):
+                    if key == curses.KEY_UP:
+                        current_line = max(0, current_line - 1)
+                    else:
+                        current_line = min(last_line, current_line + 1)
+            elif key == ord('q') or key == ord('Q') or key == 27:
                 break
             elif key == ord('r') or key == ord('R'):
-                success, logs = self.manager.docker.get_container_logs(container_name, lines=100)
-                if success:
-                    lines = logs.split('\n')
-                    current_line = max(0, len(lines) - (curses.LINES - 6))
-            elif key == curses.KEY_UP and current_line > 0:
-                current_line -= 1
-            elif key == curses.KEY_DOWN and current_line < len(lines) - (curses.LINES - 6):
-                current_line += 1
+                version, new_lines = snapshot(version)
+                if new_lines is not None:
+                    lines = new_lines
+                current_line = max(0, len(lines) - page)
+            elif key == curses.KEY_RESIZE:
+                curses.update_lines_cols()
+                page, footer_y, max_width = curses.LINES - 6, curses.LINES - 2, curses.COLS - 4
+                stdscr.erase()
+                prev_frame, drawn_state = {}, None
     
     def _docker_start_container(self, stdscr):
         """Start a Docker container"""
-        success, containers = self.manager.docker.list_containers(all_containers=True)
+        success, containers = self._list_containers(all_containers=True)
         
         if not success or not containers:
             self._show_message(stdscr, "Start Container", "No containers found")
@@ -2564,11 +3051,15 @@ class TerminalUI:
         if selection is not None:
             container_name = container_names[selection]
             success, msg = self.manager.docker.start_container(container_name)
-            self._show_message(stdscr, "Start Container", msg, not success)
+            if success:
+                self._invalidate_containers()
+                self._notify(msg)
+            else:
+                self._show_message(stdscr, "Start Container", msg, True)
     
     def _docker_stop_container(self, stdscr):
         """Stop a Docker container"""
-        success, containers = self.manager.docker.list_containers()
+        success, containers = self._list_containers()
         
         if not success or not containers:
             self._show_message(stdscr, "Stop Container", "No running containers found")
@@ -2581,11 +3072,15 @@ class TerminalUI:
             container_name = container_names[selection]
             if self._confirm_action(stdscr, f"Stop container '{container_name}'?"):
                 success, msg = self.manager.docker.stop_container(container_name)
-                self._show_message(stdscr, "Stop Container", msg, not success)
+                if success:
+                    self._invalidate_containers()
+                    self._notify(msg)
+                else:
+                    self._show_message(stdscr, "Stop Container", msg, True)
     
     def _docker_restart_container(self, stdscr):
         """Restart a Docker container"""
-        success, containers = self.manager.docker.list_containers()
+        success, containers = self._list_containers()
         
         if not success or not containers:
             self._show_message(stdscr, "Restart Container", "No running containers found")
@@ -2598,92 +3093,96 @@ class TerminalUI:
             container_name = container_names[selection]
             if self._confirm_action(stdscr, f"Restart container '{container_name}'?"):
                 success, msg = self.manager.docker.restart_container(container_name)
-                self._show_message(stdscr, "Restart Container", msg, not success)
+                if success:
+                    self._invalidate_containers()
+                    self._notify(msg)
+                else:
+                    self._show_message(stdscr, "Restart Container", msg, True)
     
     # ==================== VERSION CONTROL (GIT-LIKE) ====================
     
     def _version_control_menu(self, stdscr):
         """Version control menu - Git-like interface"""
-        menu_items = [
-            "[*] Status & Overview",
-            "[+] Commit Changes",
-            "[=] View History (Log)",
-            "[?] Show Commit Details",
-            "[<] Checkout/Restore",
-            "[~] Manage Branches",
-            "[@] Tag Commit",
-            "[%] Compare (Diff)",
-            "[#] Repository Stats",
-            "Back to Main Menu"
-        ]
+        menu_items = VCS_MENU
+        # One handler per VCS_MENU entry, None for Back
+        handlers = (
+            self._vcs_status,
+            self._vcs_commit,
+            self._vcs_log,
+            self._vcs_show,
+            self._vcs_checkout,
+            self._vcs_branches,
+            self._vcs_tag,
+            self._vcs_diff,
+            self._vcs_stats,
+            None,
+        )
+        
+        # Bind key codes once; they are compared on every keystroke
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
         
         current_selection = 0
+        start_y = 10
+        repaint = True
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, ">> Version Control System (Git-like)", curses.A_BOLD)
-            stdscr.addstr(2, 2, "=" * 40)
-            
-            # Show quick status
-            success, status = self.manager.vcs.status()
-            if success:
-                y = 4
-                stdscr.addstr(y, 2, f"Branch: ", curses.A_BOLD)
-                stdscr.addstr(y, 10, status['branch'], curses.A_REVERSE)
-                y += 1
+            if repaint:
+                stdscr.erase()
+                stdscr.addstr(1, 2, ">> Version Control System (Git-like)", curses.A_BOLD)
+                stdscr.addstr(2, 2, "=" * 40)
                 
-                if status['last_commit']:
-                    stdscr.addstr(y, 2, f"Last Commit: {status['last_commit']} - {status['last_commit_message'][:30]}")
+                # Show quick status
+                success, status = self._cached('vcs_status', VCS_STATUS_TTL, self.manager.vcs.status)
+                if success:
+                    y = 4
+                    self._kv(stdscr, y, 2, "Branch: ", status['branch'], curses.A_REVERSE)
+                    y += 1
+                    
+                    if status['last_commit']:
+                        stdscr.addstr(y, 2, f"Last Commit: {status['last_commit']} - {status['last_commit_message'][:30]}")
+                        y += 1
+                    
+                    if status['has_uncommitted_changes']:
+                        stdscr.addstr(y, 2, "[!] Uncommitted changes detected", curses.A_BOLD)
+                    else:
+                        stdscr.addstr(y, 2, "[OK] Working tree clean", curses.A_DIM)
                     y += 1
+                    
+                    stdscr.addstr(y, 2, f"Total Commits: {status['total_commits']} | Domains: {status['domains_count']}")
                 
-                if status['has_uncommitted_changes']:
-                    stdscr.addstr(y, 2, "[!] Uncommitted changes detected", curses.A_BOLD)
-                else:
-                    stdscr.addstr(y, 2, "[OK] Working tree clean", curses.A_DIM)
-                y += 1
+                # Draw menu
+                for i, item in enumerate(menu_items):
+                    if i == current_selection:
+                        stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
+                    else:
+                        stdscr.addstr(start_y + i, 4, f"  {item}")
                 
-                stdscr.addstr(y, 2, f"Total Commits: {status['total_commits']} | Domains: {status['domains_count']}")
-            
-            # Draw menu
-            start_y = 10
-            for i, item in enumerate(menu_items):
-                if i == current_selection:
-                    stdscr.addstr(start_y + i, 4, f"> {item}", curses.A_REVERSE)
-                else:
-                    stdscr.addstr(start_y + i, 4, f"  {item}")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Up/Down: Navigate | Enter: Select | ESC: Back")
-            stdscr.refresh()
+                stdscr.addstr(curses.LINES - 2, 2, "Up/Down: Navigate | Enter: Select | ESC: Back")
+                repaint = False
+            self._flush(stdscr)
             
             key = stdscr.getch()
             
-            if key == curses.KEY_UP and current_selection > 0:
+            if key == key_up and current_selection > 0:
                 current_selection -= 1
-            elif key == curses.KEY_DOWN and current_selection < len(menu_items) - 1:
+                self._draw_menu_selection(stdscr, menu_items, current_selection + 1, current_selection, start_y)
+            elif key == key_down and current_selection < len(menu_items) - 1:
                 current_selection += 1
+                self._draw_menu_selection(stdscr, menu_items, current_selection - 1, current_selection, start_y)
             elif key == ord('\n') or key == ord(' '):
-                if current_selection == 0:  # Status
-                    self._vcs_status(stdscr)
-                elif current_selection == 1:  # Commit
-                    self._vcs_commit(stdscr)
-                elif current_selection == 2:  # Log
-                    self._vcs_log(stdscr)
-                elif current_selection == 3:  # Show
-                    self._vcs_show(stdscr)
-                elif current_selection == 4:  # Checkout
-                    self._vcs_checkout(stdscr)
-                elif current_selection == 5:  # Branches
-                    self._vcs_branches(stdscr)
-                elif current_selection == 6:  # Tag
-                    self._vcs_tag(stdscr)
-                elif current_selection == 7:  # Diff
-                    self._vcs_diff(stdscr)
-                elif current_selection == 8:  # Stats
-                    self._vcs_stats(stdscr)
-                elif current_selection == 9:  # Back
+                # Every action takes over the screen
+                repaint = True
+                handler = handlers[current_selection]
+                if handler is None:  # Back
                     break
+                handler(stdscr)
+                # Any action may have moved the branch or head
+                self._invalidate_cached('vcs_status')
             elif key == 27:  # ESC
                 break
+            elif key == key_resize:
+                curses.update_lines_cols()
+                repaint = True
     
     def _vcs_status(self, stdscr):
         """Show detailed VCS status"""
@@ -2698,8 +3197,7 @@ class TerminalUI:
             return
         
         y = 4
-        stdscr.addstr(y, 2, f"Current Branch: ", curses.A_BOLD)
-        stdscr.addstr(y, 18, status['branch'], curses.A_REVERSE)
+        self._kv(stdscr, y, 2, "Current Branch: ", status['branch'], curses.A_REVERSE)
         y += 2
         
         if status['last_commit']:
@@ -2763,7 +3261,7 @@ class TerminalUI:
         tags_str = self._get_input(stdscr, "Tags (comma-separated, optional)", 6, 2, "")
         if tags_str is None:
             tags_str = ""
-        tags = [t.strip() for t in tags_str.split(',') if t.strip()]
+        tags = [t for t in _LIST_SEP.split(tags_str.strip()) if t]
         
         # Get author (optional)
         author = self._get_input(stdscr, "Author (optional)", 7, 2, "admin")
@@ -2819,103 +3317,142 @@ class TerminalUI:
         except ValueError:
             limit = 10
         
-        commits = self.manager.vcs.log(limit=limit)
+        total = self.manager.vcs.count_commits()
+        if limit > 0:
+            total = min(limit, total)
         
-        if not commits:
+        if not total:
             self._show_message(stdscr, "Log", "No commits yet")
             return
         
-        current_commit = 0
+        def load_page(page: int):
+            # Positions run oldest-first through the last `total` commits; log() offsets count from the newest
+            end = min(total, (page + 1) * COMMIT_PAGE_SIZE)
+            return self.manager.vcs.log(limit=end - page * COMMIT_PAGE_SIZE, offset=total - end)
         
-        while True:
-            stdscr.clear()
-            stdscr.addstr(1, 2, f"[=] Commit History ({current_commit + 1}/{len(commits)})", curses.A_BOLD)
-            stdscr.addstr(2, 2, "=" * 50)
-            
-            commit = commits[current_commit]
-            
-            y = 4
-            stdscr.addstr(y, 2, f"Commit: ", curses.A_BOLD)
-            stdscr.addstr(y, 10, commit.short_hash(), curses.A_REVERSE)
-            y += 1
-            
-            if commit.tags:
-                stdscr.addstr(y, 2, f"Tags: ", curses.A_BOLD)
-                stdscr.addstr(y, 8, ", ".join(commit.tags), curses.A_DIM)
-                y += 1
-            
-            stdscr.addstr(y, 2, f"Author: {commit.author}")
-            y += 1
-            stdscr.addstr(y, 2, f"Date: {commit.timestamp[:19]}")
-            y += 2
-            
-            stdscr.addstr(y, 2, f"Message:", curses.A_BOLD)
-            y += 1
-            # Wrap message
-            message_lines = []
-            words = commit.message.split()
-            current_line = ""
-            for word in words:
-                if len(current_line + word) < curses.COLS - 8:
-                    current_line += word + " "
-                else:
-                    message_lines.append(current_line)
-                    current_line = word + " "
-            if current_line:
-                message_lines.append(current_line)
-            
-            for line in message_lines:
-                stdscr.addstr(y, 4, line)
-                y += 1
-            
-            if commit.description:
-                y += 1
-                stdscr.addstr(y, 2, f"Description:", curses.A_BOLD)
-                y += 1
-                stdscr.addstr(y, 4, commit.description[:curses.COLS - 8])
-                y += 1
-            
-            y += 1
-            stdscr.addstr(y, 2, f"Changes:", curses.A_BOLD)
-            y += 1
-            stats = commit.stats
-            stdscr.addstr(y, 4, f"+{stats.get('domains_added', 0)} domains added, "
-                                f"-{stats.get('domains_removed', 0)} removed, "
-                                f"~{stats.get('domains_modified', 0)} modified")
-            y += 1
-            stdscr.addstr(y, 4, f"{stats.get('configs_changed', 0)} configs changed")
-            
-            if commit.files_changed:
-                y += 2
-                stdscr.addstr(y, 2, f"Files:", curses.A_BOLD)
-                y += 1
-                for i, file in enumerate(commit.files_changed[:5]):
-                    stdscr.addstr(y, 4, f"- {file}")
+        current_commit = 0
+        # Screen geometry is read once and again only after a resize
+        wrap_width, footer_y = curses.COLS - 8, curses.LINES - 2
+        prev_frame, drawn_state = {}, None
+        # index -> (wrapped message lines, shortened description) at the current width
+        wrapped = {}
+        # page number -> Future for its commits, so only pages that are visited get loaded
+        pages = {}
+        stdscr.erase()
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            while True:
+                state = current_commit
+                # Keys that changed nothing (unmapped keys, scrolling past an end) skip the frame entirely
+                if state != drawn_state:
+                    page, index = divmod(current_commit, COMMIT_PAGE_SIZE)
+                    if page not in pages:
+                        pages[page] = pool.submit(load_page, page)
+                    commit = pages[page].result()[index]
+                    # Have the next page ready by the time Right reaches it
+                    if page + 1 not in pages and (page + 1) * COMMIT_PAGE_SIZE < total:
+                        pages[page + 1] = pool.submit(load_page, page + 1)
+                    
+                    text = wrapped.get(current_commit)
+                    if text is None:
+                        text = wrapped[current_commit] = (
+                            textwrap.wrap(commit.message, wrap_width),
+                            textwrap.shorten(commit.description, wrap_width, placeholder="...") if commit.description else "",
+                        )
+                    message_lines, description = text
+                    
+                    # y -> (x, text, attr[, text, attr]); rows shared between commits are left alone
+                    frame = {
+                        1: (2, f"[=] Commit History ({current_commit + 1}/{total})", curses.A_BOLD),
+                        2: (2, "=" * 50, curses.A_NORMAL),
+                    }
+                    
+                    y = 4
+                    frame[y] = (2, "Commit: ", curses.A_BOLD, commit.short_hash(), curses.A_REVERSE)
                     y += 1
-                if len(commit.files_changed) > 5:
-                    stdscr.addstr(y, 4, f"... and {len(commit.files_changed) - 5} more")
-            
-            stdscr.addstr(curses.LINES - 2, 2, "Left/Right: Navigate | C: Checkout | D: Diff | ESC: Back")
-            stdscr.refresh()
-            
-            key = stdscr.getch()
-            
-            if key == curses.KEY_LEFT and current_commit > 0:
-                current_commit -= 1
-            elif key == curses.KEY_RIGHT and current_commit < len(commits) - 1:
-                current_commit += 1
-            elif key == ord('c') or key == ord('C'):
-                if self._confirm_action(stdscr, f"Checkout commit {commits[current_commit].short_hash()}?\n\nThis will restore your configuration."):
-                    success, msg = self.manager.vcs.checkout(commits[current_commit].hash)
-                    self._show_message(stdscr, "Checkout", msg, not success)
+                    
+                    if commit.tags:
+                        frame[y] = (2, "Tags: ", curses.A_BOLD, ", ".join(commit.tags), curses.A_DIM)
+                        y += 1
+                    
+                    frame[y] = (2, f"Author: {commit.author}", curses.A_NORMAL)
+                    y += 1
+                    frame[y] = (2, f"Date: {commit.timestamp[:19]}", curses.A_NORMAL)
+                    y += 2
+                    
+                    frame[y] = (2, "Message:", curses.A_BOLD)
+                    y += 1
+                    for line in message_lines:
+                        frame[y] = (4, line, curses.A_NORMAL)
+                        y += 1
+                    
+                    if description:
+                        y += 1
+                        frame[y] = (2, "Description:", curses.A_BOLD)
+                        y += 1
+                        frame[y] = (4, description, curses.A_NORMAL)
+                        y += 1
+                    
+                    y += 1
+                    frame[y] = (2, "Changes:", curses.A_BOLD)
+                    y += 1
+                    stats = commit.stats
+                    frame[y] = (4, f"+{stats.get('domains_added', 0)} domains added, "
+                                   f"-{stats.get('domains_removed', 0)} removed, "
+                                   f"~{stats.get('domains_modified', 0)} modified", curses.A_NORMAL)
+                    y += 1
+                    frame[y] = (4, f"{stats.get('configs_changed', 0)} configs changed", curses.A_NORMAL)
+                    
+                    if commit.files_changed:
+                        y += 2
+                        frame[y] = (2, "Files:", curses.A_BOLD)
+                        y += 1
+                        for file in commit.files_changed[:5]:
+                            frame[y] = (4, f"- {file}", curses.A_NORMAL)
+                            y += 1
+                        if len(commit.files_changed) > 5:
+                            frame[y] = (4, f"... and {len(commit.files_changed) - 5} more", curses.A_NORMAL)
+                    
+                    frame[footer_y] = (2, "Left/Right: Navigate | C: Checkout | D: Diff | ESC: Back", curses.A_NORMAL)
+                    
+                    self._paint_frame(stdscr, frame, prev_frame)
+                    prev_frame = frame
+                    self._flush(stdscr)
+                    drawn_at = time.monotonic()
+                    drawn_state = state
+                
+                key = stdscr.getch()
+                
+                if key in HORIZONTAL_KEYS:
+                    # Apply every arrow press queued behind this one, then draw once
+                    for key in [key] + self._drain_keys(stdscr, HORIZONTAL_KEYS, drawn_at):
+                        if key == curses.KEY_LEFT:
+                            current_commit = max(0, current_commit - 1)
+                        else:
+                            current_commit = min(total - 1, current_commit + 1)
+                elif key == ord('c') or key == ord('C'):
+                    if self._confirm_action(stdscr, f"Checkout commit {commit.short_hash()}?\n\nThis will restore your configuration."):
+                        success, msg = self.manager.vcs.checkout(commit.hash)
+                        self._show_message(stdscr, "Checkout", msg, not success)
+                        if success:
+                            break
+                    # The dialogs drew over the history; repaint it in full
+                    stdscr.erase()
+                    prev_frame, drawn_state = {}, None
+                elif key == ord('d') or key == ord('D'):
+                    success, diff_text = self.manager.vcs.diff(commit.hash)
                     if success:
-                        break
-            elif key == ord('d') or key == ord('D'):
-                success, diff_text = self.manager.vcs.diff(commits[current_commit].hash)
-                if success:
-                    self._show_text_viewer(stdscr, "Diff", diff_text)
-            elif key == 27 or key == ord('q'):
-                break
+                        self._show_text_viewer(stdscr, "Diff", diff_text)
+                    stdscr.erase()
+                    prev_frame, drawn_state = {}, None
+                elif key == 27 or key == ord('q'):
+                    break
+                elif key == curses.KEY_RESIZE:
+                    curses.update_lines_cols()
+                    wrap_width, footer_y = curses.COLS - 8, curses.LINES - 2
+                    stdscr.erase()
+                    prev_frame, drawn_state = {}, None
+                    wrapped.clear()
     
     def _vcs_show(self, stdscr):
         """Show commit details"""
@@ -3001,8 +3538,7 @@ class TerminalUI:
             
             # Show current branch
             current_branch = self.manager.vcs._get_current_branch()
-            stdscr.addstr(4, 2, f"Current Branch: ", curses.A_BOLD)
-            stdscr.addstr(4, 18, current_branch, curses.A_REVERSE)
+            self._kv(stdscr, 4, 2, "Current Branch: ", current_branch, curses.A_REVERSE)
             
             # Draw menu
             start_y = 6
@@ -3163,7 +3699,7 @@ class TerminalUI:
         
         stdscr.clear()
         stdscr.addstr(1, 2, f"Tag Commit {commit.short_hash()}", curses.A_BOLD)
-        stdscr.addstr(2, 2, "=" * (11 + len(commit.short_hash())))
+        stdscr.addstr(2, 2, _hr(11 + len(commit.short_hash())))
         
         tag_name = self._get_input(stdscr, "Tag name (e.g., v1.0, prod-2025)", 4, 2)
         if tag_name is None or not tag_name.strip():
@@ -3208,12 +3744,20 @@ class TerminalUI:
         stdscr.addstr(1, 2, "Calculating diff...", curses.A_BOLD)
         stdscr.refresh()
         
-        success, diff_text = self.manager.vcs.diff(commit1_hash, commit2_hash)
+        try:
+            diff_text = self._cached_diff(commit1_hash, commit2_hash)
+        except ValueError as e:
+            self._show_message(stdscr, "Error", str(e), True)
+            return
         
-        if success:
-            self._show_text_viewer(stdscr, "Diff", diff_text)
-        else:
-            self._show_message(stdscr, "Error", diff_text, True)
+        self._show_text_viewer(stdscr, "Diff", diff_text)
+    
+    def _diff_commits(self, commit1: str, commit2: Optional[str]) -> str:
+        """Diff text between two commits, raising ValueError if either is missing"""
+        success, diff_text = self.manager.vcs.diff(commit1, commit2)
+        if not success:
+            raise ValueError(diff_text)
+        return diff_text
     
     def _vcs_stats(self, stdscr):
         """Show repository statistics"""
@@ -3257,31 +3801,43 @@ class TerminalUI:
         lines = text.split('\n')
         current_line = 0
         
+        def clip(width):
+            # Copy only the lines that are actually too wide, once per width
+            return [line[:width] if len(line) > width else line for line in lines]
+        
+        truncated = clip(curses.COLS - 4)
+        # Screen size and key codes as locals; only a resize changes them
+        page, footer_y = curses.LINES - 6, curses.LINES - 2
+        key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
+        key_ppage, key_npage = curses.KEY_PPAGE, curses.KEY_NPAGE
+        
         while True:
             stdscr.clear()
             stdscr.addstr(1, 2, title, curses.A_BOLD)
-            stdscr.addstr(2, 2, "=" * len(title))
+            stdscr.addstr(2, 2, _hr(len(title)))
             
             # Display lines
-            display_lines = lines[current_line:current_line + curses.LINES - 6]
+            display_lines = truncated[current_line:current_line + page]
             for i, line in enumerate(display_lines):
-                if i < curses.LINES - 6:
-                    display_line = line[:curses.COLS - 4] if len(line) > curses.COLS - 4 else line
-                    stdscr.addstr(4 + i, 2, display_line)
+                stdscr.addstr(4 + i, 2, line)
             
-            stdscr.addstr(curses.LINES - 2, 2, f"Line {current_line + 1}/{len(lines)} | Up/Down: Scroll | PgUp/PgDn: Page | Q/ESC: Back")
+            stdscr.addstr(footer_y, 2, f"Line {current_line + 1}/{len(lines)} | Up/Down: Scroll | PgUp/PgDn: Page | Q/ESC: Back")
             stdscr.refresh()
             
             key = stdscr.getch()
             
             if key == ord('q') or key == ord('Q') or key == 27:
                 break
-            elif key == curses.KEY_UP and current_line > 0:
+            elif key == key_up and current_line > 0:
                 current_line -= 1
-            elif key == curses.KEY_DOWN and current_line < len(lines) - (curses.LINES - 6):
+            elif key == key_down and current_line < len(lines) - page:
                 current_line += 1
-            elif key == curses.KEY_PPAGE:  # Page Up
-                current_line = max(0, current_line - (curses.LINES - 6))
-            elif key == curses.KEY_NPAGE:  # Page Down
-                current_line = min(len(lines) - (curses.LINES - 6), current_line + (curses.LINES - 6))
+            elif key == key_ppage:  # Page Up
+                current_line = max(0, current_line - page)
+            elif key == key_npage:  # Page Down
+                current_line = min(len(lines) - page, current_line + page)
                 current_line = max(0, current_line)
+            elif key == key_resize:
+                curses.update_lines_cols()
+                truncated = clip(curses.COLS - 4)
+                page, footer_y = curses.LINES - 6, curses.LINES - 2
@@ -1,3 +1,5 @@
+import functools
+import hashlib
 import logging
 import os
 from pathlib import Path
@@ -16,6 +18,10 @@ TEMPLATES_DIR = MANAGER_DIR / "templates"
 DATA_FILE = MANAGER_DIR / "domains.json"
 CONFIG_FILE = MANAGER_DIR / "config.json"
 LOG_FILE = MANAGER_DIR / "manager.log"
+CACHE_DIR = MANAGER_DIR / "cache"
+
+# Once a disk_memo namespace grows past this, it is trimmed back to the most recently used entries
+DISK_MEMO_MAX_BYTES = 8 * 1024 * 1024
 
 def setup_logging():
     """Setup logging configuration"""
@@ -33,3 +39,81 @@ def setup_logging():
 
 def get_logger(name: str):
     return logging.getLogger(name)
+
+def disk_memo(namespace: str, max_bytes: int = DISK_MEMO_MAX_BYTES):
+    """
+    Persist a function's string results under CACHE_DIR/<namespace>
+    
+    Only use this for results that can never change for the same arguments.
+    Calls with a None argument, results that are not strings and any
+    exception are passed through without touching the cache.
+    """
+    def decorator(fn):
+        cache_dir = CACHE_DIR / namespace
+        # Bytes under cache_dir: counted on the first write, then kept up to date so
+        # the directory is only scanned again when it has to be trimmed
+        used = [None]
+        
+        @functools.wraps(fn)
+        def wrapper(*args):
+            if any(arg is None for arg in args):
+                return fn(*args)
+            
+            key = hashlib.blake2b(repr(args).encode(), digest_size=16).hexdigest()
+            path = cache_dir / f"{key}.txt"
+            try:
+                result = path.read_text()
+                os.utime(path)  # mtime doubles as the last-access time for trimming
+                return result
+            except OSError:
+                pass
+            
+            result = fn(*args)
+            if isinstance(result, str):
+                try:
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                    tmp.write_text(result)
+                    size = tmp.stat().st_size
+                    os.replace(tmp, path)
+                    if used[0] is None:
+                        used[0] = sum(entry[1] for entry in _disk_memo_entries(cache_dir))
+                    else:
+                        used[0] += size
+                    if used[0] > max_bytes:
+                        used[0] = _trim_disk_memo(cache_dir, max_bytes)
+                except OSError as e:
+                    get_logger(__name__).debug(f"Could not cache {namespace} result: {e}")
+            return result
+        
+        return wrapper
+    return decorator
+
+def _disk_memo_entries(cache_dir: Path) -> list:
+    """(mtime, size, path) for each entry in a disk_memo namespace"""
+    entries = []
+    for path in cache_dir.glob("*.txt"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    return entries
+
+def _trim_disk_memo(cache_dir: Path, max_bytes: int) -> int:
+    """Drop least recently used entries until cache_dir fits in max_bytes; returns the bytes left"""
+    entries = _disk_memo_entries(cache_dir)
+    total = sum(entry[1] for entry in entries)
+    if total <= max_bytes:
+        return total
+    
+    # Trim to half the budget so the next trim is many writes away
+    for _, size, path in sorted(entries):
+        if total <= max_bytes // 2:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
+    return total
@@ -76,6 +76,9 @@ class VersionControl:
         self.branches_file = self.vcs_dir / "branches.json"
         self.head_file = self.vcs_dir / "HEAD"
         
+        # file -> ((mtime_ns, size), parsed list), see _load_cached
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], list]] = {}
+        
         self._init_repository()
     
     def _init_repository(self):
@@ -124,8 +127,26 @@ class VersionControl:
         with open(self.head_file, 'w') as f:
             f.write(branch_name)
     
+    def _load_cached(self, path: Path, load) -> list:
+        """Return load()'s list for path, parsing the file again only after it changed"""
+        try:
+            st = path.stat()
+        except OSError:
+            return load()
+        key = (st.st_mtime_ns, st.st_size)
+        
+        cached = self._file_cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = self._file_cache[path] = (key, load())
+        # A new list each time, so callers can append or filter before saving
+        return list(cached[1])
+    
     def _load_commits(self) -> List[Commit]:
         """Load all commits"""
+        return self._load_cached(self.commits_file, self._read_commits)
+    
+    def _read_commits(self) -> List[Commit]:
+        """Parse commits.json"""
         try:
             with open(self.commits_file, 'r') as f:
                 data = json.load(f)
@@ -136,6 +157,8 @@ class VersionControl:
     
     def _save_commits(self, commits: List[Commit]):
         """Save commits to file"""
+        # Rewrites inside the mtime granularity keep the same stat key, so never trust it after a save
+        self._file_cache.pop(self.commits_file, None)
         try:
             with open(self.commits_file, 'w') as f:
                 json.dump([c.to_dict() for c in commits], f, indent=2)
@@ -144,6 +167,10 @@ class VersionControl:
     
     def _load_branches(self) -> List[Branch]:
         """Load all branches"""
+        return self._load_cached(self.branches_file, self._read_branches)
+    
+    def _read_branches(self) -> List[Branch]:
+        """Parse branches.json"""
         try:
             with open(self.branches_file, 'r') as f:
                 data = json.load(f)
@@ -154,6 +181,7 @@ class VersionControl:
     
     def _save_branches(self, branches: List[Branch]):
         """Save branches to file"""
+        self._file_cache.pop(self.branches_file, None)
         try:
             with open(self.branches_file, 'w') as f:
                 json.dump([b.to_dict() for b in branches], f, indent=2)
@@ -316,13 +344,14 @@ class VersionControl:
             with tarfile.open(archive_path, 'w:gz') as tar:
                 tar.add(temp_path, arcname='backup')
     
-    def log(self, limit: int = 10, branch: str = None) -> List[Commit]:
+    def log(self, limit: int = 10, branch: str = None, offset: int = 0) -> List[Commit]:
         """
         Get commit history (like git log)
         
         Args:
             limit: Maximum number of commits to return
             branch: Specific branch (None for current)
+            offset: Number of most recent commits to skip
         
         Returns:
             List of commits
@@ -347,7 +376,14 @@ class VersionControl:
                         break
                 commits = list(reversed(filtered))
         
-        return commits[-limit:] if limit else commits
+        end = len(commits) - offset
+        if end <= 0:
+            return []
+        return commits[max(0, end - limit):end] if limit else commits[:end]
+    
+    def count_commits(self) -> int:
+        """Number of commits in the repository"""
+        return len(self._load_commits())
     
     def show(self, commit_hash: str) -> Tuple[bool, Optional[Commit], Optional[str]]:
         """
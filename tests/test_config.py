@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from vps_manager.config import ConfigManager
+
+class TestConfigManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_manager = ConfigManager()
+        self.config_manager.config_file = Path(self.tmp.name) / "config.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batch_defers_save(self):
+        """Test that saves inside a batch are written once on exit"""
+        with self.config_manager.batch() as result:
+            self.config_manager.config.firewall.enabled = True
+            self.assertTrue(self.config_manager.save())
+            with self.config_manager.batch():
+                self.config_manager.save()
+            self.assertFalse(self.config_manager.config_file.exists())
+        self.assertTrue(result.saved)
+        self.assertTrue(self.config_manager.config_file.exists())
+        self.assertTrue(self.config_manager.load().firewall.enabled)
+
+    def test_batch_reports_failed_save(self):
+        """Test that a deferred write that fails is reported by the batch"""
+        blocker = Path(self.tmp.name) / "file"
+        blocker.write_text("")
+        self.config_manager.config_file = blocker / "config.json"
+        with self.config_manager.batch() as result:
+            self.assertTrue(self.config_manager.save())
+        self.assertFalse(result.saved)
+
+        with self.config_manager.batch() as result:
+            pass
+        self.assertIsNone(result.saved)
+
+if __name__ == '__main__':
+    unittest.main()
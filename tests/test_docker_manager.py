@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import socket
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from vps_manager.docker_manager import DockerManager
+
+class TestDockerManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = MagicMock()
+        self.docker = DockerManager(self.manager)
+
+    @patch('vps_manager.docker_manager._UnixHTTPConnection')
+    def test_action_timeout_not_repeated(self, connection):
+        """Test that a timed-out stop is reported once, without a retry or the CLI"""
+        connection.return_value.getresponse.side_effect = socket.timeout("timed out")
+        success, msg = self.docker.stop_container("web")
+        self.assertFalse(success)
+        self.assertIn("timed out", msg)
+        self.assertEqual(connection.return_value.request.call_count, 1)
+        self.manager.run_command.assert_not_called()
+        self.assertTrue(self.docker._api_usable)
+
+    @patch('vps_manager.docker_manager._UnixHTTPConnection')
+    def test_get_retried_on_stale_connection(self, connection):
+        """Test that a GET is sent again once after the daemon dropped the connection"""
+        response = MagicMock(status=200)
+        response.read.return_value = b'{"Version": "24.0"}'
+        connection.return_value.getresponse.side_effect = [ConnectionResetError(), response]
+        self.assertEqual(self.docker._request("GET", "/version"), (200, {"Version": "24.0"}))
+        self.assertEqual(connection.return_value.request.call_count, 2)
+
+    @patch('vps_manager.docker_manager._UnixHTTPConnection')
+    def test_missing_socket_uses_cli(self, connection):
+        """Test that an absent socket switches to the CLI for the rest of the session"""
+        connection.return_value.request.side_effect = FileNotFoundError()
+        self.manager.run_command.return_value = (True, "web")
+        self.assertTrue(self.docker.restart_container("web")[0])
+        self.manager.run_command.assert_called_once_with("docker restart web")
+        self.assertFalse(self.docker._api_usable)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from vps_manager.security import SecurityScanner, SecurityIssue, PROBE_MARKER, PROBE_COMMANDS, SEVERITY_ORDER
+
+class TestSecurityScanner(unittest.TestCase):
+    def setUp(self):
+        self.manager = MagicMock()
+        self.manager.domains = []
+        self.scanner = SecurityScanner(self.manager)
+
+    def test_collect_probes(self):
+        """Test splitting of the batched probe output"""
+        self.manager.run_command.return_value = (True, "\n".join([
+            f"{PROBE_MARKER} ufw",
+            "Status: inactive",
+            f"{PROBE_MARKER} rc 0",
+            f"{PROBE_MARKER} nginx_v",
+            f"{PROBE_MARKER} rc 127",
+        ]))
+        probes = self.scanner._collect_probes()
+        self.assertEqual(probes["ufw"], (True, "Status: inactive"))
+        self.assertEqual(probes["nginx_v"], (False, ""))
+
+    def test_scan_all_single_command(self):
+        """Test that scan_all issues one batched command"""
+        lines = []
+        for name in PROBE_COMMANDS:
+            lines.append(f"{PROBE_MARKER} {name}")
+            if name == "ufw":
+                lines.append("Status: inactive")
+            lines.append(f"{PROBE_MARKER} rc 0")
+        self.manager.run_command.return_value = (True, "\n".join(lines))
+        issues = self.scanner.scan_all()
+        self.assertEqual(self.manager.run_command.call_count, 1)
+        self.assertIn("Firewall Disabled", [i.title for i in issues])
+
+    @patch('vps_manager.security.x509', None)
+    def test_cert_expiry_cached_by_mtime(self):
+        """Test that certificate dates are only parsed again after a change"""
+        self.manager.run_command.return_value = (True, "notAfter=Jan  1 00:00:00 2030 GMT\n")
+        with tempfile.TemporaryDirectory() as tmp:
+            cert_path = Path(tmp) / "cert.pem"
+            cert_path.write_text("cert")
+            first = self.scanner._get_cert_expiry(cert_path)
+            second = self.scanner._get_cert_expiry(cert_path)
+            self.assertEqual(first, second)
+            self.assertEqual(first.year, 2030)
+            self.assertEqual(self.manager.run_command.call_count, 1)
+
+            os.utime(cert_path, (0, 0))
+            self.scanner._get_cert_expiry(cert_path)
+            self.assertEqual(self.manager.run_command.call_count, 2)
+
+    def test_security_score(self):
+        """Test severity-weighted scoring and grouping"""
+        self.assertEqual(self.scanner.get_security_score(), 100)
+        self.scanner.issues = [
+            SecurityIssue("a", "", SecurityIssue.SEVERITY_CRITICAL, ""),
+            SecurityIssue("b", "", SecurityIssue.SEVERITY_LOW, ""),
+            SecurityIssue("c", "", SecurityIssue.SEVERITY_LOW, ""),
+        ]
+        self.assertEqual(self.scanner.get_security_score(), 76)
+
+        grouped = self.scanner.get_issues_by_severity()
+        self.assertEqual(len(grouped[SecurityIssue.SEVERITY_LOW]), 2)
+        self.assertEqual(grouped[SecurityIssue.SEVERITY_HIGH], [])
+
+    def test_issues_by_severity_follows_changes(self):
+        """Test that each caller gets its own grouping, rebuilt when the issues change"""
+        self.scanner.issues = [SecurityIssue("a", "", SecurityIssue.SEVERITY_LOW, "")]
+        grouped = self.scanner.get_issues_by_severity()
+        grouped[SecurityIssue.SEVERITY_LOW].clear()
+        self.assertEqual(len(self.scanner.get_issues_by_severity()[SecurityIssue.SEVERITY_LOW]), 1)
+
+        self.scanner.issues.append(SecurityIssue("b", "", SecurityIssue.SEVERITY_LOW, ""))
+        self.assertEqual(len(self.scanner.get_issues_by_severity()[SecurityIssue.SEVERITY_LOW]), 2)
+
+        # Same length, replaced in place
+        self.scanner.issues[0] = SecurityIssue("c", "", SecurityIssue.SEVERITY_HIGH, "")
+        grouped = self.scanner.get_issues_by_severity()
+        self.assertEqual(len(grouped[SecurityIssue.SEVERITY_HIGH]), 1)
+        self.assertEqual(set(grouped), set(SEVERITY_ORDER))
+
+if __name__ == '__main__':
+    unittest.main()
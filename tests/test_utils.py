@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from vps_manager import utils
+from vps_manager.utils import disk_memo
+
+class TestDiskMemo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch('vps_manager.utils.CACHE_DIR', Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_persist_across_wrappers(self):
+        """Test that a second decorated copy reads the first one's result from disk"""
+        fn = MagicMock(side_effect=lambda a, b: f"{a}..{b}")
+        self.assertEqual(disk_memo("diff")(fn)("a", "b"), "a..b")
+        self.assertEqual(disk_memo("diff")(fn)("a", "b"), "a..b")
+        self.assertEqual(fn.call_count, 1)
+
+        # None arguments and exceptions never reach the cache
+        disk_memo("diff")(fn)("a", None)
+        disk_memo("diff")(fn)("a", None)
+        self.assertEqual(fn.call_count, 3)
+        failing = disk_memo("diff")(MagicMock(side_effect=ValueError("missing")))
+        self.assertRaises(ValueError, failing, "x", "y")
+        self.assertEqual(len(list((Path(self.tmp.name) / "diff").iterdir())), 1)
+
+    def test_trims_least_recently_used(self):
+        """Test that the namespace is trimmed back once it outgrows its budget"""
+        memo = disk_memo("diff", max_bytes=250)(lambda n: "x" * 100)
+        cache_dir = Path(self.tmp.name) / "diff"
+        memo(1)
+        memo(2)
+        for i, path in enumerate(sorted(cache_dir.iterdir(), key=lambda p: p.stat().st_mtime)):
+            os.utime(path, (i, i))
+        with patch('vps_manager.utils._disk_memo_entries', wraps=utils._disk_memo_entries) as scan:
+            memo(3)
+            self.assertEqual(scan.call_count, 1)
+        self.assertEqual(len(list(cache_dir.iterdir())), 1)
+        self.assertEqual(memo(3), "x" * 100)
+
+    def test_size_tracked_without_rescans(self):
+        """Test that writes under budget scan the directory only once"""
+        memo = disk_memo("diff")(lambda n: str(n))
+        with patch('vps_manager.utils._disk_memo_entries', wraps=utils._disk_memo_entries) as scan:
+            for n in range(5):
+                memo(n)
+            self.assertEqual(scan.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from vps_manager.version_control import VersionControl, Commit
+
+class TestVersionControl(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with patch('vps_manager.version_control.MANAGER_DIR', Path(self.tmp.name)):
+            self.vcs = VersionControl(MagicMock())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_commits_cached_until_file_changes(self):
+        """Test that commits.json is parsed again only after a write"""
+        with patch.object(self.vcs, '_read_commits', wraps=self.vcs._read_commits) as read:
+            self.vcs._load_commits().append("not saved")
+            self.assertEqual(self.vcs._load_commits(), [])
+            self.assertEqual(read.call_count, 1)
+
+            commit = Commit("abc123", "2024-01-01T00:00:00", "admin", "msg", "", [], None, [], {}, {}, {})
+            self.vcs._save_commits([commit])
+            self.assertEqual([c.hash for c in self.vcs._load_commits()], ["abc123"])
+            self.assertEqual(read.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()